@@ -1,4 +1,3 @@
-import operator
 import os
 
 import pandas as pd
@@ -70,26 +69,13 @@ class TopNMomentumAlphaModel(AlphaModel):
             Ordered list of highest performing momentum assets
             restricted to the 'Top N'.
         """
-        assets = self.signals['momentum'].assets
-        
         # Calculate the holding-period return momenta for each asset,
-        # for the particular provided momentum lookback period
-        all_momenta = {
-            asset: self.signals['momentum'](
-                asset, self.mom_lookback
-            ) for asset in assets
-        }
-
-        # Obtain a list of the top performing assets by momentum
-        # restricted by the provided number of desired assets to
-        # trade per month
-        return [
-            asset[0] for asset in sorted(
-                all_momenta.items(),
-                key=operator.itemgetter(1),
-                reverse=True
-            )
-        ][:self.mom_top_n]
+        # for the particular provided momentum lookback period, and
+        # obtain the top performing assets by momentum restricted by
+        # the provided number of desired assets to trade per month
+        return self.signals.top_n(
+            'momentum', self.mom_lookback, self.mom_top_n
+        )
 
     def _generate_signals(
         self, dt, weights
@@ -1,4 +1,7 @@
 from abc import ABCMeta, abstractmethod
+import numbers
+
+import numpy as np
 
 
 class Broker(object):
@@ -94,8 +97,54 @@ class Broker(object):
             "Should implement get_portfolio_as_dict()"
         )
 
+    def get_portfolio_quantities(self, portfolio_id):
+        """
+        Return the net quantity of each Asset held within the
+        sub-portfolio with ID 'portfolio_id', as a vector aligned
+        to the list of Asset symbol strings. Brokers able to
+        provide the quantities without constructing the portfolio
+        dictionary should override this.
+
+        Parameters
+        ----------
+        portfolio_id : `str`
+            The portfolio ID string.
+
+        Returns
+        -------
+        `tuple(list[str], np.ndarray, np.ndarray)`
+            The asset symbols, their net quantities and whether
+            each net quantity is an integer.
+        """
+        portfolio = self.get_portfolio_as_dict(portfolio_id)
+        quantities = [holding["quantity"] for holding in portfolio.values()]
+        return (
+            list(portfolio.keys()),
+            np.array(quantities, dtype=np.float64),
+            np.array(
+                [isinstance(quantity, numbers.Integral) for quantity in quantities],
+                dtype=bool
+            )
+        )
+
     @abstractmethod
     def submit_order(self, portfolio_id, order):
         raise NotImplementedError(
             "Should implement submit_order()"
         )
+
+    def submit_orders(self, portfolio_id, orders):
+        """
+        Submit a batch of Orders to the sub-portfolio with
+        ID 'portfolio_id'. Brokers able to handle batches more
+        efficiently than individual orders should override this.
+
+        Parameters
+        ----------
+        portfolio_id : `str`
+            The portfolio ID string.
+        orders : `list[Order]`
+            The Order instances to submit.
+        """
+        for order in orders:
+            self.submit_order(portfolio_id, order)
@@ -0,0 +1,116 @@
+import logging
+
+from qstrader import settings
+
+
+class EventLogger(object):
+    """
+    Emits the events of the broker and portfolio layer both as
+    lazily formatted messages to a standard library logger and
+    as structured records to any attached EventSinks.
+
+    Callers check 'is_enabled' prior to gathering the details of
+    an event, such that when neither the standard library logger
+    is enabled for the logging level nor any sink is attached,
+    an event costs a single check. Message arguments are solely
+    formatted into the message by the logging handlers.
+
+    Loggers created via 'child' share the sinks of their parent,
+    such that sinks attached to a broker's logger also receive
+    the events of its portfolios.
+
+    Parameters
+    ----------
+    name : `str`
+        The name of the standard library logger.
+    sinks : `list[EventSink]`, optional
+        The sinks receiving structured event records.
+    level : `int`, optional
+        The standard library logging level of the messages.
+    """
+
+    def __init__(self, name, sinks=None, level=logging.INFO):
+        self.name = name
+        self.logger = logging.getLogger(name)
+        self.sinks = sinks if sinks is not None else []
+        self.level = level
+
+    def child(self, name):
+        """
+        Create an EventLogger with a different standard library
+        logger, which shares the sinks of this logger.
+
+        Parameters
+        ----------
+        name : `str`
+            The name of the standard library logger.
+
+        Returns
+        -------
+        `EventLogger`
+            The child event logger.
+        """
+        return EventLogger(name, sinks=self.sinks, level=self.level)
+
+    def add_sink(self, sink):
+        """
+        Attach a sink to receive the structured event records.
+
+        Parameters
+        ----------
+        sink : `EventSink`
+            The event sink.
+        """
+        self.sinks.append(sink)
+
+    def remove_sink(self, sink):
+        """
+        Detach a previously attached sink.
+
+        Parameters
+        ----------
+        sink : `EventSink`
+            The event sink.
+        """
+        self.sinks.remove(sink)
+
+    def is_enabled(self):
+        """
+        Whether any event would be logged or recorded.
+
+        Returns
+        -------
+        `Boolean`
+            Whether a sink is attached or the standard library
+            logger is enabled for the logging level.
+        """
+        return bool(self.sinks) or self.logger.isEnabledFor(self.level)
+
+    def log(self, event, dt, message, *args, **fields):
+        """
+        Log an event message and emit its structured record.
+
+        Parameters
+        ----------
+        event : `str`
+            The event type, e.g. 'asset_transacted'.
+        dt : `pd.Timestamp`
+            The time of the event.
+        message : `str`
+            The %-style message, prefixed with the formatted
+            event time when logged.
+        *args
+            The message arguments.
+        **fields
+            The structured fields of the event record.
+        """
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(
+                self.level, '(%s) ' + message,
+                dt.strftime(settings.LOGGING["DATE_FORMAT"]), *args
+            )
+        if self.sinks:
+            record = {'dt': dt, 'source': self.name, 'event': event}
+            record.update(fields)
+            for sink in self.sinks:
+                sink.emit(record)
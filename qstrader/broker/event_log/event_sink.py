@@ -0,0 +1,22 @@
+from abc import ABCMeta, abstractmethod
+
+
+class EventSink(object):
+    """
+    Abstract class to receive the structured event records
+    emitted by an EventLogger, such as a buffer or a file.
+    """
+
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    def emit(self, record):
+        raise NotImplementedError(
+            "Should implement emit()"
+        )
+
+    def close(self):
+        """
+        Release any resources held by the sink.
+        """
+        pass
@@ -0,0 +1,80 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+from qstrader.broker.event_log.event_sink import EventSink
+
+
+class JSONLEventSink(EventSink):
+    """
+    Writes each emitted event record as a line of JSON
+    (JSON Lines) to a file. Timestamps are written in ISO 8601
+    format and NumPy scalars as their Python equivalents.
+
+    The file is opened upon the first record, such that
+    attaching the sink to a silent logger creates no file.
+
+    Parameters
+    ----------
+    path : `str`
+        The path of the JSON Lines file.
+    mode : `str`, optional
+        The file mode, either 'w' to overwrite or 'a' to append.
+    """
+
+    def __init__(self, path, mode='w'):
+        if mode not in ('w', 'a'):
+            raise ValueError(
+                'Unable to open JSON Lines event sink with '
+                'file mode "%s". Supported modes are "w" and "a".' % mode
+            )
+        self.path = path
+        self.mode = mode
+        self.file = None
+
+    @staticmethod
+    def _default(value):
+        """
+        Convert the values that are not natively JSON
+        serialisable into serialisable equivalents.
+
+        Parameters
+        ----------
+        value : `object`
+            The value to convert.
+
+        Returns
+        -------
+        `object`
+            The JSON serialisable value.
+        """
+        if isinstance(value, pd.Timestamp):
+            return value.isoformat()
+        if isinstance(value, np.generic):
+            return value.item()
+        return str(value)
+
+    def emit(self, record):
+        """
+        Write the record as a line of the file.
+
+        Parameters
+        ----------
+        record : `dict`
+            The structured event record.
+        """
+        if self.file is None:
+            self.file = open(self.path, self.mode)
+            self.mode = 'a'
+        self.file.write(json.dumps(record, default=self._default))
+        self.file.write('\n')
+
+    def close(self):
+        """
+        Flush and close the file, which is reopened (for
+        appending) should any further records be emitted.
+        """
+        if self.file is not None:
+            self.file.close()
+            self.file = None
@@ -0,0 +1,35 @@
+from collections import deque
+
+from qstrader.broker.event_log.event_sink import EventSink
+
+
+class MemoryEventSink(EventSink):
+    """
+    Stores the emitted event records within an in-memory
+    buffer, optionally bounded to the most recent records.
+
+    Parameters
+    ----------
+    maxlen : `int`, optional
+        The maximum number of records to retain. Unbounded if None.
+    """
+
+    def __init__(self, maxlen=None):
+        self.records = deque(maxlen=maxlen)
+
+    def emit(self, record):
+        """
+        Append the record onto the buffer.
+
+        Parameters
+        ----------
+        record : `dict`
+            The structured event record.
+        """
+        self.records.append(record)
+
+    def clear(self):
+        """
+        Remove all records from the buffer.
+        """
+        self.records.clear()
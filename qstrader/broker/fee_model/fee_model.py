@@ -1,5 +1,7 @@
 from abc import ABCMeta, abstractmethod
 
+import numpy as np
+
 
 class FeeModel(object):
     """
@@ -26,3 +28,33 @@ class FeeModel(object):
         raise NotImplementedError(
             "Should implement calc_total_cost()"
         )
+
+    def calc_total_costs(self, assets, quantities, considerations, broker=None):
+        """
+        Calculate the total of any commission and/or tax for each
+        of a batch of trades. Subclasses should override this with
+        a vectorised calculation where possible.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol strings.
+        quantities : `np.ndarray`
+            The quantity of assets of each trade.
+        considerations : `np.ndarray`
+            Price times quantity of each trade.
+        broker : `Broker`, optional
+            An optional Broker reference.
+
+        Returns
+        -------
+        `np.ndarray`
+            The total commission and tax of each trade.
+        """
+        return np.array(
+            [
+                self.calc_total_cost(asset, quantity, consideration, broker=broker)
+                for asset, quantity, consideration in zip(assets, quantities, considerations)
+            ],
+            dtype=np.float64
+        )
@@ -1,3 +1,5 @@
+import numpy as np
+
 from qstrader.broker.fee_model.fee_model import FeeModel
 
 
@@ -92,3 +94,27 @@ class PercentFeeModel(FeeModel):
         commission = self._calc_commission(asset, quantity, consideration, broker)
         tax = self._calc_tax(asset, quantity, consideration, broker)
         return commission + tax
+
+    def calc_total_costs(self, assets, quantities, considerations, broker=None):
+        """
+        Calculate the total of any commission and/or tax
+        for each of a batch of trades.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol strings.
+        quantities : `np.ndarray`
+            The quantity of assets of each trade.
+        considerations : `np.ndarray`
+            Price times quantity of each trade.
+        broker : `Broker`, optional
+            An optional Broker reference.
+
+        Returns
+        -------
+        `np.ndarray`
+            The total commission and tax of each trade.
+        """
+        abs_considerations = np.abs(np.asarray(considerations, dtype=np.float64))
+        return self.commission_pct * abs_considerations + self.tax_pct * abs_considerations
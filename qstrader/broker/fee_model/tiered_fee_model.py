@@ -0,0 +1,212 @@
+import numpy as np
+
+from qstrader.broker.fee_model.fee_model import FeeModel
+
+
+class TieredFeeModel(FeeModel):
+    """
+    A FeeModel subclass that produces a tiered (marginal) commission,
+    subject to a minimum ticket charge, along with a percentage tax.
+
+    Each tier applies its rate to the part of the trade size falling
+    between its threshold and that of the next tier. The trade size
+    is either the absolute consideration, in which case rates are
+    percentages, or the absolute quantity, in which case rates are
+    a fee per unit. The commission at each threshold is precomputed,
+    such that the commissions of any number of trades are obtained
+    with a single vectorised lookup.
+
+    Parameters
+    ----------
+    tiers : `list[tuple(float, float)]`
+        The (threshold, rate) of each tier, in increasing order of
+        threshold, where the first threshold is zero. Percentage
+        rates of 0-100% are in the range [0.0, 1.0].
+    minimum_commission : `float`, optional
+        The minimum commission charged for any non-zero trade.
+    tax_pct : `float`, optional
+        The percentage tax applied to the consideration.
+        0-100% is in the range [0.0, 1.0]. Hence, e.g. 0.1% is 0.001
+    basis : `str`, optional
+        The trade size the tiers apply to, either 'consideration'
+        or 'quantity'.
+    """
+
+    def __init__(
+        self,
+        tiers,
+        minimum_commission=0.0,
+        tax_pct=0.0,
+        basis='consideration'
+    ):
+        super().__init__()
+        self.thresholds, self.rates, self.base_commissions = self._create_lookup_tables(tiers)
+        self.minimum_commission = minimum_commission
+        self.tax_pct = tax_pct
+        if basis not in ('consideration', 'quantity'):
+            raise ValueError(
+                'Unknown tiered commission basis "%s" provided. Must be '
+                'one of "consideration" or "quantity".' % basis
+            )
+        self.basis = basis
+
+    def _create_lookup_tables(self, tiers):
+        """
+        Create the thresholds and rates of the tiers, along with
+        the commission accumulated up to each threshold.
+
+        Parameters
+        ----------
+        tiers : `list[tuple(float, float)]`
+            The (threshold, rate) of each tier.
+
+        Returns
+        -------
+        `tuple(np.ndarray, np.ndarray, np.ndarray)`
+            The thresholds, rates and base commissions of the tiers.
+        """
+        if len(tiers) == 0:
+            raise ValueError(
+                'Unable to create a tiered fee model without any tiers.'
+            )
+        thresholds = np.array([tier[0] for tier in tiers], dtype=np.float64)
+        rates = np.array([tier[1] for tier in tiers], dtype=np.float64)
+        if thresholds[0] != 0.0 or np.any(np.diff(thresholds) <= 0.0):
+            raise ValueError(
+                'Tier thresholds "%s" must begin at zero and be strictly '
+                'increasing.' % thresholds.tolist()
+            )
+        if np.any(rates < 0.0):
+            raise ValueError(
+                'Tier rates "%s" must be non-negative.' % rates.tolist()
+            )
+        base_commissions = np.concatenate(
+            [[0.0], np.cumsum(rates[:-1] * np.diff(thresholds))]
+        )
+        return thresholds, rates, base_commissions
+
+    def _calc_commissions(self, quantities, considerations):
+        """
+        Calculate the tiered commission of each of a batch of trades.
+
+        Parameters
+        ----------
+        quantities : `np.ndarray`
+            The quantity of assets of each trade.
+        considerations : `np.ndarray`
+            Price times quantity of each trade.
+
+        Returns
+        -------
+        `np.ndarray`
+            The commission of each trade.
+        """
+        if self.basis == 'consideration':
+            sizes = np.abs(np.asarray(considerations, dtype=np.float64))
+        else:
+            sizes = np.abs(np.asarray(quantities, dtype=np.float64))
+        tiers = np.searchsorted(self.thresholds, sizes, side='right') - 1
+        commissions = (
+            self.base_commissions[tiers] +
+            self.rates[tiers] * (sizes - self.thresholds[tiers])
+        )
+        return np.where(
+            sizes > 0.0, np.maximum(commissions, self.minimum_commission), 0.0
+        )
+
+    def _calc_commission(self, asset, quantity, consideration, broker=None):
+        """
+        Returns the tiered commission, subject to the minimum
+        commission.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol string.
+        quantity : `int`
+            The quantity of assets (needed for InteractiveBrokers
+            style calculations).
+        consideration : `float`
+            Price times quantity of the order.
+        broker : `Broker`, optional
+            An optional Broker reference.
+
+        Returns
+        -------
+        `float`
+            The tiered commission.
+        """
+        return float(self._calc_commissions([quantity], [consideration])[0])
+
+    def _calc_tax(self, asset, quantity, consideration, broker=None):
+        """
+        Returns the percentage tax from the consideration.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol string.
+        quantity : `int`
+            The quantity of assets (needed for InteractiveBrokers
+            style calculations).
+        consideration : `float`
+            Price times quantity of the order.
+        broker : `Broker`, optional
+            An optional Broker reference.
+
+        Returns
+        -------
+        `float`
+            The percentage tax.
+        """
+        return self.tax_pct * abs(consideration)
+
+    def calc_total_cost(self, asset, quantity, consideration, broker=None):
+        """
+        Calculate the total of any commission and/or tax
+        for the trade of size 'consideration'.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol string.
+        quantity : `int`
+            The quantity of assets (needed for InteractiveBrokers
+            style calculations).
+        consideration : `float`
+            Price times quantity of the order.
+        broker : `Broker`, optional
+            An optional Broker reference.
+
+        Returns
+        -------
+        `float`
+            The total commission and tax.
+        """
+        commission = self._calc_commission(asset, quantity, consideration, broker)
+        tax = self._calc_tax(asset, quantity, consideration, broker)
+        return commission + tax
+
+    def calc_total_costs(self, assets, quantities, considerations, broker=None):
+        """
+        Calculate the total of any commission and/or tax
+        for each of a batch of trades.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol strings.
+        quantities : `np.ndarray`
+            The quantity of assets of each trade.
+        considerations : `np.ndarray`
+            Price times quantity of each trade.
+        broker : `Broker`, optional
+            An optional Broker reference.
+
+        Returns
+        -------
+        `np.ndarray`
+            The total commission and tax of each trade.
+        """
+        commissions = self._calc_commissions(quantities, considerations)
+        return commissions + self.tax_pct * np.abs(np.asarray(considerations, dtype=np.float64))
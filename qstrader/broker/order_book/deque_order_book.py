@@ -0,0 +1,86 @@
+from collections import deque
+
+from qstrader.broker.order_book.order_book import OrderBook
+
+
+class DequeOrderBook(OrderBook):
+    """
+    Holds the open Orders of a broker portfolio within a plain
+    deque, without any locking, for single-threaded simulations.
+
+    All of the open orders are removed in a single operation via
+    'drain', optionally sorted (stably) by direction, such that
+    sell orders precede buy orders.
+    """
+
+    def __init__(self):
+        self.orders = deque()
+
+    def put(self, order):
+        """
+        Add an order onto the end of the order book.
+
+        Parameters
+        ----------
+        order : `Order`
+            The order to add.
+        """
+        self.orders.append(order)
+
+    def put_all(self, orders):
+        """
+        Add the orders, in turn, onto the end of the order book.
+
+        Parameters
+        ----------
+        orders : `list[Order]`
+            The orders to add.
+        """
+        self.orders.extend(orders)
+
+    def get(self):
+        """
+        Remove and return the earliest submitted order.
+
+        Returns
+        -------
+        `Order`
+            The earliest submitted order.
+        """
+        if not self.orders:
+            raise IndexError('Unable to get an order from an empty order book.')
+        return self.orders.popleft()
+
+    def drain(self, sort_by_direction=False):
+        """
+        Remove and return all of the open orders.
+
+        Parameters
+        ----------
+        sort_by_direction : `Boolean`, optional
+            Whether to sort the orders by direction (sell orders
+            first), otherwise orders are in submission order. Orders
+            of the same direction remain in submission order.
+
+        Returns
+        -------
+        `list[Order]`
+            The open orders.
+        """
+        if sort_by_direction:
+            orders = sorted(self.orders, key=lambda order: order.direction)
+        else:
+            orders = list(self.orders)
+        self.orders.clear()
+        return orders
+
+    def qsize(self):
+        """
+        The number of open orders.
+
+        Returns
+        -------
+        `int`
+            The number of open orders.
+        """
+        return len(self.orders)
@@ -0,0 +1,36 @@
+import threading
+
+from qstrader.broker.order_book.deque_order_book import DequeOrderBook
+
+
+class LockedOrderBook(DequeOrderBook):
+    """
+    A DequeOrderBook guarded by a lock, for use where orders
+    are submitted to the broker concurrently from multiple threads.
+    Draining the order book removes all of the open orders
+    atomically, such that no concurrently submitted order is lost.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+
+    def put(self, order):
+        with self.lock:
+            super().put(order)
+
+    def put_all(self, orders):
+        with self.lock:
+            super().put_all(orders)
+
+    def get(self):
+        with self.lock:
+            return super().get()
+
+    def drain(self, sort_by_direction=False):
+        with self.lock:
+            return super().drain(sort_by_direction=sort_by_direction)
+
+    def qsize(self):
+        with self.lock:
+            return super().qsize()
@@ -0,0 +1,54 @@
+from abc import ABCMeta, abstractmethod
+
+
+class OrderBook(object):
+    """
+    Abstract class to hold the open (submitted but not yet
+    executed) Orders of a broker portfolio, in submission order.
+    """
+
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    def put(self, order):
+        raise NotImplementedError(
+            "Should implement put()"
+        )
+
+    @abstractmethod
+    def put_all(self, orders):
+        raise NotImplementedError(
+            "Should implement put_all()"
+        )
+
+    @abstractmethod
+    def get(self):
+        raise NotImplementedError(
+            "Should implement get()"
+        )
+
+    @abstractmethod
+    def drain(self, sort_by_direction=False):
+        raise NotImplementedError(
+            "Should implement drain()"
+        )
+
+    @abstractmethod
+    def qsize(self):
+        raise NotImplementedError(
+            "Should implement qsize()"
+        )
+
+    def empty(self):
+        """
+        Whether the order book holds no open orders.
+
+        Returns
+        -------
+        `Boolean`
+            Whether the order book is empty.
+        """
+        return self.qsize() == 0
+
+    def __len__(self):
+        return self.qsize()
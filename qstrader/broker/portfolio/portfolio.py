@@ -1,11 +1,9 @@
 import copy
-import datetime
-import logging
-
-import pandas as pd
 
 from qstrader import settings
+from qstrader.broker.event_log.event_logger import EventLogger
 from qstrader.broker.portfolio.portfolio_event import PortfolioEvent
+from qstrader.broker.portfolio.portfolio_history import PortfolioHistory
 from qstrader.broker.portfolio.position_handler import PositionHandler
 
 
@@ -28,6 +26,9 @@ class Portfolio(object):
         An identifier for the portfolio.
     name: str, optional
         The human-readable name of the portfolio.
+    event_logger: EventLogger, optional
+        The logger of the portfolio events. Defaults to an
+        EventLogger of the 'Portfolio' standard library logger.
     """
 
     def __init__(
@@ -36,7 +37,8 @@ class Portfolio(object):
         starting_cash=0.0,
         currency="USD",
         portfolio_id=None,
-        name=None
+        name=None,
+        event_logger=None
     ):
         """
         Initialise the Portfolio object with a PositionHandler,
@@ -51,16 +53,17 @@ class Portfolio(object):
         self.name = name
 
         self.pos_handler = PositionHandler()
-        self.history = []
-
-        self.logger = logging.getLogger('Portfolio')
-        self.logger.setLevel(logging.DEBUG)
-        self.logger.info(
-            '(%s) Portfolio "%s" instance initialised' % (
-                self.current_dt.strftime(settings.LOGGING["DATE_FORMAT"]),
-                self.portfolio_id
-            )
+        self.history = PortfolioHistory()
+
+        self.event_logger = (
+            event_logger if event_logger is not None else EventLogger('Portfolio')
         )
+        if self.event_logger.is_enabled():
+            self.event_logger.log(
+                'portfolio_initialised', self.current_dt,
+                'Portfolio "%s" instance initialised', self.portfolio_id,
+                portfolio_id=self.portfolio_id
+            )
 
         self._initialise_portfolio_with_cash()
 
@@ -78,15 +81,8 @@ class Portfolio(object):
                 )
             )
 
-        self.logger.info(
-            '(%s) Funds subscribed to portfolio "%s" '
-            '- Credit: %0.2f, Balance: %0.2f' % (
-                self.current_dt.strftime(settings.LOGGING["DATE_FORMAT"]),
-                self.portfolio_id,
-                round(self.starting_cash, 2),
-                round(self.starting_cash, 2)
-            )
-        )
+        if self.event_logger.is_enabled():
+            self._log_cash_event('funds_subscribed', self.starting_cash)
 
     @property
     def total_market_value(self):
@@ -147,14 +143,8 @@ class Portfolio(object):
             PortfolioEvent.create_subscription(self.current_dt, amount, self.cash)
         )
 
-        self.logger.info(
-            '(%s) Funds subscribed to portfolio "%s" '
-            '- Credit: %0.2f, Balance: %0.2f' % (
-                self.current_dt.strftime(settings.LOGGING["DATE_FORMAT"]),
-                self.portfolio_id, round(amount, 2),
-                round(self.cash, 2)
-            )
-        )
+        if self.event_logger.is_enabled():
+            self._log_cash_event('funds_subscribed', amount)
 
     def withdraw_funds(self, dt, amount):
         """
@@ -192,14 +182,8 @@ class Portfolio(object):
             PortfolioEvent.create_withdrawal(self.current_dt, amount, self.cash)
         )
 
-        self.logger.info(
-            '(%s) Funds withdrawn from portfolio "%s" '
-            '- Debit: %0.2f, Balance: %0.2f' % (
-                self.current_dt.strftime(settings.LOGGING["DATE_FORMAT"]),
-                self.portfolio_id, round(amount, 2),
-                round(self.cash, 2)
-            )
-        )
+        if self.event_logger.is_enabled():
+            self._log_cash_event('funds_withdrawn', amount)
 
     def transact_asset(self, txn):
         """
@@ -231,43 +215,69 @@ class Portfolio(object):
 
         self.cash -= txn_total_cost
 
-        # Form Portfolio history details
-        direction = "LONG" if txn.direction > 0 else "SHORT"
-        description = "%s %s %s %0.2f %s" % (
-            direction, txn.quantity, txn.asset.upper(),
-            txn.price, datetime.datetime.strftime(txn.dt, "%d/%m/%Y")
-        )
-        if direction == "LONG":
-            pe = PortfolioEvent(
-                dt=txn.dt, type='asset_transaction',
-                description=description,
+        # Record the transaction within the Portfolio history,
+        # the description of which is rendered when requested
+        if txn.direction > 0:
+            self.history.append_transaction(
+                txn.dt, txn.asset, txn.quantity, txn.price,
                 debit=round(txn_total_cost, 2), credit=0.0,
                 balance=round(self.cash, 2)
             )
-            self.logger.info(
-                '(%s) Asset "%s" transacted LONG in portfolio "%s" '
-                '- Debit: %0.2f, Balance: %0.2f' % (
-                    txn.dt.strftime(settings.LOGGING["DATE_FORMAT"]),
-                    txn.asset, self.portfolio_id,
-                    round(txn_total_cost, 2), round(self.cash, 2)
-                )
-            )
         else:
-            pe = PortfolioEvent(
-                dt=txn.dt, type='asset_transaction',
-                description=description,
+            self.history.append_transaction(
+                txn.dt, txn.asset, txn.quantity, txn.price,
                 debit=0.0, credit=-1.0 * round(txn_total_cost, 2),
                 balance=round(self.cash, 2)
             )
-            self.logger.info(
-                '(%s) Asset "%s" transacted SHORT in portfolio "%s" '
-                '- Credit: %0.2f, Balance: %0.2f' % (
-                    txn.dt.strftime(settings.LOGGING["DATE_FORMAT"]),
-                    txn.asset, self.portfolio_id,
-                    -1.0 * round(txn_total_cost, 2), round(self.cash, 2)
-                )
-            )
-        self.history.append(pe)
+
+        if self.event_logger.is_enabled():
+            self._log_transaction_event(txn, txn_total_cost)
+
+    def _log_cash_event(self, event, amount):
+        """
+        Log a subscription or withdrawal of funds.
+
+        Parameters
+        ----------
+        event : `str`
+            Either 'funds_subscribed' or 'funds_withdrawn'.
+        amount : `float`
+            The amount of cash subscribed or withdrawn.
+        """
+        if event == 'funds_subscribed':
+            message = 'Funds subscribed to portfolio "%s" - Credit: %0.2f, Balance: %0.2f'
+        else:
+            message = 'Funds withdrawn from portfolio "%s" - Debit: %0.2f, Balance: %0.2f'
+        self.event_logger.log(
+            event, self.current_dt, message,
+            self.portfolio_id, round(amount, 2), round(self.cash, 2),
+            portfolio_id=self.portfolio_id, amount=amount, balance=self.cash
+        )
+
+    def _log_transaction_event(self, txn, total_cost):
+        """
+        Log the transaction of an asset.
+
+        Parameters
+        ----------
+        txn : `Transaction`
+            The executed transaction.
+        total_cost : `float`
+            The cost of the transaction including commission.
+        """
+        if txn.direction > 0:
+            message = 'Asset "%s" transacted LONG in portfolio "%s" - Debit: %0.2f, Balance: %0.2f'
+            amount = round(total_cost, 2)
+        else:
+            message = 'Asset "%s" transacted SHORT in portfolio "%s" - Credit: %0.2f, Balance: %0.2f'
+            amount = -1.0 * round(total_cost, 2)
+        self.event_logger.log(
+            'asset_transacted', txn.dt, message,
+            txn.asset, self.portfolio_id, amount, round(self.cash, 2),
+            portfolio_id=self.portfolio_id, asset=txn.asset,
+            quantity=txn.quantity, price=txn.price, commission=txn.commission,
+            total_cost=total_cost, balance=self.cash, order_id=txn.order_id
+        )
 
     def portfolio_to_dict(self):
         """
@@ -291,6 +301,23 @@ class Portfolio(object):
             }
         return holdings
 
+    def portfolio_quantities(self):
+        """
+        Output the net quantity of each asset held, excluding cash,
+        as a vector aligned to the list of asset symbols.
+
+        Returns
+        -------
+        `tuple(list[str], np.ndarray, np.ndarray)`
+            The asset symbols, their net quantities and whether
+            each net quantity is an integer.
+        """
+        return (
+            list(self.pos_handler.positions.keys()),
+            self.pos_handler.net_quantities(),
+            self.pos_handler.integral_net_quantities()
+        )
+
     def update_market_value_of_asset(
         self, asset, current_price, current_dt
     ):
@@ -326,9 +353,4 @@ class Portfolio(object):
         """
         Creates a Pandas DataFrame of the Portfolio history.
         """
-        records = [pe.to_dict() for pe in self.history]
-        return pd.DataFrame.from_records(
-            records, columns=[
-                "date", "type", "description", "debit", "credit", "balance"
-            ]
-        ).set_index(keys=["date"])
+        return self.history.to_df()
@@ -0,0 +1,310 @@
+import numpy as np
+import pandas as pd
+
+from qstrader.broker.portfolio.portfolio_event import PortfolioEvent
+
+
+class PortfolioHistory(object):
+    """
+    An append-only, columnar store of the PortfolioEvents of a
+    Portfolio, used to create an event trail to track all changes
+    to a portfolio through time.
+
+    Each event is stored as a row of preallocated (and geometrically
+    grown) NumPy columns of timestamps, event type codes, asset ids,
+    transaction quantities and prices, along with the debits, credits
+    and cash balances. Transaction descriptions are solely rendered
+    when the events are subsequently requested, rather than upon
+    every transaction.
+
+    The history behaves as a read-only list of PortfolioEvents, such
+    that it can be iterated over, indexed and compared to a list.
+    """
+
+    INITIAL_CAPACITY = 64
+
+    def __init__(self):
+        self.size = 0
+        self.tz = None
+        self.types = []
+        self.type_codes = {}
+        self.assets = []
+        self.asset_ids = {}
+        self.descriptions = {}
+        self.columns = {
+            'dt': np.zeros(self.INITIAL_CAPACITY, dtype=np.int64),
+            'type': np.zeros(self.INITIAL_CAPACITY, dtype=np.int16),
+            'asset': np.zeros(self.INITIAL_CAPACITY, dtype=np.int32),
+            'quantity': np.zeros(self.INITIAL_CAPACITY, dtype=np.float64),
+            'integral': np.zeros(self.INITIAL_CAPACITY, dtype=bool),
+            'price': np.zeros(self.INITIAL_CAPACITY, dtype=np.float64),
+            'debit': np.zeros(self.INITIAL_CAPACITY, dtype=np.float64),
+            'credit': np.zeros(self.INITIAL_CAPACITY, dtype=np.float64),
+            'balance': np.zeros(self.INITIAL_CAPACITY, dtype=np.float64)
+        }
+
+    def _code(self, codes, values, value):
+        """
+        Obtain the integer code of a value, adding
+        the value to the codes if not yet present.
+
+        Parameters
+        ----------
+        codes : `dict{str: int}`
+            The integer code of each value.
+        values : `list[str]`
+            The values, in code order.
+        value : `str`
+            The value to encode.
+
+        Returns
+        -------
+        `int`
+            The integer code of the value.
+        """
+        code = codes.get(value)
+        if code is None:
+            code = len(values)
+            codes[value] = code
+            values.append(value)
+        return code
+
+    def _append_row(
+        self, dt, type, debit, credit, balance,
+        asset=None, quantity=0, price=np.nan
+    ):
+        """
+        Append a row onto the history columns, growing the
+        columns if their capacity is exhausted.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            Datetime of the event.
+        type : `str`
+            The type of portfolio event.
+        debit : `float`
+            A debit to the cash balance of the portfolio.
+        credit : `float`
+            A credit to the cash balance of the portfolio.
+        balance : `float`
+            The current cash balance of the portfolio.
+        asset : `str`, optional
+            The asset symbol of a transaction.
+        quantity : `int` or `float`, optional
+            The quantity of a transaction.
+        price : `float`, optional
+            The price of a transaction.
+        """
+        if self.size == len(self.columns['dt']):
+            for name, column in self.columns.items():
+                self.columns[name] = np.concatenate([column, np.zeros_like(column)])
+
+        dt = pd.Timestamp(dt)
+        if self.size == 0:
+            self.tz = dt.tz
+
+        row = self.size
+        self.columns['dt'][row] = dt.value
+        self.columns['type'][row] = self._code(self.type_codes, self.types, type)
+        self.columns['asset'][row] = (
+            -1 if asset is None else self._code(self.asset_ids, self.assets, asset)
+        )
+        self.columns['quantity'][row] = quantity
+        self.columns['integral'][row] = not isinstance(quantity, (float, np.floating))
+        self.columns['price'][row] = price
+        self.columns['debit'][row] = debit
+        self.columns['credit'][row] = credit
+        self.columns['balance'][row] = balance
+        self.size += 1
+
+    def append(self, event):
+        """
+        Append a PortfolioEvent onto the history.
+
+        Parameters
+        ----------
+        event : `PortfolioEvent`
+            The portfolio event.
+        """
+        row = self.size
+        self._append_row(
+            event.dt, event.type, event.debit, event.credit, event.balance
+        )
+        if event.description != event.type.upper():
+            self.descriptions[row] = event.description
+
+    def append_transaction(self, dt, asset, quantity, price, debit, credit, balance):
+        """
+        Append an asset transaction event onto the history,
+        the description of which is rendered when requested.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            Datetime of the transaction.
+        asset : `str`
+            The asset symbol of the transaction.
+        quantity : `int` or `float`
+            The quantity of the transaction.
+        price : `float`
+            The price of the transaction.
+        debit : `float`
+            A debit to the cash balance of the portfolio.
+        credit : `float`
+            A credit to the cash balance of the portfolio.
+        balance : `float`
+            The current cash balance of the portfolio.
+        """
+        self._append_row(
+            dt, 'asset_transaction', debit, credit, balance,
+            asset=asset, quantity=quantity, price=price
+        )
+
+    def _dts(self, rows):
+        """
+        Obtain the timestamps of the provided rows.
+
+        Parameters
+        ----------
+        rows : `slice` or `np.ndarray`
+            The history rows.
+
+        Returns
+        -------
+        `pd.DatetimeIndex`
+            The timestamps, in the timezone of the first event.
+        """
+        dts = pd.DatetimeIndex(self.columns['dt'][rows].astype('datetime64[ns]'))
+        if self.tz is not None:
+            dts = dts.tz_localize('UTC').tz_convert(self.tz)
+        return dts
+
+    def _description(self, row, date):
+        """
+        Render the human-readable description of an event.
+
+        Parameters
+        ----------
+        row : `int`
+            The history row.
+        date : `str`
+            The formatted date of the event.
+
+        Returns
+        -------
+        `str`
+            The event description.
+        """
+        if row in self.descriptions:
+            return self.descriptions[row]
+        asset_id = self.columns['asset'][row]
+        if asset_id < 0:
+            return self.types[self.columns['type'][row]].upper()
+        quantity = self.columns['quantity'][row]
+        direction = "LONG" if np.copysign(1, quantity) > 0 else "SHORT"
+        quantity = int(quantity) if self.columns['integral'][row] else float(quantity)
+        return "%s %s %s %0.2f %s" % (
+            direction, quantity, self.assets[asset_id].upper(),
+            self.columns['price'][row], date
+        )
+
+    def _descriptions(self, rows, dts):
+        """
+        Render the descriptions of the provided rows.
+
+        Parameters
+        ----------
+        rows : `range`
+            The history rows.
+        dts : `pd.DatetimeIndex`
+            The timestamps of the rows.
+
+        Returns
+        -------
+        `list[str]`
+            The event descriptions.
+        """
+        dates = dts.strftime("%d/%m/%Y")
+        return [self._description(row, date) for row, date in zip(rows, dates)]
+
+    def _event(self, row):
+        """
+        Create the PortfolioEvent of a history row.
+
+        Parameters
+        ----------
+        row : `int`
+            The history row.
+
+        Returns
+        -------
+        `PortfolioEvent`
+            The portfolio event.
+        """
+        dts = self._dts(slice(row, row + 1))
+        return PortfolioEvent(
+            dt=dts[0],
+            type=self.types[self.columns['type'][row]],
+            description=self._descriptions([row], dts)[0],
+            debit=float(self.columns['debit'][row]),
+            credit=float(self.columns['credit'][row]),
+            balance=float(self.columns['balance'][row])
+        )
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._event(row) for row in range(*index.indices(self.size))]
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError('Portfolio history index out of range.')
+        return self._event(index)
+
+    def __iter__(self):
+        for row in range(self.size):
+            yield self._event(row)
+
+    def __eq__(self, other):
+        if isinstance(other, PortfolioHistory):
+            other = list(other)
+        try:
+            if len(other) != self.size:
+                return False
+        except TypeError:
+            return NotImplemented
+        return all(event == other_event for event, other_event in zip(self, other))
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def to_df(self):
+        """
+        Creates a Pandas DataFrame of the history directly
+        from the history columns.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The history, indexed by date.
+        """
+        rows = slice(0, self.size)
+        dts = self._dts(rows)
+        types = np.array(self.types, dtype=object)
+        return pd.DataFrame(
+            {
+                # The date index has always been left empty, since
+                # events are keyed by 'dt' rather than 'date', which
+                # is retained for consistency with existing histories
+                "date": np.full(self.size, np.nan),
+                "type": types[self.columns['type'][rows]],
+                "description": self._descriptions(range(self.size), dts),
+                "debit": self.columns['debit'][rows],
+                "credit": self.columns['credit'][rows],
+                "balance": self.columns['balance'][rows]
+            },
+            copy=False
+        ).set_index(keys=["date"])
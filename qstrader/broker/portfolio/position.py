@@ -35,6 +35,12 @@ class Position(object):
         The commission spent on selling assets for this position.
     """
 
+    __slots__ = (
+        'asset', 'current_price', 'current_dt',
+        'buy_quantity', 'sell_quantity', 'avg_bought', 'avg_sold',
+        'buy_commission', 'sell_commission'
+    )
+
     def __init__(
         self,
         asset,
@@ -1,20 +1,138 @@
 from collections import OrderedDict
+import numbers
+
+import numpy as np
 
 from qstrader.broker.portfolio.position import Position
+from qstrader.broker.portfolio.position_view import PositionView
 
 
 class PositionHandler(object):
     """
     A class that keeps track of, and updates, the current
     list of Position instances stored in a Portfolio entity.
+
+    The numerical fields of all positions are stored within a
+    columnar position book, a two-dimensional NumPy array with
+    one row per position (in the order the positions were opened)
+    and one column per field. The 'positions' dictionary maps each
+    asset to a PositionView onto its row of the book, while the
+    portfolio totals are calculated as single vectorised reductions
+    over the book columns.
+
+    Each field additionally records whether its value was set to
+    an integer, such that views return quantities with the same
+    numerical type as the equivalent Position.
     """
 
+    FIELDS = (
+        'current_price',
+        'buy_quantity',
+        'sell_quantity',
+        'avg_bought',
+        'avg_sold',
+        'buy_commission',
+        'sell_commission'
+    )
+    COLUMNS = {field: column for column, field in enumerate(FIELDS)}
+    INITIAL_CAPACITY = 16
+
     def __init__(self):
         """
         Initialise the PositionHandler object to generate
-        an ordered dictionary containing the current positions.
+        an ordered dictionary containing the current positions,
+        along with an empty position book.
         """
         self.positions = OrderedDict()
+        self.book = np.zeros((self.INITIAL_CAPACITY, len(self.FIELDS)), dtype=np.float64)
+        self.integral = np.zeros(self.book.shape, dtype=bool)
+
+    def get_field(self, slot, field):
+        """
+        Obtain the value of a field of a position book row.
+
+        Parameters
+        ----------
+        slot : `int`
+            The position book row.
+        field : `str`
+            The name of the Position field.
+
+        Returns
+        -------
+        `int` or `float`
+            The field value.
+        """
+        column = self.COLUMNS[field]
+        value = self.book[slot, column]
+        if self.integral[slot, column]:
+            return int(value)
+        return float(value)
+
+    def set_field(self, slot, field, value):
+        """
+        Set the value of a field of a position book row.
+
+        Parameters
+        ----------
+        slot : `int`
+            The position book row.
+        field : `str`
+            The name of the Position field.
+        value : `int` or `float`
+            The field value.
+        """
+        column = self.COLUMNS[field]
+        self.book[slot, column] = value
+        self.integral[slot, column] = isinstance(value, numbers.Integral)
+
+    def _open_position(self, transaction):
+        """
+        Open a new position from the transaction, appending
+        a row onto the position book.
+
+        Parameters
+        ----------
+        transaction : `Transaction`
+            The transaction with which to open the position.
+        """
+        slot = len(self.positions)
+        if slot == len(self.book):
+            self.book = np.vstack([self.book, np.zeros(self.book.shape)])
+            self.integral = np.vstack([self.integral, np.zeros(self.integral.shape, dtype=bool)])
+        self.positions[transaction.asset] = PositionView(
+            self, slot, Position.open_from_transaction(transaction)
+        )
+
+    def _close_position(self, asset):
+        """
+        Remove the position in the asset, shifting the rows of
+        all subsequently opened positions up the position book.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol of the position to close.
+        """
+        slot = self.positions.pop(asset).slot
+        size = len(self.positions)
+        self.book[slot:size] = self.book[slot + 1:size + 1]
+        self.integral[slot:size] = self.integral[slot + 1:size + 1]
+        for position in self.positions.values():
+            if position.slot > slot:
+                position.slot -= 1
+
+    def _columns(self):
+        """
+        Obtain the book columns of the current positions.
+
+        Returns
+        -------
+        `dict{str: np.ndarray}`
+            The current position values of each field.
+        """
+        book = self.book[:len(self.positions)]
+        return {field: book[:, column] for field, column in self.COLUMNS.items()}
 
     def transact_position(self, transaction):
         """
@@ -25,45 +143,131 @@ class PositionHandler(object):
         if asset in self.positions:
             self.positions[asset].transact(transaction)
         else:
-            position = Position.open_from_transaction(transaction)
-            self.positions[asset] = position
+            self._open_position(transaction)
 
         # If the position has zero quantity remove it
         if self.positions[asset].net_quantity == 0:
-            del self.positions[asset]
+            self._close_position(asset)
+
+    def net_quantities(self):
+        """
+        Calculate the net quantity of each position.
+
+        Returns
+        -------
+        `np.ndarray`
+            The net quantities, in position order.
+        """
+        cols = self._columns()
+        return cols['buy_quantity'] - cols['sell_quantity']
+
+    def integral_net_quantities(self):
+        """
+        Determine whether the net quantity of each position is an
+        integer, i.e. whether both its bought and sold quantities are.
+
+        Returns
+        -------
+        `np.ndarray`
+            The boolean integral flags, in position order.
+        """
+        integral = self.integral[:len(self.positions)]
+        return (
+            integral[:, self.COLUMNS['buy_quantity']] &
+            integral[:, self.COLUMNS['sell_quantity']]
+        )
+
+    def market_values(self):
+        """
+        Calculate the market value of each position.
+
+        Returns
+        -------
+        `np.ndarray`
+            The market values, in position order.
+        """
+        return self._columns()['current_price'] * self.net_quantities()
+
+    def unrealised_pnls(self):
+        """
+        Calculate the unrealised P&L of each position.
+
+        Returns
+        -------
+        `np.ndarray`
+            The unrealised P&Ls, in position order.
+        """
+        cols = self._columns()
+        net_quantity = self.net_quantities()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            avg_price = np.where(
+                net_quantity > 0,
+                (cols['avg_bought'] * cols['buy_quantity'] + cols['buy_commission']) / cols['buy_quantity'],
+                np.where(
+                    net_quantity < 0,
+                    (cols['avg_sold'] * cols['sell_quantity'] - cols['sell_commission']) / cols['sell_quantity'],
+                    0.0
+                )
+            )
+        return (cols['current_price'] - avg_price) * net_quantity
+
+    def realised_pnls(self):
+        """
+        Calculate the realised P&L of each position.
+
+        Returns
+        -------
+        `np.ndarray`
+            The realised P&Ls, in position order.
+        """
+        cols = self._columns()
+        net_quantity = self.net_quantities()
+        buy_quantity = cols['buy_quantity']
+        sell_quantity = cols['sell_quantity']
+        price_diff = cols['avg_sold'] - cols['avg_bought']
+        with np.errstate(invalid='ignore', divide='ignore'):
+            long_pnl = np.where(
+                sell_quantity == 0,
+                0.0,
+                (price_diff * sell_quantity) -
+                ((sell_quantity / buy_quantity) * cols['buy_commission']) -
+                cols['sell_commission']
+            )
+            short_pnl = np.where(
+                buy_quantity == 0,
+                0.0,
+                (price_diff * buy_quantity) -
+                ((buy_quantity / sell_quantity) * cols['sell_commission']) -
+                cols['buy_commission']
+            )
+        flat_pnl = (
+            (cols['avg_sold'] * sell_quantity - cols['avg_bought'] * buy_quantity) -
+            (cols['buy_commission'] + cols['sell_commission'])
+        )
+        return np.where(
+            net_quantity > 0, long_pnl, np.where(net_quantity < 0, short_pnl, flat_pnl)
+        )
 
     def total_market_value(self):
         """
         Calculate the sum of all the positions' market values.
         """
-        return sum(
-            pos.market_value
-            for asset, pos in self.positions.items()
-        )
+        return float(np.sum(self.market_values()))
 
     def total_unrealised_pnl(self):
         """
         Calculate the sum of all the positions' unrealised P&Ls.
         """
-        return sum(
-            pos.unrealised_pnl
-            for asset, pos in self.positions.items()
-        )
+        return float(np.sum(self.unrealised_pnls()))
 
     def total_realised_pnl(self):
         """
         Calculate the sum of all the positions' realised P&Ls.
         """
-        return sum(
-            pos.realised_pnl
-            for asset, pos in self.positions.items()
-        )
+        return float(np.sum(self.realised_pnls()))
 
     def total_pnl(self):
         """
         Calculate the sum of all the positions' P&Ls.
         """
-        return sum(
-            pos.total_pnl
-            for asset, pos in self.positions.items()
-        )
+        return float(np.sum(self.realised_pnls() + self.unrealised_pnls()))
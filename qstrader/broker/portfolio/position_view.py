@@ -0,0 +1,73 @@
+from qstrader.broker.portfolio.position import Position
+
+
+def _book_field(field):
+    """
+    Create a property reading and writing a numerical Position
+    field from and to the columnar position book.
+
+    Parameters
+    ----------
+    field : `str`
+        The name of the Position field.
+
+    Returns
+    -------
+    `property`
+        The Position field property.
+    """
+    def fget(self):
+        return self.handler.get_field(self.slot, field)
+
+    def fset(self, value):
+        self.handler.set_field(self.slot, field, value)
+
+    return property(fget, fset)
+
+
+class PositionView(Position):
+    """
+    A Position whose numerical fields (quantities, average prices,
+    commissions and current price) are stored within a row of the
+    columnar position book of a PositionHandler, rather than upon
+    the instance itself.
+
+    All of the Position accounting and properties are inherited,
+    such that the view behaves identically to a Position, while
+    the PositionHandler aggregates across all of its positions
+    with vectorised reductions over the book columns.
+
+    Parameters
+    ----------
+    handler : `PositionHandler`
+        The position handler storing the position book.
+    slot : `int`
+        The row of the position book storing this Position.
+    position : `Position`
+        The Position whose fields initialise the book row.
+    """
+
+    __slots__ = ('handler', 'slot')
+
+    current_price = _book_field('current_price')
+    buy_quantity = _book_field('buy_quantity')
+    sell_quantity = _book_field('sell_quantity')
+    avg_bought = _book_field('avg_bought')
+    avg_sold = _book_field('avg_sold')
+    buy_commission = _book_field('buy_commission')
+    sell_commission = _book_field('sell_commission')
+
+    def __init__(self, handler, slot, position):
+        self.handler = handler
+        self.slot = slot
+        super().__init__(
+            position.asset,
+            position.current_price,
+            position.current_dt,
+            position.buy_quantity,
+            position.sell_quantity,
+            position.avg_bought,
+            position.avg_sold,
+            position.buy_commission,
+            position.sell_commission
+        )
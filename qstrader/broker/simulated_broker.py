@@ -1,10 +1,13 @@
-import queue
+import heapq
 
 import numpy as np
 
 from qstrader import settings
 from qstrader.broker.broker import Broker
+from qstrader.broker.event_log.event_logger import EventLogger
 from qstrader.broker.fee_model.fee_model import FeeModel
+from qstrader.broker.order_book.deque_order_book import DequeOrderBook
+from qstrader.broker.order_book.order_book import OrderBook
 from qstrader.broker.portfolio.portfolio import Portfolio
 from qstrader.broker.transaction.transaction import Transaction
 from qstrader.broker.fee_model.zero_fee_model import ZeroFeeModel
@@ -41,6 +44,14 @@ class SimulatedBroker(Broker):
         The model used to simulate trade slippage.
     market_impact_model : `MarketImpactModel`, optional
         The model used to simulate market impact of trading.
+    event_logger : `EventLogger`, optional
+        The logger of the broker events, the sinks of which also
+        receive the events of the broker's portfolios. Defaults to
+        an EventLogger of the 'SimulatedBroker' standard library logger.
+    order_book_cls : `OrderBook` (class), optional
+        The class of the order book holding the open orders of each
+        portfolio. Defaults to the (unlocked) DequeOrderBook, while
+        the LockedOrderBook supports concurrent order submission.
     """
 
     def __init__(
@@ -53,7 +64,9 @@ class SimulatedBroker(Broker):
         initial_funds=0.0,
         fee_model=ZeroFeeModel(),
         slippage_model=None,
-        market_impact_model=None
+        market_impact_model=None,
+        event_logger=None,
+        order_book_cls=DequeOrderBook
     ):
         self.start_dt = start_dt
         self.exchange = exchange
@@ -64,12 +77,17 @@ class SimulatedBroker(Broker):
         self.base_currency = self._set_base_currency(base_currency)
         self.initial_funds = self._set_initial_funds(initial_funds)
         self.fee_model = self._set_fee_model(fee_model)
+        self.order_book_cls = self._set_order_book_cls(order_book_cls)
         self.slippage_model = None  # TODO: Implement
         self.market_impact_model = None  # TODO: Implement
+        self.event_logger = (
+            event_logger if event_logger is not None else EventLogger('SimulatedBroker')
+        )
 
         self.cash_balances = self._set_cash_balances()
         self.portfolios = self._set_initial_portfolios()
         self.open_orders = self._set_initial_open_orders()
+        self._revalued_price_dts = {}
 
         if settings.PRINT_EVENTS:
             print('Initialising simulated broker "%s"...' % self.account_id)
@@ -148,6 +166,30 @@ class SimulatedBroker(Broker):
                 "Broker entity." % fee_model.__class__
             )
 
+    def _set_order_book_cls(self, order_book_cls):
+        """
+        Check and set the OrderBook class used to hold the
+        open orders of each portfolio.
+
+        Parameters
+        ----------
+        order_book_cls : `OrderBook` (class)
+            The order book class provided to the Broker.
+
+        Returns
+        -------
+        `OrderBook` (class)
+            The checked order book class.
+        """
+        if isinstance(order_book_cls, type) and issubclass(order_book_cls, OrderBook):
+            return order_book_cls
+        else:
+            raise TypeError(
+                "Provided order book class '%s' in SimulatedBroker is not "
+                "an OrderBook subclass, so could not create the "
+                "Broker entity." % order_book_cls
+            )
+
     def _set_cash_balances(self):
         """
         Set the appropriate cash balances in the various
@@ -333,10 +375,11 @@ class SimulatedBroker(Broker):
                 self.current_dt,
                 currency=self.base_currency,
                 portfolio_id=portfolio_id_str,
-                name=name
+                name=name,
+                event_logger=self.event_logger.child('Portfolio')
             )
             self.portfolios[portfolio_id_str] = p
-            self.open_orders[portfolio_id_str] = queue.Queue()
+            self.open_orders[portfolio_id_str] = self.order_book_cls()
             if settings.PRINT_EVENTS:
                 print(
                     '(%s) - portfolio creation: Portfolio "%s" created at broker "%s"' % (
@@ -540,76 +583,178 @@ class SimulatedBroker(Broker):
             )
         return self.portfolios[portfolio_id].portfolio_to_dict()
 
-    def _execute_order(self, dt, portfolio_id, order):
+    def get_portfolio_quantities(self, portfolio_id):
         """
-        For a given portfolio ID string, create a Transaction instance from
-        the provided Order and ensure the Portfolio is appropriately updated
-        with the new information.
+        Return the net quantity of each Asset held within a
+        particular portfolio with ID 'portfolio_id', as a vector
+        aligned to the list of Asset symbol strings.
 
         Parameters
         ----------
-        dt : `pd.Timestamp`
-            The current timestamp.
         portfolio_id : `str`
             The portfolio ID string.
-        order : `Order`
-            The Order instance to create the Transaction for.
+
+        Returns
+        -------
+        `tuple(list[str], np.ndarray, np.ndarray)`
+            The asset symbols, their net quantities and whether
+            each net quantity is an integer.
         """
-        # Obtain a price for the asset, if no price then
-        # raise a ValueError
-        price_err_msg = (
-            "Could not obtain a latest market price for "
-            "Asset with ticker symbol '%s'. Order with ID '%s' was "
-            "not executed." % (
-                order.asset, order.order_id
+        if portfolio_id not in self.portfolios.keys():
+            raise KeyError(
+                "Cannot return portfolio quantities since "
+                "portfolio with ID '%s' does not exist." % portfolio_id
             )
+        return self.portfolios[portfolio_id].portfolio_quantities()
+
+    def _obtain_bid_ask_prices(self, dt, assets):
+        """
+        Obtain the latest bid and ask prices of the provided assets,
+        in a single call if supported by the data handler.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The current timestamp.
+        assets : `list[str]`
+            The asset symbols.
+
+        Returns
+        -------
+        `tuple(np.ndarray, np.ndarray)`
+            The bid and ask prices of the assets.
+        """
+        get_bid_ask_prices = getattr(
+            self.data_handler, 'get_assets_latest_bid_ask_prices', None
         )
-        bid_ask = self.data_handler.get_asset_latest_bid_ask_price(
-            dt, order.asset
+        if get_bid_ask_prices is not None:
+            return get_bid_ask_prices(dt, assets)
+        bid_asks = [
+            self.data_handler.get_asset_latest_bid_ask_price(dt, asset)
+            for asset in assets
+        ]
+        return (
+            np.array([bid_ask[0] for bid_ask in bid_asks], dtype=np.float64),
+            np.array([bid_ask[1] for bid_ask in bid_asks], dtype=np.float64)
         )
-        if bid_ask == (np.nan, np.nan):
-            raise ValueError(price_err_msg)
 
-        # Calculate the consideration and total commission
-        # based on the commission model
-        if order.direction > 0:
-            price = bid_ask[1]
-        else:
-            price = bid_ask[0]
-        consideration = round(price * order.quantity)
-        total_commission = self.fee_model.calc_total_cost(
-            order.asset, order.quantity, consideration, self
+    def _execute_orders(self, dt, orders):
+        """
+        Create a Transaction instance from each of the provided
+        Orders, in turn, and ensure the appropriate Portfolio is
+        updated with the new information.
+
+        The bid and ask prices of all of the ordered assets are
+        obtained upfront, with a single data handler call.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The current timestamp.
+        orders : `list[tuple(str, Order)]`
+            The portfolio ID string and Order instance of
+            each Order to create the Transaction for.
+        """
+        if not orders:
+            return
+
+        assets = list(dict.fromkeys(order.asset for _, order in orders))
+        asset_indices = {asset: idx for idx, asset in enumerate(assets)}
+        bids, asks = self._obtain_bid_ask_prices(dt, assets)
+
+        # Obtain the execution price and consideration of each
+        # order, if no price exists for the asset then raise a ValueError
+        prices = []
+        considerations = []
+        for portfolio_id, order in orders:
+            idx = asset_indices[order.asset]
+            if np.isnan(bids[idx]) and np.isnan(asks[idx]):
+                raise ValueError(
+                    "Could not obtain a latest market price for "
+                    "Asset with ticker symbol '%s'. Order with ID '%s' was "
+                    "not executed." % (
+                        order.asset, order.order_id
+                    )
+                )
+            if order.direction > 0:
+                price = float(asks[idx])
+            else:
+                price = float(bids[idx])
+            prices.append(price)
+            considerations.append(round(price * order.quantity))
+
+        # Calculate the total commission of all orders
+        # in one call, based on the commission model
+        total_commissions = self.fee_model.calc_total_costs(
+            [order.asset for _, order in orders],
+            [order.quantity for _, order in orders],
+            considerations, broker=self
         )
 
-        # Check that sufficient cash exists to carry out the
-        # order, else scale it down
-        est_total_cost = consideration + total_commission
-        total_cash = self.portfolios[portfolio_id].cash
+        for (portfolio_id, order), price, consideration, total_commission in zip(
+            orders, prices, considerations, total_commissions
+        ):
+            total_commission = float(total_commission)
+
+            # Check that sufficient cash exists to carry out the
+            # order, else scale it down
+            est_total_cost = consideration + total_commission
+            total_cash = self.portfolios[portfolio_id].cash
+
+            scaled_quantity = order.quantity
+            if est_total_cost > total_cash:
+                if settings.PRINT_EVENTS:
+                    print(
+                        "WARNING: Estimated transaction size of %0.2f exceeds "
+                        "available cash of %0.2f. Transaction will still occur "
+                        "with a negative cash balance." % (est_total_cost, total_cash)
+                    )
+
+            # Create a transaction entity and update the portfolio
+            txn = Transaction(
+                order.asset, scaled_quantity, self.current_dt,
+                price, order.order_id, commission=total_commission
+            )
+            self.portfolios[portfolio_id].transact_asset(txn)
 
-        scaled_quantity = order.quantity
-        if est_total_cost > total_cash:
+            # The transacted position is valued at the transaction
+            # price and hence requires revaluation at the next update
+            self._revalued_price_dts.pop(portfolio_id, None)
             if settings.PRINT_EVENTS:
                 print(
-                    "WARNING: Estimated transaction size of %0.2f exceeds "
-                    "available cash of %0.2f. Transaction will still occur "
-                    "with a negative cash balance." % (est_total_cost, total_cash)
+                    "(%s) - executed order: %s, qty: %s, price: %0.2f, "
+                    "consideration: %0.2f, commission: %0.2f, total: %0.2f" % (
+                        self.current_dt, order.asset, scaled_quantity, price,
+                        consideration, total_commission,
+                        consideration + total_commission
+                    )
                 )
-
-        # Create a transaction entity and update the portfolio
-        txn = Transaction(
-            order.asset, scaled_quantity, self.current_dt,
-            price, order.order_id, commission=total_commission
-        )
-        self.portfolios[portfolio_id].transact_asset(txn)
-        if settings.PRINT_EVENTS:
-            print(
-                "(%s) - executed order: %s, qty: %s, price: %0.2f, "
-                "consideration: %0.2f, commission: %0.2f, total: %0.2f" % (
-                    self.current_dt, order.asset, scaled_quantity, price,
-                    consideration, total_commission,
-                    consideration + total_commission
+            if self.event_logger.is_enabled():
+                self.event_logger.log(
+                    'order_executed', self.current_dt,
+                    'Order "%s" executed in portfolio "%s" - Asset: %s, Quantity: %s, Price: %0.2f',
+                    order.order_id, portfolio_id, order.asset, scaled_quantity, price,
+                    portfolio_id=portfolio_id, order_id=order.order_id, asset=order.asset,
+                    quantity=scaled_quantity, price=price, consideration=consideration,
+                    commission=total_commission
                 )
-            )
+
+    def _execute_order(self, dt, portfolio_id, order):
+        """
+        For a given portfolio ID string, create a Transaction instance from
+        the provided Order and ensure the Portfolio is appropriately updated
+        with the new information.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The current timestamp.
+        portfolio_id : `str`
+            The portfolio ID string.
+        order : `Order`
+            The Order instance to create the Transaction for.
+        """
+        self._execute_orders(dt, [(portfolio_id, order)])
 
     def submit_order(self, portfolio_id, order):
         """
@@ -631,26 +776,56 @@ class SimulatedBroker(Broker):
         order : `Order`
             The Order instance to submit.
         """
+        self.submit_orders(portfolio_id, [order])
+
+    def submit_orders(self, portfolio_id, orders):
+        """
+        Submit a batch of Order instances to the sub-portfolio
+        with ID 'portfolio_id', all of which are executed by the
+        next update (while the exchange is open) in a single pass,
+        with sell orders executed prior to buy orders.
+
+        Parameters
+        ----------
+        portfolio_id : `str`
+            The portfolio ID string.
+        orders : `list[Order]`
+            The Order instances to submit.
+        """
         # Check that the portfolio actually exists
         if portfolio_id not in self.portfolios.keys():
             raise KeyError(
                 "Portfolio with ID '%s' does not exist. Order with "
                 "ID '%s' was not executed." % (
-                    portfolio_id, order.order_id
+                    portfolio_id, orders[0].order_id if orders else None
                 )
             )
-        self.open_orders[portfolio_id].put(order)
-        if settings.PRINT_EVENTS:
-            print(
-                "(%s) - submitted order: %s, qty: %s" % (
-                    self.current_dt, order.asset, order.quantity
+        self.open_orders[portfolio_id].put_all(orders)
+        for order in orders:
+            if settings.PRINT_EVENTS:
+                print(
+                    "(%s) - submitted order: %s, qty: %s" % (
+                        self.current_dt, order.asset, order.quantity
+                    )
+                )
+            if self.event_logger.is_enabled():
+                self.event_logger.log(
+                    'order_submitted', self.current_dt,
+                    'Order "%s" submitted to portfolio "%s" - Asset: %s, Quantity: %s',
+                    order.order_id, portfolio_id, order.asset, order.quantity,
+                    portfolio_id=portfolio_id, order_id=order.order_id,
+                    asset=order.asset, quantity=order.quantity
                 )
-            )
 
     def update(self, dt):
         """
         Updates the current SimulatedBroker timestamp.
 
+        Portfolio positions are revalued at the latest market prices,
+        unless the data handler reports that no price has changed
+        since the portfolio was last revalued and the portfolio has
+        not transacted since.
+
         Parameters
         ----------
         dt : `pd.Timestamp`
@@ -658,25 +833,40 @@ class SimulatedBroker(Broker):
         """
         self.current_dt = dt
 
+        # Determine when asset prices last changed (if the data
+        # handler supports this), in order to skip the revaluation
+        # of any portfolio already valued at these prices
+        get_latest_price_dt = getattr(self.data_handler, 'get_latest_price_dt', None)
+        price_dt = get_latest_price_dt(dt) if get_latest_price_dt is not None else None
+
         # Update portfolio asset values
         for portfolio in self.portfolios:
-            for asset in self.portfolios[portfolio].pos_handler.positions:
-                mid_price = self.data_handler.get_asset_latest_mid_price(
-                    dt, asset
-                )
+            if price_dt is not None and self._revalued_price_dts.get(portfolio) == price_dt:
+                continue
+            assets = list(self.portfolios[portfolio].pos_handler.positions)
+            if price_dt is not None:
+                self._revalued_price_dts[portfolio] = price_dt
+            if not assets:
+                continue
+            mid_prices = self.data_handler.get_assets_latest_prices(
+                dt, assets, side='mid'
+            )
+            for asset, mid_price in zip(assets, mid_prices):
                 self.portfolios[portfolio].update_market_value_of_asset(
                     asset, mid_price, self.current_dt
                 )
 
-        # Try to execute orders
+        # Try to execute orders, with the sell orders of all
+        # portfolios executed prior to the buy orders
         if self.exchange.is_open_at_datetime(self.current_dt):
-            orders = []
-            for portfolio in self.portfolios:
-                while not self.open_orders[portfolio].empty():
-                    orders.append(
-                        (portfolio, self.open_orders[portfolio].get())
-                    )
-
-            sorted_orders = sorted(orders, key=lambda x: x[1].direction)
-            for portfolio, order in sorted_orders:
-                self._execute_order(dt, portfolio, order)
+            portfolio_orders = [
+                [
+                    (portfolio, order) for order in
+                    self.open_orders[portfolio].drain(sort_by_direction=True)
+                ]
+                for portfolio in self.portfolios
+            ]
+            sorted_orders = list(
+                heapq.merge(*portfolio_orders, key=lambda x: x[1].direction)
+            )
+            self._execute_orders(dt, sorted_orders)
@@ -22,6 +22,11 @@ class Transaction(object):
         The trading commission
     """
 
+    __slots__ = (
+        'asset', 'quantity', 'direction', 'dt',
+        'price', 'order_id', 'commission'
+    )
+
     def __init__(
         self,
         asset,
@@ -64,6 +64,70 @@ class BacktestDataHandler(object):
             mid = np.nan
         return mid
 
+    def get_latest_price_dt(self, dt):
+        """
+        Obtain the latest timestamp, at or before the provided
+        timestamp, at which the price of any asset of any data
+        source changes.
+
+        Returns None if any data source is unable to determine
+        this, in which case prices must be assumed to change at
+        every timestamp.
+        """
+        latest_dts = []
+        for ds in self.data_sources:
+            get_latest_price_dt = getattr(ds, 'get_latest_price_dt', None)
+            if get_latest_price_dt is None:
+                return None
+            latest_dt = get_latest_price_dt(dt)
+            if latest_dt is None:
+                return None
+            latest_dts.append(latest_dt)
+        return max(latest_dts) if latest_dts else None
+
+    def get_assets_latest_prices(self, dt, asset_symbols, side='mid'):
+        """
+        Obtain the latest prices of a basket of assets in a single
+        call, querying each data source in turn for any assets
+        that have not yet been priced.
+
+        For consistency with get_asset_latest_bid_ask_price the
+        'mid' price is currently calculated solely from the bid.
+        """
+        # TODO: Check for assets in Universe
+        if side not in ('bid', 'ask', 'mid'):
+            raise ValueError(
+                'Unknown price side "%s" provided. Must be one of '
+                '"bid", "ask" or "mid".' % side
+            )
+        source_side = 'ask' if side == 'ask' else 'bid'
+        prices = np.full(len(asset_symbols), np.nan)
+        for ds in self.data_sources:
+            missing = np.isnan(prices)
+            if not missing.any():
+                break
+            try:
+                ds_prices = ds.get_assets_latest_prices(
+                    dt, asset_symbols, side=source_side
+                )
+            except Exception:
+                continue
+            prices[missing] = ds_prices[missing]
+        if side == 'mid':
+            return (prices + prices) / 2.0
+        return prices
+
+    def get_assets_latest_bid_ask_prices(self, dt, asset_symbols):
+        """
+        Obtain the latest bid and ask prices of a basket of assets
+        in a single call.
+
+        For consistency with get_asset_latest_bid_ask_price the
+        ask prices are currently the bid prices.
+        """
+        bids = self.get_assets_latest_prices(dt, asset_symbols, side='bid')
+        return (bids, bids.copy())
+
     def get_assets_historical_range_close_price(
         self, start_dt, end_dt, asset_symbols, adjusted=False
     ):
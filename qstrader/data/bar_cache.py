@@ -0,0 +1,237 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+
+class DailyBarCache(object):
+    """
+    On-disk binary columnar cache of the DataFrames derived from
+    daily 'bar' CSV files.
+
+    Each cached DataFrame is stored as one uncompressed NumPy '.npy'
+    file per column, along with its timestamp index and a small JSON
+    metadata file. Cached DataFrames are memory-mapped on load, such
+    that repeated backtests avoid re-parsing (and re-converting) the
+    underlying CSV text entirely.
+
+    Cache entries are keyed by the absolute path, modification time
+    and size of the CSV file, along with any provided options that
+    affect the conversion (such as whether prices are adjusted).
+    Modifying a CSV file therefore invalidates its cache entry, which
+    is replaced on the next save.
+
+    Parameters
+    ----------
+    cache_dir : `str`
+        The full path to the directory in which to store the cache.
+    """
+
+    CACHE_VERSION = 1
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def _hash(value):
+        """
+        Create a short filesystem-safe digest of the provided string.
+
+        Parameters
+        ----------
+        value : `str`
+            The string to hash.
+
+        Returns
+        -------
+        `str`
+            The hexadecimal digest.
+        """
+        return hashlib.sha1(value.encode('utf-8')).hexdigest()[:16]
+
+    def _file_dir(self, csv_path):
+        """
+        Obtain the directory containing all cache entries for a
+        single CSV file.
+
+        Parameters
+        ----------
+        csv_path : `str`
+            The full path to the CSV file.
+
+        Returns
+        -------
+        `str`
+            The full path to the cache directory of the CSV file.
+        """
+        return os.path.join(
+            self.cache_dir, self._hash(os.path.abspath(csv_path))
+        )
+
+    def _version_dir(self, csv_path):
+        """
+        Obtain the directory containing all cache entries for the
+        current version (modification time and size) of a CSV file.
+
+        Parameters
+        ----------
+        csv_path : `str`
+            The full path to the CSV file.
+
+        Returns
+        -------
+        `str`
+            The full path to the cache directory of the file version.
+        """
+        stat = os.stat(csv_path)
+        key = repr(
+            (
+                os.path.abspath(csv_path),
+                stat.st_mtime_ns,
+                stat.st_size,
+                self.CACHE_VERSION
+            )
+        )
+        return os.path.join(self._file_dir(csv_path), self._hash(key))
+
+    def _entry_dir(self, csv_path, options):
+        """
+        Obtain the directory of the cache entry for the current
+        version of the CSV file and the provided options.
+
+        Parameters
+        ----------
+        csv_path : `str`
+            The full path to the CSV file.
+        options : `dict`
+            The conversion options that the cached data depends upon.
+
+        Returns
+        -------
+        `str`
+            The full path to the cache entry directory.
+        """
+        return os.path.join(
+            self._version_dir(csv_path),
+            self._hash(repr(sorted(options.items())))
+        )
+
+    def load(self, csv_path, name, options):
+        """
+        Load a memory-mapped DataFrame from the cache, if present.
+
+        Parameters
+        ----------
+        csv_path : `str`
+            The full path to the CSV file the DataFrame was derived from.
+        name : `str`
+            The name of the cached DataFrame, e.g. 'bar' or 'bid_ask'.
+        options : `dict`
+            The conversion options that the cached data depends upon.
+
+        Returns
+        -------
+        `pd.DataFrame` or None
+            The cached DataFrame, or None if no valid entry exists.
+        """
+        frame_dir = os.path.join(self._entry_dir(csv_path, options), name)
+        try:
+            with open(os.path.join(frame_dir, 'meta.json')) as meta_file:
+                meta = json.load(meta_file)
+            index = pd.DatetimeIndex(
+                np.load(
+                    os.path.join(frame_dir, 'index.npy'), mmap_mode='r'
+                ).view(np.ndarray),
+                name=meta['index_name']
+            )
+            columns = {
+                column: np.load(
+                    os.path.join(frame_dir, '%d.npy' % i), mmap_mode='r'
+                ).view(np.ndarray) for i, column in enumerate(meta['columns'])
+            }
+        except (OSError, ValueError, KeyError):
+            return None
+        if meta['tz'] is not None:
+            index = index.tz_localize(meta['tz'])
+        return pd.DataFrame(columns, index=index, copy=False)
+
+    def save(self, csv_path, name, options, df):
+        """
+        Save a DataFrame into the cache, replacing any stale entries
+        for previous versions of the CSV file.
+
+        DataFrames that are not indexed by timestamp or that contain
+        non-numeric columns cannot be stored as plain NumPy arrays
+        and are not cached.
+
+        Parameters
+        ----------
+        csv_path : `str`
+            The full path to the CSV file the DataFrame was derived from.
+        name : `str`
+            The name of the cached DataFrame, e.g. 'bar' or 'bid_ask'.
+        options : `dict`
+            The conversion options that the cached data depends upon.
+        df : `pd.DataFrame`
+            The DataFrame to cache.
+
+        Returns
+        -------
+        `Boolean`
+            Whether the DataFrame was cached.
+        """
+        if not isinstance(df.index, pd.DatetimeIndex):
+            return False
+        if not all(
+            isinstance(dtype, np.dtype) and dtype.kind in 'biuf'
+            for dtype in df.dtypes
+        ):
+            return False
+
+        file_dir = self._file_dir(csv_path)
+        version_dir = self._version_dir(csv_path)
+        entry_dir = self._entry_dir(csv_path, options)
+        frame_dir = os.path.join(entry_dir, name)
+        if os.path.isdir(frame_dir):
+            return True
+
+        # Remove entries for previous versions of the CSV file
+        if os.path.isdir(file_dir):
+            for version in os.listdir(file_dir):
+                stale_dir = os.path.join(file_dir, version)
+                if stale_dir != version_dir:
+                    shutil.rmtree(stale_dir, ignore_errors=True)
+        os.makedirs(entry_dir, exist_ok=True)
+
+        # Write into a temporary directory which is then renamed, such
+        # that concurrent readers never observe a partial entry
+        tmp_dir = tempfile.mkdtemp(dir=entry_dir, prefix='.tmp-')
+        try:
+            np.save(
+                os.path.join(tmp_dir, 'index.npy'),
+                df.index.tz_localize(None).to_numpy(),
+                allow_pickle=False
+            )
+            for i, column in enumerate(df.columns):
+                np.save(
+                    os.path.join(tmp_dir, '%d.npy' % i),
+                    df[column].to_numpy(),
+                    allow_pickle=False
+                )
+            meta = {
+                'columns': [str(column) for column in df.columns],
+                'index_name': df.index.name,
+                'tz': None if df.index.tz is None else str(df.index.tz)
+            }
+            with open(os.path.join(tmp_dir, 'meta.json'), 'w') as meta_file:
+                json.dump(meta, meta_file)
+            os.rename(tmp_dir, frame_dir)
+        except OSError:
+            # Another process may have concurrently written the entry
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return os.path.isdir(frame_dir)
+        return True
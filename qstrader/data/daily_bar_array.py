@@ -0,0 +1,268 @@
+import numpy as np
+import pandas as pd
+
+from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
+from qstrader.data.price_store import BidAskPriceStore
+
+
+class ArrayDailyBarDataSource(CSVDailyBarDataSource):
+    """
+    Encapsulates loading, preparation and querying of CSV files of
+    daily 'bar' OHLCV data, with the timestamped opening and closing
+    prices held in a columnar BidAskPriceStore.
+
+    Bid/ask queries are answered by a binary search over contiguous
+    NumPy arrays rather than by indexing into a Pandas DataFrame,
+    avoiding both the per-call construction of temporary Pandas
+    objects and the need for an (unbounded) lookup cache.
+
+    Unlike CSVDailyBarDataSource, queries made prior to the first
+    available price of an asset return NaN.
+
+    Parameters
+    ----------
+    csv_dir : `str`
+        The full path to the directory where the CSV is located.
+    asset_type : `str`
+        The asset type that the price/volume data is for.
+    adjust_prices : `Boolean`, optional
+        Whether to utilise corporate-action adjusted prices for both
+        the open and closing prices. Defaults to True.
+    csv_symbols : `list`, optional
+        An optional list of CSV symbols to restrict the data source to.
+        The alternative is to convert all CSVs found within the
+        provided directory.
+    cache_dir : `str`, optional
+        An optional directory in which to cache the parsed and converted
+        price data in a binary columnar format.
+    n_workers : `int`, optional
+        The number of worker processes with which to parse and convert
+        the CSV files in parallel. Defaults to serial processing.
+    lazy : `Boolean`, optional
+        Whether to defer loading each CSV file until its asset is first
+        queried. Defaults to False.
+    max_resident_assets : `int`, optional
+        When loading lazily, an optional bound on the number of assets
+        held in memory at once.
+    market_open_offset : `pd.Timedelta`, optional
+        The offset from midnight (UTC) at which to timestamp the opening
+        price of each bar. Defaults to 14:30.
+    market_close_offset : `pd.Timedelta`, optional
+        The offset from midnight (UTC) at which to timestamp the closing
+        price of each bar. Defaults to 21:00.
+    """
+
+    def __init__(
+        self, csv_dir, asset_type, adjust_prices=True,
+        csv_symbols=None, cache_dir=None, n_workers=None,
+        lazy=False, max_resident_assets=None,
+        market_open_offset=pd.Timedelta(hours=14, minutes=30),
+        market_close_offset=pd.Timedelta(hours=21, minutes=0)
+    ):
+        super().__init__(
+            csv_dir, asset_type, adjust_prices=adjust_prices,
+            csv_symbols=csv_symbols, cache_dir=cache_dir, n_workers=n_workers,
+            lazy=lazy, max_resident_assets=max_resident_assets,
+            market_open_offset=market_open_offset,
+            market_close_offset=market_close_offset
+        )
+        self.shared_store = None
+        self.price_store = self._create_price_store()
+
+    @classmethod
+    def from_shared_price_store(cls, shared_store, asset_type):
+        """
+        Create a data source attached to prices previously published
+        into a SharedPriceStore, rather than loading any CSV files.
+
+        All price queries are answered from read-only views onto the
+        shared prices. The per-asset bar and bid/ask DataFrames are
+        not materialised and hence these dictionaries are left empty.
+
+        Parameters
+        ----------
+        shared_store : `SharedPriceStore`
+            The published prices.
+        asset_type : `str`
+            The asset type that the price/volume data is for.
+
+        Returns
+        -------
+        `ArrayDailyBarDataSource`
+            The attached data source.
+        """
+        data_source = cls.__new__(cls)
+        data_source.csv_dir = None
+        data_source.asset_type = asset_type
+        data_source.adjust_prices = shared_store.meta['adjust_prices']
+        data_source.csv_symbols = shared_store.assets
+        data_source.cache = None
+        data_source.n_workers = None
+        data_source.lazy = False
+        data_source.max_resident_assets = None
+        data_source.market_open_offset = pd.Timedelta(
+            shared_store.meta['market_open_offset']
+        )
+        data_source.market_close_offset = pd.Timedelta(
+            shared_store.meta['market_close_offset']
+        )
+        data_source.asset_csv_paths = {}
+        data_source._parallel_bid_ask_results = {}
+        data_source._price_timestamps = None
+        data_source.asset_bar_frames = {}
+        data_source.asset_bid_ask_frames = {}
+        data_source.shared_store = shared_store
+        data_source.price_store = shared_store.create_price_store()
+        return data_source
+
+    def _create_price_store(self):
+        """
+        Convert the individually-timestamped open/closing price
+        DataFrames into a columnar price store.
+
+        Returns
+        -------
+        `BidAskPriceStore`
+            The price store of all loaded assets.
+        """
+        return BidAskPriceStore.from_bid_ask_frames(self.asset_bid_ask_frames)
+
+    def _obtain_price_timestamps(self):
+        """
+        Obtain the sorted unique timestamps (as int64 UTC epoch
+        nanoseconds) at which the price of any asset changes.
+
+        Returns
+        -------
+        `np.ndarray`
+            The price timestamps.
+        """
+        return np.unique(self.price_store.pack()['timestamps'])
+
+    def _on_asset_loaded(self, asset):
+        """
+        Add a lazily loaded asset to the price store.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol.
+        """
+        self.price_store.add_asset_from_frame(
+            asset, self.asset_bid_ask_frames[asset]
+        )
+
+    def _on_asset_evicted(self, asset):
+        """
+        Remove a discarded lazily loaded asset from the price store.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol.
+        """
+        self.price_store.remove_asset(asset)
+
+    def get_bid(self, dt, asset):
+        """
+        Obtain the bid price of an asset at the provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the bid price for.
+        asset : `str`
+            The asset symbol to obtain the bid price for.
+
+        Returns
+        -------
+        `float`
+            The bid price.
+        """
+        if self.lazy:
+            self._ensure_assets_loaded([asset])
+        return self.price_store.get_bid(dt, asset)
+
+    def get_ask(self, dt, asset):
+        """
+        Obtain the ask price of an asset at the provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the ask price for.
+        asset : `str`
+            The asset symbol to obtain the ask price for.
+
+        Returns
+        -------
+        `float`
+            The ask price.
+        """
+        if self.lazy:
+            self._ensure_assets_loaded([asset])
+        return self.price_store.get_ask(dt, asset)
+
+    def get_assets_historical_closes(self, start_dt, end_dt, assets):
+        """
+        Obtain a multi-asset historical range of closing prices as a DataFrame,
+        indexed by timestamp with asset symbols as columns.
+
+        Parameters
+        ----------
+        start_dt : `pd.Timestamp`
+            The starting datetime of the range to obtain.
+        end_dt : `pd.Timestamp`
+            The ending datetime of the range to obtain.
+        assets : `list[str]`
+            The list of asset symbols to obtain closing prices for.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The multi-asset closing prices DataFrame.
+        """
+        if self.shared_store is None:
+            return super().get_assets_historical_closes(start_dt, end_dt, assets)
+        close_series = [
+            self.shared_store.get_closes(asset, start_dt, end_dt)
+            for asset in assets if asset in self.shared_store
+        ]
+        return pd.concat(close_series, axis=1).dropna(how='all')
+
+    def get_assets_latest_prices(self, dt, assets, side='mid'):
+        """
+        Obtain the latest bid, ask or mid prices of multiple assets
+        at the provided timestamp via a single vectorised lookup.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the prices for.
+        assets : `list[str]`
+            The asset symbols to obtain the prices for.
+        side : `str`, optional
+            One of 'bid', 'ask' or 'mid'. Defaults to 'mid'.
+
+        Returns
+        -------
+        `np.ndarray`
+            The prices aligned to the provided assets, with NaN for
+            any assets that are not available within the data source.
+        """
+        if self.lazy:
+            self._ensure_assets_loaded(assets)
+        if side == 'bid':
+            return self.price_store.get_bids(dt, assets)
+        elif side == 'ask':
+            return self.price_store.get_asks(dt, assets)
+        elif side == 'mid':
+            return (
+                self.price_store.get_bids(dt, assets) +
+                self.price_store.get_asks(dt, assets)
+            ) / 2.0
+        else:
+            raise ValueError(
+                'Unknown price side "%s" provided. Must be one of '
+                '"bid", "ask" or "mid".' % side
+            )
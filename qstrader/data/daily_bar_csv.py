@@ -1,3 +1,5 @@
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 import functools
 import os
 
@@ -5,6 +7,7 @@ import numpy as np
 import pandas as pd
 import pytz
 from qstrader import settings
+from qstrader.data.bar_cache import DailyBarCache
 
 
 class CSVDailyBarDataSource(object):
@@ -30,16 +33,62 @@ class CSVDailyBarDataSource(object):
         An optional list of CSV symbols to restrict the data source to.
         The alternative is to convert all CSVs found within the
         provided directory.
+    cache_dir : `str`, optional
+        An optional directory in which to cache the parsed and converted
+        price data in a binary columnar format. Subsequent data sources
+        created over unmodified CSV files memory-map the cached arrays
+        rather than re-parsing the CSV files.
+    n_workers : `int`, optional
+        The number of worker processes with which to parse and convert
+        the CSV files in parallel. Defaults to None, which processes
+        the CSV files serially within the current process.
+    lazy : `Boolean`, optional
+        Whether to defer loading each CSV file until its asset is first
+        queried, rather than loading all CSV files upon construction.
+        Defaults to False.
+    max_resident_assets : `int`, optional
+        When loading lazily, an optional bound on the number of assets
+        held in memory at once. The least recently queried assets are
+        discarded (and reloaded if subsequently queried) once exceeded.
+    market_open_offset : `pd.Timedelta`, optional
+        The offset from midnight (UTC) at which to timestamp the opening
+        price of each bar. Defaults to 14:30.
+    market_close_offset : `pd.Timedelta`, optional
+        The offset from midnight (UTC) at which to timestamp the closing
+        price of each bar. Defaults to 21:00.
     """
 
-    def __init__(self, csv_dir, asset_type, adjust_prices=True, csv_symbols=None):
+    def __init__(
+        self, csv_dir, asset_type, adjust_prices=True,
+        csv_symbols=None, cache_dir=None, n_workers=None,
+        lazy=False, max_resident_assets=None,
+        market_open_offset=pd.Timedelta(hours=14, minutes=30),
+        market_close_offset=pd.Timedelta(hours=21, minutes=0)
+    ):
         self.csv_dir = csv_dir
         self.asset_type = asset_type
         self.adjust_prices = adjust_prices
         self.csv_symbols = csv_symbols
-
-        self.asset_bar_frames = self._load_csvs_into_dfs()
-        self.asset_bid_ask_frames = self._convert_bars_into_bid_ask_dfs()
+        self.cache = DailyBarCache(cache_dir) if cache_dir is not None else None
+        self.n_workers = n_workers
+        self.lazy = lazy
+        self.max_resident_assets = max_resident_assets
+        self.market_open_offset = pd.Timedelta(market_open_offset)
+        self.market_close_offset = pd.Timedelta(market_close_offset)
+
+        self.asset_csv_paths = {}
+        self._parallel_bid_ask_results = {}
+        self._price_timestamps = None
+        if self.lazy:
+            self.asset_csv_files = {
+                self._obtain_asset_symbol_from_filename(csv_file): csv_file
+                for csv_file in self._obtain_csv_files_to_load()
+            }
+            self.asset_bar_frames = OrderedDict()
+            self.asset_bid_ask_frames = OrderedDict()
+        else:
+            self.asset_bar_frames = self._load_csvs_into_dfs()
+            self.asset_bid_ask_frames = self._convert_bars_into_bid_ask_dfs()
 
     def _obtain_asset_csv_files(self):
         """
@@ -55,6 +104,22 @@ class CSVDailyBarDataSource(object):
             if file.endswith('.csv')
         ]
 
+    def _obtain_csv_files_to_load(self):
+        """
+        Obtain the list of CSV filenames that the data source is
+        restricted to, or otherwise all those in the CSV directory.
+
+        Returns
+        -------
+        `list[str]`
+            The list of CSV filenames.
+        """
+        if self.csv_symbols is not None:
+            # TODO/NOTE: This assumes existence of CSV symbols
+            # within the provided directory.
+            return ['%s.csv' % symbol for symbol in self.csv_symbols]
+        return self._obtain_asset_csv_files()
+
     def _obtain_asset_symbol_from_filename(self, csv_file):
         """
         Return the QSTrader symbology for the asset.
@@ -73,6 +138,63 @@ class CSVDailyBarDataSource(object):
         """
         return 'EQ:%s' % csv_file.replace('.csv', '')
 
+    def _cache_options(self):
+        """
+        The data source options that the cached price data depends upon.
+
+        Returns
+        -------
+        `dict`
+            The conversion options.
+        """
+        return {
+            'adjust_prices': self.adjust_prices,
+            'market_open_offset': self.market_open_offset.value,
+            'market_close_offset': self.market_close_offset.value
+        }
+
+    def _load_cached_frame(self, asset_symbol, name):
+        """
+        Load a previously cached DataFrame for an asset, if caching
+        is enabled and an up to date cache entry exists.
+
+        Parameters
+        ----------
+        asset_symbol : `str`
+            The asset symbol.
+        name : `str`
+            The name of the cached DataFrame, 'bar' or 'bid_ask'.
+
+        Returns
+        -------
+        `pd.DataFrame` or None
+            The cached DataFrame, or None if unavailable.
+        """
+        if self.cache is None or asset_symbol not in self.asset_csv_paths:
+            return None
+        return self.cache.load(
+            self.asset_csv_paths[asset_symbol], name, self._cache_options()
+        )
+
+    def _save_cached_frame(self, asset_symbol, name, df):
+        """
+        Save a DataFrame for an asset into the cache, if caching is enabled.
+
+        Parameters
+        ----------
+        asset_symbol : `str`
+            The asset symbol.
+        name : `str`
+            The name of the cached DataFrame, 'bar' or 'bid_ask'.
+        df : `pd.DataFrame`
+            The DataFrame to cache.
+        """
+        if self.cache is None or asset_symbol not in self.asset_csv_paths:
+            return
+        self.cache.save(
+            self.asset_csv_paths[asset_symbol], name, self._cache_options(), df
+        )
+
     def _load_csv_into_df(self, csv_file):
         """
         Loads the CSV file into a Pandas DataFrame with dates parsed,
@@ -110,22 +232,109 @@ class CSVDailyBarDataSource(object):
         """
         if settings.PRINT_EVENTS:
             print("Loading CSV files into DataFrames...")
-        if self.csv_symbols is not None:
-            # TODO/NOTE: This assumes existence of CSV symbols
-            # within the provided directory.
-            csv_files = ['%s.csv' % symbol for symbol in self.csv_symbols]
-        else:
-            csv_files = self._obtain_asset_csv_files()
+        csv_files = self._obtain_csv_files_to_load()
+
+        if self.n_workers is not None and self.n_workers > 1 and len(csv_files) > 1:
+            return self._load_csvs_into_dfs_parallel(csv_files)
 
         asset_frames = {}
         for csv_file in csv_files:
             asset_symbol = self._obtain_asset_symbol_from_filename(csv_file)
             if settings.PRINT_EVENTS:
                 print("Loading CSV file for symbol '%s'..." % asset_symbol)
-            csv_df = self._load_csv_into_df(csv_file)
-            asset_frames[asset_symbol] = csv_df
+            asset_frames[asset_symbol] = self._load_bar_frame(asset_symbol, csv_file)
         return asset_frames
 
+    def _load_csvs_into_dfs_parallel(self, csv_files):
+        """
+        Load and convert all of the provided CSV files across a pool
+        of worker processes.
+
+        The converted bid/ask DataFrames (or any errors raised while
+        converting) are retained until _convert_bars_into_bid_ask_dfs
+        is called, such that all output and errors occur in the same
+        order as for serial loading.
+
+        Parameters
+        ----------
+        csv_files : `list[str]`
+            The names of the CSV files to load.
+
+        Returns
+        -------
+        `dict{pd.DataFrame}`
+            The asset-symbol keyed dictionary of Pandas DataFrames
+            containing the timestamped price/volume data.
+        """
+        chunksize = max(1, len(csv_files) // (self.n_workers * 4))
+        with ProcessPoolExecutor(max_workers=self.n_workers) as executor:
+            results = list(
+                executor.map(
+                    functools.partial(_load_and_convert_csv_file, self),
+                    csv_files, chunksize=chunksize
+                )
+            )
+
+        asset_frames = {}
+        for csv_file, (bar_df, bid_ask_df, error) in zip(csv_files, results):
+            asset_symbol = self._obtain_asset_symbol_from_filename(csv_file)
+            if settings.PRINT_EVENTS:
+                print("Loading CSV file for symbol '%s'..." % asset_symbol)
+            self.asset_csv_paths[asset_symbol] = os.path.join(self.csv_dir, csv_file)
+            if bar_df is None:
+                raise error
+            asset_frames[asset_symbol] = bar_df
+            self._parallel_bid_ask_results[asset_symbol] = (bid_ask_df, error)
+        return asset_frames
+
+    def _load_bar_frame(self, asset_symbol, csv_file):
+        """
+        Load the daily 'bar' DataFrame of a single asset, from the
+        cache if available or otherwise from its CSV file.
+
+        Parameters
+        ----------
+        asset_symbol : `str`
+            The asset symbol.
+        csv_file : `str`
+            The name of the CSV file.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            DataFrame of the CSV file with timestamps localised to UTC.
+        """
+        self.asset_csv_paths[asset_symbol] = os.path.join(self.csv_dir, csv_file)
+        bar_df = self._load_cached_frame(asset_symbol, 'bar')
+        if bar_df is None:
+            bar_df = self._load_csv_into_df(csv_file)
+            self._save_cached_frame(asset_symbol, 'bar', bar_df)
+        return bar_df
+
+    def _load_bid_ask_frame(self, asset_symbol, bar_df):
+        """
+        Obtain the individually-timestamped open/closing price DataFrame
+        of a single asset, from the cache if available or otherwise by
+        converting its daily 'bar' DataFrame.
+
+        Parameters
+        ----------
+        asset_symbol : `str`
+            The asset symbol.
+        bar_df : `pd.DataFrame`
+            The daily 'bar' OHLCV DataFrame.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The individually-timestamped open/closing prices.
+        """
+        bid_ask_df = self._load_cached_frame(asset_symbol, 'bid_ask')
+        if bid_ask_df is None:
+            bid_ask_df = self._convert_bar_frame_into_bid_ask_df(bar_df)
+            self._save_cached_frame(asset_symbol, 'bid_ask', bid_ask_df)
+        return bid_ask_df
+
     def _convert_bar_frame_into_bid_ask_df(self, bar_df):
         """
         Converts the DataFrame from daily OHLCV 'bars' into a DataFrame
@@ -145,7 +354,8 @@ class CSVDailyBarDataSource(object):
             The individually-timestamped open/closing prices, optionally
             adjusted for corporate actions.
         """
-        bar_df = bar_df.sort_index()
+        if not bar_df.index.is_monotonic_increasing:
+            bar_df = bar_df.sort_index()
         if self.adjust_prices:
             if 'Adj Close' not in bar_df.columns:
                 raise ValueError(
@@ -153,29 +363,46 @@ class CSVDailyBarDataSource(object):
                     "Prices cannot be adjusted. Exiting."
                 )
 
-            # Restrict solely to the open/closing prices
-            oc_df = bar_df.loc[:, ['Open', 'Close', 'Adj Close']]
-
             # Adjust opening prices
-            oc_df['Adj Open'] = (oc_df['Adj Close'] / oc_df['Close']) * oc_df['Open']
-            oc_df = oc_df.loc[:, ['Adj Open', 'Adj Close']]
-            oc_df.columns = ['Open', 'Close']
+            close = bar_df['Close'].to_numpy(dtype=np.float64)
+            adj_close = bar_df['Adj Close'].to_numpy(dtype=np.float64)
+            open_prices = (adj_close / close) * bar_df['Open'].to_numpy(dtype=np.float64)
+            close_prices = adj_close
         else:
-            oc_df = bar_df.loc[:, ['Open', 'Close']]
-
-        # Convert bars into separate rows for open/close prices
-        # appropriately timestamped
-        seq_oc_df = oc_df.T.unstack(level=0).reset_index()
-        seq_oc_df.columns = ['Date', 'Market', 'Price']
-        seq_oc_df.loc[seq_oc_df['Market'] == 'Open', 'Date'] += pd.Timedelta(hours=14, minutes=30)
-        seq_oc_df.loc[seq_oc_df['Market'] == 'Close', 'Date'] += pd.Timedelta(hours=21, minutes=00)
+            open_prices = bar_df['Open'].to_numpy(dtype=np.float64)
+            close_prices = bar_df['Close'].to_numpy(dtype=np.float64)
+
+        # Interleave the open/close prices into separate, appropriately
+        # timestamped, rows for each bar
+        open_dts = bar_df.index + self.market_open_offset
+        close_dts = (bar_df.index + self.market_close_offset).as_unit(open_dts.unit)
+        timestamps = np.empty(2 * len(bar_df), dtype=np.int64)
+        timestamps[0::2] = open_dts.asi8
+        timestamps[1::2] = close_dts.asi8
+        prices = np.empty(2 * len(bar_df), dtype=np.float64)
+        prices[0::2] = open_prices
+        prices[1::2] = close_prices
+
+        # Forward-fill missing prices from the previous open/close
+        missing = np.isnan(prices)
+        if missing.any():
+            valid = np.where(missing, 0, np.arange(len(prices)))
+            prices = prices[np.maximum.accumulate(valid)]
+
+        if np.any(timestamps[1:] < timestamps[:-1]):
+            order = np.argsort(timestamps, kind='stable')
+            timestamps = timestamps[order]
+            prices = prices[order]
+        timestamps = pd.DatetimeIndex(
+            timestamps.view('datetime64[%s]' % open_dts.unit), name='Date'
+        )
+        if open_dts.tz is not None:
+            timestamps = timestamps.tz_localize(pytz.UTC).tz_convert(open_dts.tz)
 
         # TODO: Unable to distinguish between Bid/Ask, implement later
-        dp_df = seq_oc_df[['Date', 'Price']]
-        dp_df['Bid'] = dp_df['Price']
-        dp_df['Ask'] = dp_df['Price']
-        dp_df = dp_df.loc[:, ['Date', 'Bid', 'Ask']].ffill().set_index('Date').sort_index()
-        return dp_df
+        return pd.DataFrame(
+            {'Bid': prices, 'Ask': prices}, index=timestamps, copy=False
+        )
 
     def _convert_bars_into_bid_ask_dfs(self):
         """
@@ -193,11 +420,171 @@ class CSVDailyBarDataSource(object):
         for asset_symbol, bar_df in self.asset_bar_frames.items():
             if settings.PRINT_EVENTS:
                 print("Adjusting CSV file for symbol '%s'..." % asset_symbol)
-            asset_bid_ask_frames[asset_symbol] = \
-                self._convert_bar_frame_into_bid_ask_df(bar_df)
+            if asset_symbol in self._parallel_bid_ask_results:
+                bid_ask_df, error = self._parallel_bid_ask_results.pop(asset_symbol)
+                if error is not None:
+                    raise error
+            else:
+                bid_ask_df = self._load_bid_ask_frame(asset_symbol, bar_df)
+            asset_bid_ask_frames[asset_symbol] = bid_ask_df
         return asset_bid_ask_frames
 
+    def _load_asset(self, asset_symbol):
+        """
+        Load and convert the CSV file of a single asset on demand,
+        when loading lazily.
+
+        Parameters
+        ----------
+        asset_symbol : `str`
+            The asset symbol.
+        """
+        if settings.PRINT_EVENTS:
+            print("Loading CSV file for symbol '%s'..." % asset_symbol)
+        bar_df = self._load_bar_frame(
+            asset_symbol, self.asset_csv_files[asset_symbol]
+        )
+        if settings.PRINT_EVENTS:
+            print("Adjusting CSV file for symbol '%s'..." % asset_symbol)
+        bid_ask_df = self._load_bid_ask_frame(asset_symbol, bar_df)
+        self.asset_bar_frames[asset_symbol] = bar_df
+        self.asset_bid_ask_frames[asset_symbol] = bid_ask_df
+        self._on_asset_loaded(asset_symbol)
+
+    def _evict_assets(self, keep):
+        """
+        Discard the least recently queried assets until the number of
+        resident assets is within the bound, never discarding assets
+        that are required by the current query.
+
+        Parameters
+        ----------
+        keep : `set[str]`
+            The asset symbols required by the current query.
+        """
+        excess = len(self.asset_bid_ask_frames) - self.max_resident_assets
+        if excess <= 0:
+            return
+        evicted = [
+            asset for asset in self.asset_bid_ask_frames if asset not in keep
+        ][:excess]
+        for asset in evicted:
+            del self.asset_bar_frames[asset]
+            del self.asset_bid_ask_frames[asset]
+            self._on_asset_evicted(asset)
+
+    def _ensure_assets_loaded(self, assets):
+        """
+        When loading lazily, ensure that the provided assets are loaded
+        (if available) and mark them as the most recently queried.
+
+        The bound on resident assets is enforced whenever an asset
+        is loaded.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbols about to be queried.
+        """
+        if not self.lazy:
+            return
+        loaded = False
+        for asset in assets:
+            if asset in self.asset_bid_ask_frames:
+                self.asset_bid_ask_frames.move_to_end(asset)
+            elif asset in self.asset_csv_files:
+                self._load_asset(asset)
+                loaded = True
+        if loaded and self.max_resident_assets is not None:
+            self._evict_assets(set(assets))
+
+    def _on_asset_loaded(self, asset):
+        """
+        Called whenever an asset is lazily loaded. Allows subclasses
+        to maintain any derived data structures.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol.
+        """
+        pass
+
+    def _on_asset_evicted(self, asset):
+        """
+        Called whenever a lazily loaded asset is discarded. Allows
+        subclasses to maintain any derived data structures.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol.
+        """
+        pass
+
+    def _lookup_price(self, dt, asset, column):
+        """
+        Obtain the bid or ask price of a resident asset at the
+        provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the price for.
+        asset : `str`
+            The asset symbol to obtain the price for.
+        column : `str`
+            Either 'Bid' or 'Ask'.
+
+        Returns
+        -------
+        `float`
+            The price.
+        """
+        bid_ask_df = self.asset_bid_ask_frames[asset]
+        series = bid_ask_df.iloc[bid_ask_df.index.get_indexer([dt], method='pad')][column]
+        try:
+            price = series.iloc[0]
+        except KeyError:  # Before start date
+            return np.nan
+        return price
+
     @functools.lru_cache(maxsize=1024 * 1024)
+    def _get_cached_price(self, dt, asset, column):
+        """
+        Memoised bid or ask price lookup, used solely when all
+        assets are loaded upfront.
+        """
+        return self._lookup_price(dt, asset, column)
+
+    def _get_price(self, dt, asset, column):
+        """
+        Obtain the bid or ask price of an asset at the provided
+        timestamp.
+
+        When loading lazily the lookup bypasses the memoisation
+        cache, so that every query marks the asset as the most
+        recently queried and the cache does not grow unbounded.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the price for.
+        asset : `str`
+            The asset symbol to obtain the price for.
+        column : `str`
+            Either 'Bid' or 'Ask'.
+
+        Returns
+        -------
+        `float`
+            The price.
+        """
+        if self.lazy:
+            self._ensure_assets_loaded([asset])
+            return self._lookup_price(dt, asset, column)
+        return self._get_cached_price(dt, asset, column)
+
     def get_bid(self, dt, asset):
         """
         Obtain the bid price of an asset at the provided timestamp.
@@ -214,15 +601,8 @@ class CSVDailyBarDataSource(object):
         `float`
             The bid price.
         """
-        bid_ask_df = self.asset_bid_ask_frames[asset]
-        bid_series = bid_ask_df.iloc[bid_ask_df.index.get_indexer([dt], method='pad')]['Bid']
-        try:
-            bid = bid_series.iloc[0]
-        except KeyError:  # Before start date
-            return np.nan
-        return bid
+        return self._get_price(dt, asset, 'Bid')
 
-    @functools.lru_cache(maxsize=1024 * 1024)
     def get_ask(self, dt, asset):
         """
         Obtain the ask price of an asset at the provided timestamp.
@@ -239,13 +619,94 @@ class CSVDailyBarDataSource(object):
         `float`
             The ask price.
         """
-        bid_ask_df = self.asset_bid_ask_frames[asset]
-        ask_series = bid_ask_df.iloc[bid_ask_df.index.get_indexer([dt], method='pad')]['Ask']
-        try:
-            ask = ask_series.iloc[0]
-        except KeyError:  # Before start date
-            return np.nan
-        return ask
+        return self._get_price(dt, asset, 'Ask')
+
+    def _obtain_price_timestamps(self):
+        """
+        Obtain the sorted unique timestamps (as int64 UTC epoch
+        nanoseconds) at which the price of any asset changes.
+
+        Returns
+        -------
+        `np.ndarray`
+            The price timestamps.
+        """
+        return np.unique(
+            np.concatenate(
+                [
+                    bid_ask_df.index.as_unit('ns').asi8
+                    for bid_ask_df in self.asset_bid_ask_frames.values()
+                ] + [np.empty(0, dtype=np.int64)]
+            )
+        )
+
+    def get_latest_price_dt(self, dt):
+        """
+        Obtain the latest timestamp, at or before the provided
+        timestamp, at which the price of any asset changes (such as
+        the market open and close of a daily bar).
+
+        The prices of all assets are unchanged between such
+        timestamps, allowing any revaluation to be skipped.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The timestamp to obtain the latest price timestamp for.
+
+        Returns
+        -------
+        `pd.Timestamp`
+            The latest price timestamp, or None if there is no such
+            timestamp, or if it cannot be determined, as is the case
+            when loading lazily.
+        """
+        if self.lazy:
+            return None
+        if self._price_timestamps is None:
+            self._price_timestamps = self._obtain_price_timestamps()
+        idx = np.searchsorted(self._price_timestamps, dt.value, side='right')
+        if idx == 0:
+            return None
+        return pd.Timestamp(self._price_timestamps[idx - 1], tz=pytz.UTC)
+
+    def get_assets_latest_prices(self, dt, assets, side='mid'):
+        """
+        Obtain the latest bid, ask or mid prices of multiple assets
+        at the provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the prices for.
+        assets : `list[str]`
+            The asset symbols to obtain the prices for.
+        side : `str`, optional
+            One of 'bid', 'ask' or 'mid'. Defaults to 'mid'.
+
+        Returns
+        -------
+        `np.ndarray`
+            The prices aligned to the provided assets, with NaN for
+            any assets that are not available within the data source.
+        """
+        if side not in ('bid', 'ask', 'mid'):
+            raise ValueError(
+                'Unknown price side "%s" provided. Must be one of '
+                '"bid", "ask" or "mid".' % side
+            )
+        self._ensure_assets_loaded(assets)
+        prices = np.full(len(assets), np.nan)
+        for i, asset in enumerate(assets):
+            if asset not in self.asset_bid_ask_frames:
+                continue
+            if side == 'bid':
+                prices[i] = self.get_bid(dt, asset)
+            elif side == 'ask':
+                prices[i] = self.get_ask(dt, asset)
+            else:
+                prices[i] = (self.get_bid(dt, asset) + self.get_ask(dt, asset)) / 2.0
+        return prices
 
     def get_assets_historical_closes(self, start_dt, end_dt, assets):
         """
@@ -266,6 +727,7 @@ class CSVDailyBarDataSource(object):
         `pd.DataFrame`
             The multi-asset closing prices DataFrame.
         """
+        self._ensure_assets_loaded(assets)
         close_series = []
         for asset in assets:
             if asset in self.asset_bar_frames.keys():
@@ -276,3 +738,36 @@ class CSVDailyBarDataSource(object):
         prices_df = pd.concat(close_series, axis=1).dropna(how='all')
         prices_df = prices_df.loc[start_dt:end_dt]
         return prices_df
+
+
+def _load_and_convert_csv_file(data_source, csv_file):
+    """
+    Load and convert a single CSV file within a worker process.
+
+    Any error raised is returned rather than propagated, such that
+    the parent process can raise it at the equivalent point of the
+    serial loading sequence.
+
+    Parameters
+    ----------
+    data_source : `CSVDailyBarDataSource`
+        The data source carrying out the loading.
+    csv_file : `str`
+        The name of the CSV file.
+
+    Returns
+    -------
+    `tuple`
+        The daily 'bar' DataFrame (None if loading failed), the
+        bid/ask DataFrame (None if conversion failed) and any error.
+    """
+    asset_symbol = data_source._obtain_asset_symbol_from_filename(csv_file)
+    try:
+        bar_df = data_source._load_bar_frame(asset_symbol, csv_file)
+    except Exception as e:
+        return None, None, e
+    try:
+        bid_ask_df = data_source._load_bid_ask_frame(asset_symbol, bar_df)
+    except Exception as e:
+        return bar_df, None, e
+    return bar_df, bid_ask_df, None
@@ -0,0 +1,367 @@
+import numpy as np
+
+
+class BidAskPriceStore(object):
+    """
+    Columnar store of individually-timestamped bid/ask prices.
+
+    Each asset is held as one contiguous int64 array of UTC epoch
+    nanosecond timestamps along with aligned float64 arrays of bid
+    and ask prices. Point-in-time lookups are carried out with a
+    binary search (numpy.searchsorted) and hence are O(log n) in the
+    length of the asset's price history, without the construction
+    of any temporary Pandas objects.
+
+    Cross-sectional lookups across many assets are answered by a
+    single vectorised binary search over a packed (concatenated)
+    copy of all asset price histories, which is built on demand and
+    discarded whenever the set of stored assets changes.
+
+    The timestamps for each asset must be sorted in ascending order.
+    """
+
+    def __init__(self):
+        self.timestamps = {}
+        self.bids = {}
+        self.asks = {}
+        self._packed = None
+
+    @classmethod
+    def from_bid_ask_frames(cls, bid_ask_frames):
+        """
+        Create a price store from a dictionary of asset symbol keyed
+        bid/ask DataFrames, as produced by CSVDailyBarDataSource.
+
+        Parameters
+        ----------
+        bid_ask_frames : `dict{str: pd.DataFrame}`
+            The timestamp indexed DataFrames with 'Bid' and 'Ask' columns.
+
+        Returns
+        -------
+        `BidAskPriceStore`
+            The populated price store.
+        """
+        store = cls()
+        for asset, bid_ask_df in bid_ask_frames.items():
+            store.add_asset_from_frame(asset, bid_ask_df)
+        return store
+
+    @classmethod
+    def from_packed(cls, assets, timestamps, bids, asks, starts, ends):
+        """
+        Create a price store from packed (concatenated) price histories,
+        as produced by the pack method.
+
+        The per-asset price histories are views onto the packed arrays
+        and hence no price data is copied. This allows the store to be
+        created over read-only memory-mapped arrays.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbols, in packed order.
+        timestamps : `np.ndarray`
+            The packed int64 UTC epoch nanosecond timestamps.
+        bids : `np.ndarray`
+            The packed bid prices.
+        asks : `np.ndarray`
+            The packed ask prices.
+        starts : `np.ndarray`
+            The start offset of each asset within the packed arrays.
+        ends : `np.ndarray`
+            The end offset of each asset within the packed arrays.
+
+        Returns
+        -------
+        `BidAskPriceStore`
+            The populated price store.
+        """
+        store = cls()
+        for asset, start, end in zip(assets, starts, ends):
+            store.timestamps[asset] = timestamps[start:end]
+            store.bids[asset] = bids[start:end]
+            store.asks[asset] = asks[start:end]
+        store._packed = {
+            'timestamps': timestamps,
+            'bids': bids,
+            'asks': asks,
+            'starts': starts,
+            'ends': ends,
+            'rows': {asset: row for row, asset in enumerate(assets)}
+        }
+        return store
+
+    @property
+    def assets(self):
+        """
+        The list of asset symbols held within the store.
+
+        Returns
+        -------
+        `list[str]`
+            The asset symbols.
+        """
+        return list(self.timestamps.keys())
+
+    def __contains__(self, asset):
+        return asset in self.timestamps
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def add_asset(self, asset, timestamps, bids, asks):
+        """
+        Add (or replace) the price history of a single asset.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol.
+        timestamps : `np.ndarray`
+            Sorted int64 UTC epoch nanosecond timestamps.
+        bids : `np.ndarray`
+            The bid prices aligned to the timestamps.
+        asks : `np.ndarray`
+            The ask prices aligned to the timestamps.
+        """
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        bids = np.asarray(bids, dtype=np.float64)
+        asks = np.asarray(asks, dtype=np.float64)
+        if not (len(timestamps) == len(bids) == len(asks)):
+            raise ValueError(
+                'Unable to add asset "%s" to the price store as the '
+                'timestamp, bid and ask arrays have differing '
+                'lengths.' % asset
+            )
+        self.timestamps[asset] = timestamps
+        self.bids[asset] = bids
+        self.asks[asset] = asks
+        self._packed = None
+
+    def add_asset_from_frame(self, asset, bid_ask_df):
+        """
+        Add (or replace) the price history of a single asset from
+        a timestamp indexed bid/ask DataFrame.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol.
+        bid_ask_df : `pd.DataFrame`
+            The UTC timestamp indexed DataFrame with 'Bid' and 'Ask' columns.
+        """
+        self.add_asset(
+            asset,
+            bid_ask_df.index.as_unit('ns').asi8,
+            bid_ask_df['Bid'].to_numpy(dtype=np.float64),
+            bid_ask_df['Ask'].to_numpy(dtype=np.float64)
+        )
+
+    def remove_asset(self, asset):
+        """
+        Remove the price history of a single asset from the store.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol.
+        """
+        del self.timestamps[asset]
+        del self.bids[asset]
+        del self.asks[asset]
+        self._packed = None
+
+    def _latest_index(self, dt, asset):
+        """
+        Obtain the array index of the latest price at or before
+        the provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The timestamp to obtain the latest price index for.
+        asset : `str`
+            The asset symbol.
+
+        Returns
+        -------
+        `int`
+            The array index, or -1 if the timestamp is earlier
+            than the first available price.
+        """
+        return int(
+            np.searchsorted(self.timestamps[asset], dt.value, side='right')
+        ) - 1
+
+    def get_bid(self, dt, asset):
+        """
+        Obtain the latest bid price of an asset at the provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the bid price for.
+        asset : `str`
+            The asset symbol to obtain the bid price for.
+
+        Returns
+        -------
+        `float`
+            The bid price, or NaN if prior to the first available price.
+        """
+        index = self._latest_index(dt, asset)
+        if index < 0:  # Before start date
+            return np.nan
+        return self.bids[asset][index]
+
+    def get_ask(self, dt, asset):
+        """
+        Obtain the latest ask price of an asset at the provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the ask price for.
+        asset : `str`
+            The asset symbol to obtain the ask price for.
+
+        Returns
+        -------
+        `float`
+            The ask price, or NaN if prior to the first available price.
+        """
+        index = self._latest_index(dt, asset)
+        if index < 0:  # Before start date
+            return np.nan
+        return self.asks[asset][index]
+
+    def pack(self):
+        """
+        Concatenate all asset price histories into single contiguous
+        arrays, recording the start and end offset of each asset.
+
+        Returns
+        -------
+        `dict`
+            The packed 'timestamps', 'bids' and 'asks' arrays, the
+            'starts' and 'ends' offset arrays and the asset-to-row
+            'rows' mapping.
+        """
+        if self._packed is None:
+            assets = self.assets
+            lengths = np.array(
+                [len(self.timestamps[asset]) for asset in assets], dtype=np.int64
+            )
+            ends = np.cumsum(lengths)
+            self._packed = {
+                'timestamps': np.concatenate(
+                    [self.timestamps[asset] for asset in assets] + [np.empty(0, dtype=np.int64)]
+                ),
+                'bids': np.concatenate(
+                    [self.bids[asset] for asset in assets] + [np.empty(0, dtype=np.float64)]
+                ),
+                'asks': np.concatenate(
+                    [self.asks[asset] for asset in assets] + [np.empty(0, dtype=np.float64)]
+                ),
+                'starts': ends - lengths,
+                'ends': ends,
+                'rows': {asset: row for row, asset in enumerate(assets)}
+            }
+        return self._packed
+
+    def _latest_indices(self, dt, assets):
+        """
+        Obtain the packed array indices of the latest prices at or
+        before the provided timestamp for each of the provided assets.
+
+        A binary search is carried out simultaneously across every
+        asset's segment of the packed timestamp array, such that the
+        number of NumPy operations depends only on the logarithm of
+        the longest price history and not on the number of assets.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The timestamp to obtain the latest price indices for.
+        assets : `list[str]`
+            The asset symbols.
+
+        Returns
+        -------
+        `np.ndarray`
+            The packed array indices, or -1 where the timestamp is
+            earlier than the first available price or the asset is
+            not present within the store.
+        """
+        packed = self.pack()
+        if len(packed['starts']) == 0:
+            return np.full(len(assets), -1, dtype=np.int64)
+        rows = np.fromiter(
+            (packed['rows'].get(asset, -1) for asset in assets),
+            dtype=np.int64, count=len(assets)
+        )
+        known = rows >= 0
+        starts = np.where(known, packed['starts'][rows], 0)
+        lo = starts.copy()
+        hi = np.where(known, packed['ends'][rows], 0)
+
+        # Locate the first timestamp strictly greater than dt
+        timestamps = packed['timestamps']
+        value = dt.value
+        active = lo < hi
+        while active.any():
+            mid = (lo + hi) // 2
+            right = active & (timestamps[np.where(active, mid, 0)] <= value)
+            lo = np.where(right, mid + 1, lo)
+            hi = np.where(active & ~right, mid, hi)
+            active = lo < hi
+        return np.where(known & (lo > starts), lo - 1, -1)
+
+    def get_bids(self, dt, assets):
+        """
+        Obtain the latest bid prices of multiple assets at the
+        provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the bid prices for.
+        assets : `list[str]`
+            The asset symbols to obtain the bid prices for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The bid prices aligned to the assets, with NaN for assets
+            prior to their first available price or not in the store.
+        """
+        indices = self._latest_indices(dt, assets)
+        bids = self.pack()['bids']
+        if len(bids) == 0:
+            return np.full(len(assets), np.nan)
+        return np.where(indices >= 0, bids[indices], np.nan)
+
+    def get_asks(self, dt, assets):
+        """
+        Obtain the latest ask prices of multiple assets at the
+        provided timestamp.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            When to obtain the ask prices for.
+        assets : `list[str]`
+            The asset symbols to obtain the ask prices for.
+
+        Returns
+        -------
+        `np.ndarray`
+            The ask prices aligned to the assets, with NaN for assets
+            prior to their first available price or not in the store.
+        """
+        indices = self._latest_indices(dt, assets)
+        asks = self.pack()['asks']
+        if len(asks) == 0:
+            return np.full(len(assets), np.nan)
+        return np.where(indices >= 0, asks[indices], np.nan)
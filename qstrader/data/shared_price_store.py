@@ -0,0 +1,201 @@
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pytz
+
+from qstrader.data.price_store import BidAskPriceStore
+
+
+class SharedPriceStore(object):
+    """
+    Read-only price data that is published once into a directory of
+    memory-mapped NumPy arrays and attached to by any number of
+    processes.
+
+    The packed bid/ask price histories and the daily closing prices
+    of every asset are written as uncompressed '.npy' files. Attaching
+    processes memory-map these files read-only, such that all of them
+    share a single copy of the price data via the operating system
+    page cache, irrespective of the number of processes.
+
+    By default the data is published into a new directory within
+    '/dev/shm' (where available), i.e. into shared memory.
+
+    Instances may be pickled (e.g. to be passed to worker processes),
+    in which case solely the path is transferred and the unpickled
+    instance re-attaches to the published arrays.
+
+    Parameters
+    ----------
+    path : `str`
+        The full path to the directory of the published price data.
+    """
+
+    ARRAY_NAMES = [
+        'timestamps', 'bids', 'asks', 'starts', 'ends',
+        'close_timestamps', 'closes', 'close_starts', 'close_ends'
+    ]
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, 'meta.json')) as meta_file:
+            self.meta = json.load(meta_file)
+        self.arrays = {
+            name: np.load(
+                os.path.join(path, '%s.npy' % name), mmap_mode='r'
+            ).view(np.ndarray) for name in self.ARRAY_NAMES
+        }
+        self.rows = {asset: row for row, asset in enumerate(self.assets)}
+
+    def __reduce__(self):
+        return (self.__class__, (self.path,))
+
+    @classmethod
+    def publish(cls, data_source, path=None):
+        """
+        Publish the prices of a (fully loaded) daily bar data source.
+
+        Parameters
+        ----------
+        data_source : `CSVDailyBarDataSource`
+            The data source to publish the prices of.
+        path : `str`, optional
+            The directory to publish into, which is created if necessary.
+            Defaults to a new temporary directory in shared memory.
+
+        Returns
+        -------
+        `SharedPriceStore`
+            The store attached to the published prices.
+        """
+        if path is None:
+            path = tempfile.mkdtemp(
+                prefix='qstrader-prices-',
+                dir='/dev/shm' if os.path.isdir('/dev/shm') else None
+            )
+        else:
+            os.makedirs(path, exist_ok=True)
+
+        price_store = getattr(data_source, 'price_store', None)
+        if price_store is None:
+            price_store = BidAskPriceStore.from_bid_ask_frames(
+                data_source.asset_bid_ask_frames
+            )
+        assets = price_store.assets
+        arrays = dict(price_store.pack())
+        del arrays['rows']
+
+        # Daily closing prices are required for historical close queries
+        close_frames = [data_source.asset_bar_frames[asset] for asset in assets]
+        close_lengths = np.array(
+            [len(close_df) for close_df in close_frames], dtype=np.int64
+        )
+        arrays['close_ends'] = np.cumsum(close_lengths)
+        arrays['close_starts'] = arrays['close_ends'] - close_lengths
+        arrays['close_timestamps'] = np.concatenate(
+            [close_df.index.as_unit('ns').asi8 for close_df in close_frames] +
+            [np.empty(0, dtype=np.int64)]
+        )
+        arrays['closes'] = np.concatenate(
+            [close_df['Close'].to_numpy(dtype=np.float64) for close_df in close_frames] +
+            [np.empty(0, dtype=np.float64)]
+        )
+
+        for name in cls.ARRAY_NAMES:
+            np.save(
+                os.path.join(path, '%s.npy' % name), arrays[name],
+                allow_pickle=False
+            )
+        meta = {
+            'assets': assets,
+            'adjust_prices': data_source.adjust_prices,
+            'market_open_offset': data_source.market_open_offset.value,
+            'market_close_offset': data_source.market_close_offset.value,
+            'close_unit': close_frames[0].index.unit if close_frames else 'ns'
+        }
+        with open(os.path.join(path, 'meta.json'), 'w') as meta_file:
+            json.dump(meta, meta_file)
+        return cls(path)
+
+    @property
+    def assets(self):
+        """
+        The list of published asset symbols.
+
+        Returns
+        -------
+        `list[str]`
+            The asset symbols.
+        """
+        return self.meta['assets']
+
+    def __contains__(self, asset):
+        return asset in self.rows
+
+    def create_price_store(self):
+        """
+        Create a price store of read-only views onto the published
+        bid/ask prices, without copying any price data.
+
+        Returns
+        -------
+        `BidAskPriceStore`
+            The price store.
+        """
+        return BidAskPriceStore.from_packed(
+            self.assets,
+            self.arrays['timestamps'],
+            self.arrays['bids'],
+            self.arrays['asks'],
+            self.arrays['starts'],
+            self.arrays['ends']
+        )
+
+    def get_closes(self, asset, start_dt, end_dt):
+        """
+        Obtain the daily closing prices of an asset within the provided
+        (inclusive) range as a single column DataFrame.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol.
+        start_dt : `pd.Timestamp`
+            The starting datetime of the range to obtain, or None.
+        end_dt : `pd.Timestamp`
+            The ending datetime of the range to obtain, or None.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The timestamp indexed closing prices, with the asset
+            symbol as the column name.
+        """
+        row = self.rows[asset]
+        start = self.arrays['close_starts'][row]
+        end = self.arrays['close_ends'][row]
+        timestamps = self.arrays['close_timestamps'][start:end]
+        if start_dt is not None:
+            start += np.searchsorted(timestamps, start_dt.value, side='left')
+        if end_dt is not None:
+            end -= len(timestamps) - np.searchsorted(
+                timestamps, end_dt.value, side='right'
+            )
+        index = pd.DatetimeIndex(
+            self.arrays['close_timestamps'][start:end].view('datetime64[ns]'),
+            name='Date'
+        ).tz_localize(pytz.UTC).as_unit(self.meta['close_unit'])
+        return pd.DataFrame(
+            {asset: self.arrays['closes'][start:end]}, index=index
+        )
+
+    def unlink(self):
+        """
+        Remove the published prices. Processes that remain attached
+        retain access to the prices until they detach.
+        """
+        shutil.rmtree(self.path, ignore_errors=True)
@@ -79,8 +79,8 @@ class ExecutionHandler(object):
         )
 
         # If order submission is specified then send the
-        # individual order items to the Broker instance
-        if self.submit_orders:
-            for order in final_orders:
-                self.broker.submit_order(self.broker_portfolio_id, order)
-                self.broker.update(dt)
+        # orders to the Broker instance as a single batch, which
+        # is executed within a single Broker update
+        if self.submit_orders and final_orders:
+            self.broker.submit_orders(self.broker_portfolio_id, final_orders)
+            self.broker.update(dt)
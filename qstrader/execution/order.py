@@ -1,7 +1,15 @@
+import itertools
 import uuid
 
 import numpy as np
 
+from qstrader import settings
+
+
+# Shared across all Orders such that integer order IDs
+# are unique within the process
+_integer_order_ids = itertools.count(1)
+
 
 class Order(object):
     """
@@ -27,6 +35,11 @@ class Order(object):
         The order ID of the order, if known.
     """
 
+    __slots__ = (
+        'created_dt', 'cur_dt', 'asset', 'quantity',
+        'commission', 'direction', 'order_id'
+    )
+
     def __init__(
         self,
         dt,
@@ -93,7 +106,9 @@ class Order(object):
 
     def _set_or_generate_order_id(self, order_id=None):
         """
-        Sets or generates a unique order ID for the order, using a UUID.
+        Sets or generates a unique order ID for the order, using a UUID
+        or, if integer order IDs are enabled within the settings, the
+        next value of a monotonically increasing integer sequence.
 
         Parameters
         ----------
@@ -102,10 +117,12 @@ class Order(object):
 
         Returns
         -------
-        `str`
-            The order ID string for the Order.
+        `str` or `int`
+            The order ID for the Order.
         """
         if order_id is None:
+            if settings.INTEGER_ORDER_IDS:
+                return next(_integer_order_ids)
             return uuid.uuid4().hex
         else:
             return order_id
@@ -79,101 +79,135 @@ class DollarWeightedCashBufferedOrderSizer(OrderSizer):
         """
         return self.broker.get_portfolio_total_equity(self.broker_portfolio_id)
 
-    def _normalise_weights(self, weights):
+    def _normalise_weight_array(self, weights):
         """
         Rescale provided weight values to ensure
         weight vector sums to unity.
 
         Parameters
         ----------
-        weights : `dict{Asset: float}`
+        weights : `np.ndarray`
             The un-normalised weight vector.
 
         Returns
         -------
-        `dict{Asset: float}`
+        `np.ndarray`
             The unit sum weight vector.
         """
-        if any([weight < 0.0 for weight in weights.values()]):
+        if np.any(weights < 0.0):
             raise ValueError(
                 'Dollar-weighted cash-buffered order sizing does not support '
                 'negative weights. All positions must be long-only.'
             )
 
-        weight_sum = sum(weight for weight in weights.values())
+        # Sum sequentially, rather than pairwise via np.sum, such that
+        # the weights are rescaled identically to the dictionary form
+        weight_sum = sum(weights.tolist())
 
         # If the weights are very close or equal to zero then rescaling
         # is not possible, so simply return weights unscaled
         if np.isclose(weight_sum, 0.0):
             return weights
 
-        return {
-            asset: (weight / weight_sum)
-            for asset, weight in weights.items()
-        }
+        return weights / weight_sum
 
-    def __call__(self, dt, weights):
+    def _normalise_weights(self, weights):
         """
-        Creates a dollar-weighted cash-buffered target portfolio from the
-        provided target weights at a particular timestamp.
+        Rescale provided weight values to ensure
+        weight vector sums to unity.
+
+        Parameters
+        ----------
+        weights : `dict{Asset: float}`
+            The un-normalised weight vector.
+
+        Returns
+        -------
+        `dict{Asset: float}`
+            The unit sum weight vector.
+        """
+        normalised_weights = self._normalise_weight_array(
+            np.array(list(weights.values()), dtype=np.float64)
+        )
+        return dict(zip(weights.keys(), normalised_weights.tolist()))
+
+    def size_weights(self, dt, assets, weights):
+        """
+        Creates the dollar-weighted cash-buffered target quantities
+        of a vector of assets from their (potentially unnormalised)
+        target weights at a particular timestamp.
 
         Parameters
         ----------
         dt : `pd.Timestamp`
             The current date-time timestamp.
-        weights : `dict{Asset: float}`
-            The (potentially unnormalised) target weights.
+        assets : `list[str]`
+            The asset symbols.
+        weights : `np.ndarray`
+            The target weight of each asset.
 
         Returns
         -------
-        `dict{Asset: dict}`
-            The cash-buffered target portfolio dictionary with quantities.
+        `np.ndarray`
+            The integral target quantity of each asset.
         """
         total_equity = self._obtain_broker_portfolio_total_equity()
         cash_buffered_total_equity = total_equity * (
             1.0 - self.cash_buffer_percentage
         )
 
-        # Pre-cost dollar weight
-        N = len(weights)
+        N = len(assets)
         if N == 0:
             # No forecasts so portfolio remains in cash
             # or is fully liquidated
-            return {}
+            return np.zeros(0, dtype=np.int64)
 
         # Ensure weight vector sums to unity
-        normalised_weights = self._normalise_weights(weights)
+        normalised_weights = self._normalise_weight_array(
+            np.asarray(weights, dtype=np.float64)
+        )
 
-        target_portfolio = {}
-        for asset, weight in sorted(normalised_weights.items()):
-            pre_cost_dollar_weight = cash_buffered_total_equity * weight
+        # Obtain the latest ask prices for all assets in one call
+        asset_prices = self.data_handler.get_assets_latest_prices(
+            dt, assets, side='ask'
+        )
+        self._check_asset_prices(dt, assets, asset_prices)
 
-            # Estimate broker fees for this asset
-            est_quantity = 0  # TODO: Needs to be added for IB
-            est_costs = self.broker.fee_model.calc_total_cost(
-                asset, est_quantity, pre_cost_dollar_weight, broker=self.broker
-            )
+        # Estimate broker fees for all assets in one call
+        pre_cost_dollar_weights = cash_buffered_total_equity * normalised_weights
+        est_quantities = np.zeros(N, dtype=np.int64)  # TODO: Needs to be added for IB
+        est_costs = self.broker.fee_model.calc_total_costs(
+            assets, est_quantities, pre_cost_dollar_weights, broker=self.broker
+        )
 
-            # Calculate integral target asset quantity assuming broker costs
-            after_cost_dollar_weight = pre_cost_dollar_weight - est_costs
-            asset_price = self.data_handler.get_asset_latest_ask_price(
-                dt, asset
-            )
+        # Calculate integral target asset quantities assuming broker costs
+        after_cost_dollar_weights = pre_cost_dollar_weights - est_costs
 
-            if np.isnan(asset_price):
-                raise ValueError(
-                    'Asset price for "%s" at timestamp "%s" is Not-a-Number (NaN). '
-                    'This can occur if the chosen backtest start date is earlier '
-                    'than the first available price for a particular asset. Try '
-                    'modifying the backtest start date and re-running.' % (asset, dt)
-                )
-
-            # TODO: Long only for the time being.
-            asset_quantity = int(
-                np.floor(after_cost_dollar_weight / asset_price)
-            )
+        # TODO: Long only for the time being.
+        return np.floor(after_cost_dollar_weights / asset_prices).astype(np.int64)
 
-            # Add to the target portfolio
-            target_portfolio[asset] = {"quantity": asset_quantity}
+    def __call__(self, dt, weights):
+        """
+        Creates a dollar-weighted cash-buffered target portfolio from the
+        provided target weights at a particular timestamp.
 
-        return target_portfolio
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The current date-time timestamp.
+        weights : `dict{Asset: float}`
+            The (potentially unnormalised) target weights.
+
+        Returns
+        -------
+        `dict{Asset: dict}`
+            The cash-buffered target portfolio dictionary with quantities.
+        """
+        assets = list(weights.keys())
+        quantities = self.size_weights(dt, assets, list(weights.values()))
+        return {
+            asset: {"quantity": quantity}
+            for asset, quantity in sorted(
+                zip(assets, quantities.tolist()), key=lambda x: x[0]
+            )
+        }
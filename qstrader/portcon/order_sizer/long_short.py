@@ -72,7 +72,7 @@ class LongShortLeveragedOrderSizer(OrderSizer):
         """
         return self.broker.get_portfolio_total_equity(self.broker_portfolio_id)
 
-    def _normalise_weights(self, weights):
+    def _normalise_weight_array(self, weights):
         """
         Rescale provided weight values to ensure the
         weights are scaled to gross exposure divided by
@@ -80,15 +80,17 @@ class LongShortLeveragedOrderSizer(OrderSizer):
 
         Parameters
         ----------
-        weights : `dict{Asset: float}`
+        weights : `np.ndarray`
             The un-normalised weight vector.
 
         Returns
         -------
-        `dict{Asset: float}`
+        `np.ndarray`
             The scaled weight vector.
         """
-        gross_exposure = sum(np.abs(weight) for weight in weights.values())
+        # Sum sequentially, rather than pairwise via np.sum, such that
+        # the weights are scaled identically to the dictionary form
+        gross_exposure = sum(np.abs(weights).tolist())
 
         # If the weights are very close or equal to zero then rescaling
         # is not possible, so simply return weights unscaled
@@ -97,76 +99,105 @@ class LongShortLeveragedOrderSizer(OrderSizer):
 
         gross_ratio = self.gross_leverage / gross_exposure
 
-        return {
-            asset: (weight * gross_ratio)
-            for asset, weight in weights.items()
-        }
+        return weights * gross_ratio
 
-    def __call__(self, dt, weights):
+    def _normalise_weights(self, weights):
         """
-        Creates a long short leveraged target portfolio from the
-        provided target weights at a particular timestamp.
+        Rescale provided weight values to ensure the
+        weights are scaled to gross exposure divided by
+        gross leverage.
+
+        Parameters
+        ----------
+        weights : `dict{Asset: float}`
+            The un-normalised weight vector.
+
+        Returns
+        -------
+        `dict{Asset: float}`
+            The scaled weight vector.
+        """
+        normalised_weights = self._normalise_weight_array(
+            np.array(list(weights.values()), dtype=np.float64)
+        )
+        return dict(zip(weights.keys(), normalised_weights.tolist()))
+
+    def size_weights(self, dt, assets, weights):
+        """
+        Creates the long short leveraged target quantities of a
+        vector of assets from their (potentially unnormalised)
+        target weights at a particular timestamp.
 
         Parameters
         ----------
         dt : `pd.Timestamp`
             The current date-time timestamp.
-        weights : `dict{Asset: float}`
-            The (potentially unnormalised) target weights.
+        assets : `list[str]`
+            The asset symbols.
+        weights : `np.ndarray`
+            The target weight of each asset.
 
         Returns
         -------
-        `dict{Asset: dict}`
-            The long short target portfolio dictionary with quantities.
+        `np.ndarray`
+            The integral target quantity of each asset.
         """
         total_equity = self._obtain_broker_portfolio_total_equity()
 
-        # Pre-cost dollar weight
-        N = len(weights)
+        N = len(assets)
         if N == 0:
             # No forecasts so portfolio remains in cash
             # or is fully liquidated
-            return {}
+            return np.zeros(0, dtype=np.int64)
 
         # Scale weights to take into account gross exposure and leverage
-        normalised_weights = self._normalise_weights(weights)
+        normalised_weights = self._normalise_weight_array(
+            np.asarray(weights, dtype=np.float64)
+        )
 
-        target_portfolio = {}
-        for asset, weight in sorted(normalised_weights.items()):
-            pre_cost_dollar_weight = total_equity * weight
+        # Obtain the latest ask prices for all assets in one call
+        asset_prices = self.data_handler.get_assets_latest_prices(
+            dt, assets, side='ask'
+        )
+        self._check_asset_prices(dt, assets, asset_prices)
 
-            # Estimate broker fees for this asset
-            est_quantity = 0  # TODO: Needs to be added for IB
-            est_costs = self.broker.fee_model.calc_total_cost(
-                asset, est_quantity, pre_cost_dollar_weight, broker=self.broker
-            )
+        # Estimate broker fees for all assets in one call
+        pre_cost_dollar_weights = total_equity * normalised_weights
+        est_quantities = np.zeros(N, dtype=np.int64)  # TODO: Needs to be added for IB
+        est_costs = self.broker.fee_model.calc_total_costs(
+            assets, est_quantities, pre_cost_dollar_weights, broker=self.broker
+        )
 
-            # Calculate integral target asset quantity assuming broker costs
-            after_cost_dollar_weight = pre_cost_dollar_weight - est_costs
-            asset_price = self.data_handler.get_asset_latest_ask_price(
-                dt, asset
-            )
+        # Calculate integral target asset quantities assuming broker costs
+        after_cost_dollar_weights = pre_cost_dollar_weights - est_costs
 
-            if np.isnan(asset_price):
-                raise ValueError(
-                    'Asset price for "%s" at timestamp "%s" is Not-a-Number (NaN). '
-                    'This can occur if the chosen backtest start date is earlier '
-                    'than the first available price for a particular asset. Try '
-                    'modifying the backtest start date and re-running.' % (asset, dt)
-                )
-
-            # Truncate the after cost dollar weight
-            # to nearest integer
-            truncated_after_cost_dollar_weight = (
-                np.floor(after_cost_dollar_weight)
-                if after_cost_dollar_weight >= 0.0
-                else np.ceil(after_cost_dollar_weight)
-            )
-            asset_quantity = int(
-                truncated_after_cost_dollar_weight / asset_price
-            )
+        # Truncate the after cost dollar weights to the nearest
+        # integer, then truncate the quantities towards zero
+        truncated_after_cost_dollar_weights = np.trunc(after_cost_dollar_weights)
+        return (truncated_after_cost_dollar_weights / asset_prices).astype(np.int64)
+
+    def __call__(self, dt, weights):
+        """
+        Creates a long short leveraged target portfolio from the
+        provided target weights at a particular timestamp.
 
-            # Add to the target portfolio
-            target_portfolio[asset] = {"quantity": asset_quantity}
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The current date-time timestamp.
+        weights : `dict{Asset: float}`
+            The (potentially unnormalised) target weights.
 
-        return target_portfolio
+        Returns
+        -------
+        `dict{Asset: dict}`
+            The long short target portfolio dictionary with quantities.
+        """
+        assets = list(weights.keys())
+        quantities = self.size_weights(dt, assets, list(weights.values()))
+        return {
+            asset: {"quantity": quantity}
+            for asset, quantity in sorted(
+                zip(assets, quantities.tolist()), key=lambda x: x[0]
+            )
+        }
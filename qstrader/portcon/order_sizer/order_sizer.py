@@ -1,5 +1,7 @@
 from abc import ABCMeta, abstractmethod
 
+import numpy as np
+
 
 class OrderSizer(object):
     """
@@ -14,3 +16,66 @@ class OrderSizer(object):
         raise NotImplementedError(
             "Should implement call()"
         )
+
+    def _check_asset_prices(self, dt, assets, asset_prices):
+        """
+        Raise if the price of any asset is unavailable, or is
+        not a finite positive value from which to size a quantity.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The current date-time timestamp.
+        assets : `list[str]`
+            The asset symbols.
+        asset_prices : `np.ndarray`
+            The latest ask price of each asset.
+        """
+        missing = np.flatnonzero(np.isnan(asset_prices))
+        if len(missing) > 0:
+            raise ValueError(
+                'Asset price for "%s" at timestamp "%s" is Not-a-Number (NaN). '
+                'This can occur if the chosen backtest start date is earlier '
+                'than the first available price for a particular asset. Try '
+                'modifying the backtest start date and re-running.' % (assets[missing[0]], dt)
+            )
+        invalid = np.flatnonzero(~(np.isfinite(asset_prices) & (asset_prices > 0.0)))
+        if len(invalid) > 0:
+            raise ValueError(
+                'Asset price for "%s" at timestamp "%s" is "%s". Unable to '
+                'size a target quantity from a non-positive or non-finite '
+                'price.' % (assets[invalid[0]], dt, asset_prices[invalid[0]])
+            )
+
+    def size_weights(self, dt, assets, weights):
+        """
+        Creates the target quantities of a vector of assets from
+        their target weights at a particular timestamp.
+
+        The default implementation sizes the weight dictionary via
+        '__call__', treating any asset missing from the resulting
+        target portfolio as a zero quantity. Subclasses may override
+        it to size the weight vector directly.
+
+        Parameters
+        ----------
+        dt : `pd.Timestamp`
+            The current date-time timestamp.
+        assets : `list[str]`
+            The asset symbols.
+        weights : `np.ndarray`
+            The target weight of each asset.
+
+        Returns
+        -------
+        `np.ndarray`
+            The target quantity of each asset, retaining the
+            type of the quantities sized by '__call__'.
+        """
+        target_portfolio = self(dt, dict(zip(assets, np.asarray(weights).tolist())))
+        return np.asarray(
+            [
+                target_portfolio.get(asset, {"quantity": 0})["quantity"]
+                for asset in assets
+            ]
+        )
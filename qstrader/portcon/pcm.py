@@ -1,3 +1,5 @@
+import numpy as np
+
 from qstrader import settings
 from qstrader.execution.order import Order
 
@@ -55,161 +57,164 @@ class PortfolioConstructionModel(object):
         self.cost_model = cost_model
         self.data_handler = data_handler
 
-    def _obtain_full_asset_list(self, dt):
+    def _create_asset_index(self, dt, broker_assets, optimised_weights):
         """
-        Create a union of the Assets in the current Universe
-        and those in the Broker Portfolio.
+        Create the asset index aligning all weight and quantity
+        vectors, from the sorted union of the Assets in the current
+        Universe and those in the Broker Portfolio, followed by any
+        other Assets referenced on the optimised weights.
 
         Parameters
         ----------
         dt : `pd.Timestamp`
             The current time used to obtain Universe Assets.
+        broker_assets : `list[str]`
+            The Asset symbols held in the Broker Portfolio.
+        optimised_weights : `dict{str: float}`
+            The weight list for those assets having a non-zero weight.
 
         Returns
         -------
         `list[str]`
-            The sorted full list of Asset symbol strings.
+            The asset index.
         """
-        broker_portfolio = self.broker.get_portfolio_as_dict(
-            self.broker_portfolio_id
+        full_assets = sorted(
+            set(broker_assets).union(set(self.universe.get_assets(dt)))
         )
-        broker_assets = list(broker_portfolio.keys())
-        universe_assets = self.universe.get_assets(dt)
-        return sorted(
-            list(
-                set(broker_assets).union(set(universe_assets))
-            )
-        )
-
-    def _create_zero_target_weight_vector(self, full_assets):
-        """
-        Create an initial zero target weight vector for all
-        assets in both the Broker Portfolio and current Universe.
-
-        Parameters
-        ----------
-        full_assets : `list[str]`
-            The full list of asset symbols.
-
-        Returns
-        -------
-        `dict{str: float}`
-            The zero target weight vector for all Assets.
-        """
-        return {asset: 0.0 for asset in full_assets}
+        full_asset_set = set(full_assets)
+        return full_assets + [
+            asset for asset in optimised_weights
+            if asset not in full_asset_set
+        ]
 
-    def _create_full_asset_weight_vector(self, zero_weights, optimised_weights):
+    def _create_target_weight_array(self, assets, optimised_weights):
         """
-        Ensure any Assets in the Broker Portfolio are sold out if
-        they are not specifically referenced on the optimised weights.
+        Create the target weight vector aligned to the asset index,
+        such that any Assets not referenced on the optimised weights
+        are sold out.
 
         Parameters
         ----------
-        zero_weights : `dict{str: float}`
-            The full weight list of assets, all with zero weight.
+        assets : `list[str]`
+            The asset index.
         optimised_weights : `dict{str: float}`
             The weight list for those assets having a non-zero weight.
-            Overrides the zero-weights where keys intersect.
 
         Returns
         -------
-        `dict{str: float}`
-            The union of the zero-weights and optimised weights, where the
-            optimised weights take precedence.
+        `np.ndarray`
+            The target weight of each asset.
         """
-        return {**zero_weights, **optimised_weights}
+        return np.array(
+            [optimised_weights.get(asset, 0.0) for asset in assets],
+            dtype=np.float64
+        )
 
-    def _generate_target_portfolio(self, dt, weights):
+    def _align_current_quantities(
+        self,
+        assets,
+        broker_assets,
+        broker_quantities,
+        broker_integral
+    ):
         """
-        Generate the number of units (shares/lots) per Asset based on the
-        target weight vector.
+        Align the current account asset quantities to the asset index.
 
         Parameters
         ----------
-        dt : `pd.Timestamp`
-            The current timestamp.
-        weights : `dict{str: float}`
-            The union of the zero-weights and optimised weights, where the
-            optimised weights take precedence.
+        assets : `list[str]`
+            The asset index, including all Broker Portfolio Assets.
+        broker_assets : `list[str]`
+            The Asset symbols held in the Broker Portfolio.
+        broker_quantities : `np.ndarray`
+            The net quantity of each Broker Portfolio Asset.
+        broker_integral : `np.ndarray`
+            Whether each net quantity is an integer.
 
         Returns
         -------
-        `dict{str: dict}`
-            Target asset quantities in integral units.
+        `tuple(np.ndarray, np.ndarray)`
+            The current quantity of each asset and whether each
+            quantity is an integer.
         """
-        return self.order_sizer(dt, weights)
+        asset_index = {asset: index for index, asset in enumerate(assets)}
+        slots = np.array(
+            [asset_index[asset] for asset in broker_assets], dtype=np.int64
+        )
+        current_quantities = np.zeros(len(assets), dtype=np.float64)
+        current_quantities[slots] = broker_quantities
+        current_integral = np.ones(len(assets), dtype=bool)
+        current_integral[slots] = broker_integral
+        return current_quantities, current_integral
 
-    def _obtain_current_portfolio(self):
+    def _obtain_current_quantities(self):
         """
-        Query the broker for the current account asset quantities and
-        return as a portfolio dictionary.
+        Query the broker for the current account asset quantities
+        as vectors.
 
         Returns
         -------
-        `dict{str: dict}`
-            Current broker account asset quantities in integral units.
+        `tuple(list[str], np.ndarray, np.ndarray)`
+            The asset symbols, their net quantities and whether
+            each net quantity is an integer.
         """
-        return self.broker.get_portfolio_as_dict(self.broker_portfolio_id)
+        return self.broker.get_portfolio_quantities(self.broker_portfolio_id)
 
-    def _generate_rebalance_orders(
+    def _generate_rebalance_orders_from_arrays(
         self,
         dt,
-        target_portfolio,
-        current_portfolio
+        assets,
+        target_quantities,
+        current_quantities,
+        current_integral
     ):
         """
-        Creates an incremental list of rebalancing Orders from the provided
-        target and current portfolios.
+        Creates an incremental list of rebalancing Orders from the
+        target and current quantities aligned to the asset index.
 
         Parameters
         ----------
         dt : `pd.Timestamp`
             The current time used to populate the Order instances.
-        target_portfolio : `dict{str: dict}`
-            Target asset quantities in integral units.
-        curent_portfolio : `dict{str: dict}`
-            Current (broker) asset quantities in integral units.
+        assets : `list[str]`
+            The asset index.
+        target_quantities : `np.ndarray`
+            Target asset quantities.
+        current_quantities : `np.ndarray`
+            Current (broker) asset quantities.
+        current_integral : `np.ndarray`
+            Whether each current asset quantity is an integer.
 
         Returns
         -------
         `list[Order]`
-            The list of rebalancing Orders
+            The list of rebalancing Orders, sorted by asset.
         """
+        target_quantities = np.asarray(target_quantities)
+        order_quantities = target_quantities - current_quantities
+
+        # Orders retain the integer type solely where both the
+        # target and the current quantities are integers
+        if np.issubdtype(target_quantities.dtype, np.integer):
+            integral_mask = current_integral
+        else:
+            integral_mask = np.zeros(len(assets), dtype=bool)
 
-        # Set all assets from the target portfolio that
-        # aren't in the current portfolio to zero quantity
-        # within the current portfolio
-        for asset in target_portfolio:
-            if asset not in current_portfolio:
-                current_portfolio[asset] = {"quantity": 0}
-
-        # Set all assets from the current portfolio that
-        # aren't in the target portfolio (and aren't cash) to
-        # zero quantity within the target portfolio
-        for asset in current_portfolio:
-            if type(asset) != str:
-                if asset not in target_portfolio:
-                    target_portfolio[asset] = {"quantity": 0}
-
-        # Iterate through the asset list and create the difference
-        # quantities required for each asset
-        rebalance_portfolio = {}
-        for asset in target_portfolio.keys():
-            target_qty = target_portfolio[asset]["quantity"]
-            current_qty = current_portfolio[asset]["quantity"]
-            order_qty = target_qty - current_qty
-            rebalance_portfolio[asset] = {"quantity": order_qty}
-
-        # Create the rebalancing Order list from the order portfolio
-        # only where quantities are non-zero
+        # Create the rebalancing Order list only where
+        # quantities are non-zero, retaining the integer
+        # type of quantities rebalanced from integer positions
+        rebalances = np.flatnonzero(order_quantities)
         rebalance_orders = [
-            Order(dt, asset, rebalance_portfolio[asset]["quantity"])
-            for asset, asset_dict in sorted(
-                rebalance_portfolio.items(), key=lambda x: x[0]
+            Order(dt, asset, int(order_quantity) if is_integral else order_quantity)
+            for asset, order_quantity, is_integral in sorted(
+                zip(
+                    [assets[index] for index in rebalances.tolist()],
+                    order_quantities[rebalances].tolist(),
+                    integral_mask[rebalances].tolist()
+                ),
+                key=lambda x: x[0]
             )
-            if rebalance_portfolio[asset]["quantity"] != 0
         ]
-
         return rebalance_orders
 
     def _create_zero_target_weights_vector(self, dt):
@@ -270,12 +275,16 @@ class PortfolioConstructionModel(object):
         optimised_weights = self.optimiser(dt, initial_weights=weights)
 
         # Ensure any Assets in the Broker Portfolio are sold out if
-        # they are not specifically referenced on the optimised weights
-        full_assets = self._obtain_full_asset_list(dt)
-        full_zero_weights = self._create_zero_target_weight_vector(full_assets)
-        full_weights = self._create_full_asset_weight_vector(
-            full_zero_weights, optimised_weights
-        )
+        # they are not specifically referenced on the optimised weights,
+        # aligning all weights and quantities to a single asset index
+        broker_assets, broker_quantities, broker_integral = self._obtain_current_quantities()
+        assets = self._create_asset_index(dt, broker_assets, optimised_weights)
+        target_weights = self._create_target_weight_array(assets, optimised_weights)
+
+        if settings.PRINT_EVENTS or stats is not None:
+            full_weights = {
+                asset: optimised_weights.get(asset, 0.0) for asset in assets
+            }
         if settings.PRINT_EVENTS:
             print(
                 "(%s) - target weights: %s" % (dt, full_weights)
@@ -288,14 +297,18 @@ class PortfolioConstructionModel(object):
             stats['target_allocations'].append(alloc_dict)
 
         # Calculate target portfolio in notional
-        target_portfolio = self._generate_target_portfolio(dt, full_weights)
+        target_quantities = self.order_sizer.size_weights(
+            dt, assets, target_weights
+        )
 
-        # Obtain current Broker account portfolio
-        current_portfolio = self._obtain_current_portfolio()
+        # Align the current Broker account portfolio to the asset index
+        current_quantities, current_integral = self._align_current_quantities(
+            assets, broker_assets, broker_quantities, broker_integral
+        )
 
         # Create rebalance trade Orders
-        rebalance_orders = self._generate_rebalance_orders(
-            dt, target_portfolio, current_portfolio
+        rebalance_orders = self._generate_rebalance_orders_from_arrays(
+            dt, assets, target_quantities, current_quantities, current_integral
         )
         # TODO: Implement cost model
 
@@ -13,7 +13,14 @@ LOGGING = {
 
 PRINT_EVENTS = True
 
+INTEGER_ORDER_IDS = False
+
 
 def set_print_events(print_events=True):
     global PRINT_EVENTS
     PRINT_EVENTS = print_events
+
+
+def set_integer_order_ids(integer_order_ids=True):
+    global INTEGER_ORDER_IDS
+    INTEGER_ORDER_IDS = integer_order_ids
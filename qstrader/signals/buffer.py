@@ -1,4 +1,6 @@
-from collections import deque
+import numpy as np
+
+from qstrader.signals.rolling import RollingWindow
 
 
 class AssetPriceBuffers(object):
@@ -7,6 +9,10 @@ class AssetPriceBuffers(object):
     based price buffers for usage in lookback-based
     indicator calculations.
 
+    Each buffer is a RollingWindow, which incrementally
+    maintains the statistics of its prices such that the
+    rolling-window signals are obtained in constant time.
+
     Parameters
     ----------
     assets : `list[str]`
@@ -47,13 +53,13 @@ class AssetPriceBuffers(object):
 
         Returns
         -------
-        `dict{str: deque[float]}`
+        `dict{str: RollingWindow}`
             The price buffer dictionary.
         """
         return {
             AssetPriceBuffers._asset_lookback_key(
                 asset, lookback
-            ): deque(maxlen=lookback)
+            ): RollingWindow(maxlen=lookback)
             for lookback in self.lookbacks
         }
 
@@ -64,7 +70,7 @@ class AssetPriceBuffers(object):
 
         Returns
         -------
-        `dict{str: deque[float]}`
+        `dict{str: RollingWindow}`
             The price buffer dictionary.
         """
         prices = {}
@@ -122,3 +128,153 @@ class AssetPriceBuffers(object):
                     asset, lookback
                 )
             ].append(price)
+
+    def append_all(self, assets, prices):
+        """
+        Append a new price onto the price deques of each
+        of the provided assets.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol names.
+        prices : `np.ndarray`
+            The new prices of the assets.
+        """
+        for asset, price in zip(assets, prices):
+            self.append(asset, price)
+
+    def mean(self, asset, lookback):
+        """
+        Calculate the simple moving average of the prices
+        of an asset.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol name.
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `float`
+            The mean price.
+        """
+        return self.prices[
+            AssetPriceBuffers._asset_lookback_key(asset, lookback)
+        ].mean()
+
+    def cumulative_return(self, asset, lookback):
+        """
+        Calculate the cumulative (compounded) return
+        of an asset.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol name.
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `float`
+            The cumulative return.
+        """
+        return self.prices[
+            AssetPriceBuffers._asset_lookback_key(asset, lookback)
+        ].cumulative_return()
+
+    def return_std(self, asset, lookback):
+        """
+        Calculate the population standard deviation of
+        the returns of an asset.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol name.
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `float`
+            The standard deviation of returns.
+        """
+        return self.prices[
+            AssetPriceBuffers._asset_lookback_key(asset, lookback)
+        ].return_std()
+
+    def means(self, lookback, assets=None):
+        """
+        Calculate the simple moving average of the prices
+        of each asset.
+
+        Parameters
+        ----------
+        lookback : `int`
+            The lookback period.
+        assets : `list[str]`, optional
+            The asset symbol names. Defaults to all assets.
+
+        Returns
+        -------
+        `np.ndarray`
+            The mean prices.
+        """
+        if assets is None:
+            assets = self.assets
+        return np.fromiter(
+            (self.mean(asset, lookback) for asset in assets),
+            dtype=np.float64, count=len(assets)
+        )
+
+    def cumulative_returns(self, lookback, assets=None):
+        """
+        Calculate the cumulative (compounded) return
+        of each asset.
+
+        Parameters
+        ----------
+        lookback : `int`
+            The lookback period.
+        assets : `list[str]`, optional
+            The asset symbol names. Defaults to all assets.
+
+        Returns
+        -------
+        `np.ndarray`
+            The cumulative returns.
+        """
+        if assets is None:
+            assets = self.assets
+        return np.fromiter(
+            (self.cumulative_return(asset, lookback) for asset in assets),
+            dtype=np.float64, count=len(assets)
+        )
+
+    def return_stds(self, lookback, assets=None):
+        """
+        Calculate the population standard deviation of
+        the returns of each asset.
+
+        Parameters
+        ----------
+        lookback : `int`
+            The lookback period.
+        assets : `list[str]`, optional
+            The asset symbol names. Defaults to all assets.
+
+        Returns
+        -------
+        `np.ndarray`
+            The standard deviations of returns.
+        """
+        if assets is None:
+            assets = self.assets
+        return np.fromiter(
+            (self.return_std(asset, lookback) for asset in assets),
+            dtype=np.float64, count=len(assets)
+        )
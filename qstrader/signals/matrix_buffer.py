@@ -0,0 +1,386 @@
+import numpy as np
+
+
+class MatrixPriceBuffers(object):
+    """
+    Alternative to AssetPriceBuffers storing the prices of all assets
+    within a single preallocated two-dimensional NumPy ring buffer,
+    with one row per asset and a row index per asset symbol.
+
+    The ring buffer holds the maximum lookback number of prices, such
+    that prices are stored once irrespective of the number of lookbacks.
+    Each price is written twice, at its ring position and at that
+    position offset by the capacity, which ensures that the most recent
+    prices of every lookback are a contiguous (view) slice of the row.
+
+    The prices of many assets are appended with a single vectorised
+    write, while the signal statistics are calculated cross-sectionally
+    for all assets at once, returning arrays.
+
+    Parameters
+    ----------
+    assets : `list[str]`
+        The list of assets to create price buffers for.
+    lookbacks : `list[int]`, optional
+        The number of lookback periods to store prices for.
+    """
+
+    def __init__(self, assets, lookbacks=[12]):
+        self.assets = assets
+        self.lookbacks = lookbacks
+        self.capacity = max(lookbacks)
+        self.asset_rows = {}
+        self.values = np.full((0, 2 * self.capacity), np.nan, dtype=np.float64)
+        self.counts = np.zeros(0, dtype=np.int64)
+        self._add_rows(assets)
+
+    def _add_rows(self, assets):
+        """
+        Add an empty ring buffer row for each of the provided assets.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol names.
+        """
+        new_assets = [asset for asset in assets if asset not in self.asset_rows]
+        if not new_assets:
+            return
+        for asset in new_assets:
+            self.asset_rows[asset] = len(self.asset_rows)
+        self.values = np.vstack([
+            self.values,
+            np.full((len(new_assets), 2 * self.capacity), np.nan, dtype=np.float64)
+        ])
+        self.counts = np.concatenate([
+            self.counts, np.zeros(len(new_assets), dtype=np.int64)
+        ])
+
+    def _check_lookback(self, lookback):
+        """
+        Ensure that the lookback does not exceed the buffer capacity.
+
+        Parameters
+        ----------
+        lookback : `int`
+            The lookback period.
+        """
+        if lookback > self.capacity:
+            raise ValueError(
+                'Unable to obtain lookback of "%s" periods since only '
+                '"%s" periods are stored in this price buffer.' % (
+                    lookback, self.capacity
+                )
+            )
+
+    def add_asset(self, asset):
+        """
+        Add an asset to the list of current assets. This is necessary if
+        the asset is part of a DynamicUniverse and isn't present at
+        the beginning of a backtest.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol name.
+        """
+        if asset in self.asset_rows:
+            raise ValueError(
+                'Unable to add asset "%s" since it already '
+                'exists in this price buffer.' % asset
+            )
+        else:
+            self._add_rows([asset])
+
+    def append(self, asset, price):
+        """
+        Append a new price onto the price buffer for
+        the specific asset provided.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol name.
+        price : `float`
+            The new price of the asset.
+        """
+        self.append_all([asset], [price])
+
+    def append_all(self, assets, prices):
+        """
+        Append a new price onto the price buffers of each of the
+        provided assets with a single vectorised write.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol names.
+        prices : `np.ndarray`
+            The new prices of the assets.
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        non_positive = np.flatnonzero(prices <= 0.0)
+        if len(non_positive) > 0:
+            idx = non_positive[0]
+            raise ValueError(
+                'Unable to append non-positive price of "%0.2f" '
+                'to metrics buffer for Asset "%s".' % (prices[idx], assets[idx])
+            )
+
+        # Assets may have been added to the universe subsequent
+        # to the beginning of the backtest and as such need a
+        # newly created ring buffer row
+        self._add_rows(assets)
+
+        rows = np.array([self.asset_rows[asset] for asset in assets], dtype=np.int64)
+        positions = self.counts[rows] % self.capacity
+        self.values[rows, positions] = prices
+        self.values[rows, positions + self.capacity] = prices
+        self.counts[rows] += 1
+
+    def window(self, asset, lookback):
+        """
+        Obtain the most recent prices (up to the lookback) of an asset,
+        oldest first, as a view into the ring buffer.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol name.
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `np.ndarray`
+            The prices.
+        """
+        self._check_lookback(lookback)
+        row = self.asset_rows[asset]
+        count = self.counts[row]
+        end = (count - 1) % self.capacity + self.capacity + 1
+        return self.values[row, end - min(count, lookback):end]
+
+    def _windows(self, lookback, rows):
+        """
+        Obtain the most recent lookback prices of each of the provided
+        rows, oldest first, along with the number of stored prices.
+
+        Prices are left-padded with NaN where fewer than the
+        lookback number of prices are stored.
+
+        Parameters
+        ----------
+        lookback : `int`
+            The lookback period.
+        rows : `np.ndarray`
+            The ring buffer rows, or None for all rows.
+
+        Returns
+        -------
+        `tuple(np.ndarray, np.ndarray)`
+            The prices matrix and the number of stored prices of each row.
+        """
+        self._check_lookback(lookback)
+        if rows is None:
+            rows = slice(None)
+            counts = self.counts
+        else:
+            counts = self.counts[rows]
+        ends = (counts - 1) % self.capacity + self.capacity + 1
+        if len(ends) > 0 and np.all(ends == ends[0]):
+            # All rows are aligned, so (for all rows) a view suffices
+            prices = self.values[rows, ends[0] - lookback:ends[0]]
+        else:
+            columns = ends[:, np.newaxis] - lookback + np.arange(lookback)
+            prices = np.take_along_axis(self.values[rows], columns, axis=1)
+        return prices, np.minimum(counts, lookback)
+
+    def _rows(self, assets):
+        """
+        Obtain the ring buffer rows of the provided assets.
+
+        Parameters
+        ----------
+        assets : `list[str]`, optional
+            The asset symbol names. Defaults to all assets.
+
+        Returns
+        -------
+        `np.ndarray`
+            The ring buffer rows, or None for all rows.
+        """
+        if assets is None:
+            return None
+        return np.array([self.asset_rows[asset] for asset in assets], dtype=np.int64)
+
+    @staticmethod
+    def _valid_mask(prices, sizes):
+        """
+        Mask the stored (rather than padded) prices of a prices matrix.
+
+        Parameters
+        ----------
+        prices : `np.ndarray`
+            The left-padded prices matrix.
+        sizes : `np.ndarray`
+            The number of stored prices of each row.
+
+        Returns
+        -------
+        `np.ndarray`
+            The boolean mask of stored prices.
+        """
+        lookback = prices.shape[1]
+        return np.arange(lookback) >= (lookback - sizes)[:, np.newaxis]
+
+    @staticmethod
+    def _returns(prices, sizes):
+        """
+        Calculate the simple returns of a prices matrix along with
+        a mask of those that are stored and not missing (NaN).
+
+        Parameters
+        ----------
+        prices : `np.ndarray`
+            The left-padded prices matrix.
+        sizes : `np.ndarray`
+            The number of stored prices of each row.
+
+        Returns
+        -------
+        `tuple(np.ndarray, np.ndarray)`
+            The returns matrix and the boolean mask of valid returns.
+        """
+        valid = MatrixPriceBuffers._valid_mask(prices, sizes)
+        with np.errstate(invalid='ignore'):
+            returns = prices[:, 1:] / prices[:, :-1] - 1.0
+        mask = valid[:, 1:] & valid[:, :-1] & ~np.isnan(returns)
+        return returns, mask
+
+    def means(self, lookback, assets=None):
+        """
+        Calculate the simple moving average of the prices of each asset.
+
+        Parameters
+        ----------
+        lookback : `int`
+            The lookback period.
+        assets : `list[str]`, optional
+            The asset symbol names. Defaults to all assets in row order.
+
+        Returns
+        -------
+        `np.ndarray`
+            The mean prices, which are NaN where no prices are
+            stored or any stored price is missing.
+        """
+        prices, sizes = self._windows(lookback, self._rows(assets))
+        valid = self._valid_mask(prices, sizes)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = np.where(valid, prices, 0.0).sum(axis=1) / sizes
+        means[np.any(valid & np.isnan(prices), axis=1) | (sizes == 0)] = np.nan
+        return means
+
+    def cumulative_returns(self, lookback, assets=None):
+        """
+        Calculate the cumulative (compounded) return of each asset.
+
+        Parameters
+        ----------
+        lookback : `int`
+            The lookback period.
+        assets : `list[str]`, optional
+            The asset symbol names. Defaults to all assets in row order.
+
+        Returns
+        -------
+        `np.ndarray`
+            The cumulative returns, which are zero where no
+            returns are available.
+        """
+        prices, sizes = self._windows(lookback, self._rows(assets))
+        returns, mask = self._returns(prices, sizes)
+        return np.expm1(np.log1p(np.where(mask, returns, 0.0)).sum(axis=1))
+
+    def return_stds(self, lookback, assets=None):
+        """
+        Calculate the population standard deviation of the
+        returns of each asset.
+
+        Parameters
+        ----------
+        lookback : `int`
+            The lookback period.
+        assets : `list[str]`, optional
+            The asset symbol names. Defaults to all assets in row order.
+
+        Returns
+        -------
+        `np.ndarray`
+            The standard deviations, which are zero where no
+            returns are available.
+        """
+        prices, sizes = self._windows(lookback, self._rows(assets))
+        returns, mask = self._returns(prices, sizes)
+        n = np.maximum(mask.sum(axis=1), 1)
+        masked = np.where(mask, returns, 0.0)
+        deviations = np.where(
+            mask, masked - (masked.sum(axis=1) / n)[:, np.newaxis], 0.0
+        )
+        return np.sqrt((deviations ** 2).sum(axis=1) / n)
+
+    def mean(self, asset, lookback):
+        """
+        Calculate the simple moving average of the prices of an asset.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol name.
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `float`
+            The mean price.
+        """
+        return float(self.means(lookback, [asset])[0])
+
+    def cumulative_return(self, asset, lookback):
+        """
+        Calculate the cumulative (compounded) return of an asset.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol name.
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `float`
+            The cumulative return.
+        """
+        return float(self.cumulative_returns(lookback, [asset])[0])
+
+    def return_std(self, asset, lookback):
+        """
+        Calculate the population standard deviation of the
+        returns of an asset.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol name.
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `float`
+            The standard deviation of returns.
+        """
+        return float(self.return_stds(lookback, [asset])[0])
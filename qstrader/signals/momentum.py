@@ -1,6 +1,3 @@
-import numpy as np
-import pandas as pd
-
 from qstrader.signals.signal import Signal
 
 
@@ -22,17 +19,24 @@ class MomentumSignal(Signal):
         The universe of assets to calculate the signals for.
     lookbacks : `list[int]`
         The number of lookback periods to store prices for.
+    buffer_type : `str`, optional
+        The price buffer backend, either 'deque' or 'matrix'.
     """
 
-    def __init__(self, start_dt, universe, lookbacks):
+    def __init__(self, start_dt, universe, lookbacks, buffer_type='deque'):
         bumped_lookbacks = [lookback + 1 for lookback in lookbacks]
-        super().__init__(start_dt, universe, bumped_lookbacks)
+        super().__init__(
+            start_dt, universe, bumped_lookbacks, buffer_type=buffer_type
+        )
 
-    @staticmethod
-    def _asset_lookback_key(asset, lookback):
+    def _cumulative_return(self, asset, lookback):
         """
-        Create the buffer dictionary lookup key based
-        on asset name and lookback period.
+        Calculate the cumulative returns for the provided
+        lookback period ('momentum') based on the price
+        buffers for a particular asset.
+
+        With the default deque price buffers this is a constant
+        time lookup of incrementally maintained statistics.
 
         Parameters
         ----------
@@ -43,38 +47,48 @@ class MomentumSignal(Signal):
 
         Returns
         -------
-        `str`
-            The lookup key.
+        `float`
+            The cumulative return ('momentum') for the period.
         """
-        return '%s_%s' % (asset, lookback + 1)
+        return self.buffers.cumulative_return(asset, lookback + 1)
 
-    def _cumulative_return(self, asset, lookback):
+    def _precompute_values(self, prices, lookback):
         """
-        Calculate the cumulative returns for the provided
-        lookback period ('momentum') based on the price
-        buffers for a particular asset.
+        Calculate the momenta after every update
+        for a single price buffer lookback.
 
         Parameters
         ----------
-        asset : `str`
-            The asset symbol name.
+        prices : `PrecomputedPrices`
+            The prices appended to the signal at every update.
         lookback : `int`
-            The lookback period.
+            The number of lookback periods of the price buffer.
 
         Returns
         -------
-        `float`
-            The cumulative return ('momentum') for the period.
+        `np.ndarray`
+            The (updates x assets) momenta.
         """
-        series = pd.Series(
-            self.buffers.prices[MomentumSignal._asset_lookback_key(asset, lookback)]
-        )
-        returns = series.pct_change().dropna().to_numpy()
+        return prices.cumulative_returns(lookback)
 
-        if len(returns) < 1:
-            return 0.0
-        else:
-            return (np.cumprod(1.0 + np.array(returns)) - 1.0)[-1]
+    def compute_all(self, lookback):
+        """
+        Calculate the lookback-period momentum
+        for all current assets.
+
+        Parameters
+        ----------
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `np.ndarray`
+            The momenta, ordered as the current assets.
+        """
+        if self.precomputed is not None:
+            return self._precomputed_values(lookback + 1)
+        return self.buffers.cumulative_returns(lookback + 1, self.assets)
 
     def __call__(self, asset, lookback):
         """
@@ -93,4 +107,6 @@ class MomentumSignal(Signal):
         `float`
             The momentum for the period.
         """
+        if self.precomputed is not None:
+            return self._precomputed_value(asset, lookback + 1)
         return self._cumulative_return(asset, lookback)
@@ -0,0 +1,200 @@
+import numpy as np
+
+
+class PrecomputedPrices(object):
+    """
+    The full history of prices appended to a signal over a backtest,
+    from which the rolling-window signal statistics are calculated
+    for every signal update and asset at once, as two-dimensional
+    arrays, rather than one price at a time.
+
+    Row r of each statistic corresponds to the signal state after
+    r signal updates, such that row zero is the state prior to any
+    update. Each asset only begins to receive prices from its
+    entry update onwards (i.e. when it enters the signal universe),
+    which reproduces the warm-up of the incrementally updated
+    price buffers: fewer than the lookback number of prices are
+    used until sufficient prices have been appended.
+
+    The rolling sums are obtained as differences of cumulative sums
+    of values centred on the mean of each asset, which bounds the
+    loss of floating point precision over long histories.
+
+    Parameters
+    ----------
+    assets : `list[str]`
+        The asset symbols of the price columns.
+    prices : `np.ndarray`
+        The (updates x assets) prices at each signal update.
+    entries : `np.ndarray`
+        The index of the signal update at which each asset
+        receives its first price.
+    """
+
+    def __init__(self, assets, prices, entries):
+        self.assets = assets
+        self.asset_columns = {asset: col for col, asset in enumerate(assets)}
+        prices = np.asarray(prices, dtype=np.float64).reshape(-1, len(assets))
+        self.entries = np.asarray(entries, dtype=np.int64)
+
+        # Row r is the state after r updates
+        self.prices = np.vstack([np.full((1, len(assets)), np.nan), prices])
+        rows = np.arange(len(self.prices))[:, np.newaxis]
+        self.counts = np.maximum(rows - self.entries[np.newaxis, :], 0)
+        self.present = self.counts > 0
+
+        with np.errstate(invalid='ignore'):
+            non_positive = np.argwhere(self.present & (self.prices <= 0.0))
+        if len(non_positive) > 0:
+            row, col = non_positive[0]
+            raise ValueError(
+                'Unable to append non-positive price of "%0.2f" '
+                'to metrics buffer for Asset "%s".' % (self.prices[row, col], assets[col])
+            )
+
+        self.returns = np.full(self.prices.shape, np.nan)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self.returns[1:] = self.prices[1:] / self.prices[:-1] - 1.0
+        self.valid_returns = np.zeros(self.prices.shape, dtype=bool)
+        self.valid_returns[1:] = self.present[:-1] & self.present[1:]
+        self.valid_returns &= ~np.isnan(self.returns)
+
+    @staticmethod
+    def _window_sums(values, sizes):
+        """
+        Calculate the sum of the trailing window of values of each
+        row and column, for windows of the provided sizes.
+
+        Parameters
+        ----------
+        values : `np.ndarray`
+            The (rows x assets) values to sum.
+        sizes : `np.ndarray`
+            The (rows x assets) trailing window sizes.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (rows x assets) window sums.
+        """
+        cumulative = np.vstack([
+            np.zeros((1, values.shape[1])), np.cumsum(values, axis=0)
+        ])
+        rows = np.arange(1, len(cumulative))[:, np.newaxis]
+        return cumulative[1:] - np.take_along_axis(cumulative, rows - sizes, axis=0)
+
+    @staticmethod
+    def _centred(values, mask):
+        """
+        Centre each column of values on the mean of its masked
+        values, zeroing the values outside of the mask.
+
+        Parameters
+        ----------
+        values : `np.ndarray`
+            The (rows x assets) values.
+        mask : `np.ndarray`
+            The (rows x assets) mask of values to include.
+
+        Returns
+        -------
+        `tuple(np.ndarray, np.ndarray)`
+            The centred values and the mean of each column.
+        """
+        masked = np.where(mask, values, 0.0)
+        centres = masked.sum(axis=0) / np.maximum(mask.sum(axis=0), 1)
+        return np.where(mask, masked - centres, 0.0), centres
+
+    def _return_windows(self, lookback):
+        """
+        Calculate the number of valid returns within the lookback
+        window of prices of each row and column.
+
+        Parameters
+        ----------
+        lookback : `int`
+            The number of prices of the window.
+
+        Returns
+        -------
+        `tuple(np.ndarray, np.ndarray)`
+            The (rows x assets) return window sizes and the number
+            of valid returns within them.
+        """
+        sizes = np.maximum(np.minimum(self.counts, lookback) - 1, 0)
+        return sizes, self._window_sums(self.valid_returns.astype(np.float64), sizes)
+
+    def means(self, lookback):
+        """
+        Calculate the simple moving average of the prices
+        after each update, for each asset.
+
+        Parameters
+        ----------
+        lookback : `int`
+            The number of prices of the window.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (rows x assets) mean prices, which are NaN where no
+            prices are stored or any stored price is missing.
+        """
+        sizes = np.minimum(self.counts, lookback)
+        missing = self.present & np.isnan(self.prices)
+        centred, centres = self._centred(self.prices, self.present & ~missing)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = self._window_sums(centred, sizes) / sizes + centres
+        means[(self._window_sums(missing.astype(np.float64), sizes) > 0) | (sizes == 0)] = np.nan
+        return means
+
+    def cumulative_returns(self, lookback):
+        """
+        Calculate the cumulative (compounded) return after
+        each update, for each asset.
+
+        Parameters
+        ----------
+        lookback : `int`
+            The number of prices of the window.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (rows x assets) cumulative returns, which are zero
+            where no returns are available.
+        """
+        sizes, n_returns = self._return_windows(lookback)
+        with np.errstate(invalid='ignore'):
+            log_returns = np.where(self.valid_returns, np.log1p(self.returns), 0.0)
+        cum_returns = np.expm1(self._window_sums(log_returns, sizes))
+        return np.where(n_returns >= 1, cum_returns, 0.0)
+
+    def return_stds(self, lookback):
+        """
+        Calculate the population standard deviation of the returns
+        after each update, for each asset.
+
+        Parameters
+        ----------
+        lookback : `int`
+            The number of prices of the window.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (rows x assets) standard deviations, which are zero
+            where no returns are available.
+        """
+        sizes, n_returns = self._return_windows(lookback)
+        centred, _ = self._centred(self.returns, self.valid_returns)
+        n = np.maximum(n_returns, 1)
+        mean = self._window_sums(centred, sizes) / n
+        variance = self._window_sums(centred ** 2, sizes) / n - mean ** 2
+
+        # Variances within the rounding error of the cumulative sum
+        # of squares are indistinguishable from zero, such as those
+        # of a single return, and are hence set to zero
+        tolerance = 4.0 * np.finfo(np.float64).eps * np.cumsum(centred ** 2, axis=0) / n
+        variance[variance <= tolerance] = 0.0
+        return np.where(n_returns >= 1, np.sqrt(variance), 0.0)
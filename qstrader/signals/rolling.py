@@ -0,0 +1,226 @@
+from collections import deque
+import math
+
+
+class RollingWindow(deque):
+    """
+    A fixed-length ("deque") price buffer that incrementally maintains
+    the running statistics required by the rolling-window signals.
+
+    On every append the running sum of the prices, the mean and sum of
+    squared deviations (via Welford's algorithm) of the simple returns
+    and the sum of the log returns are updated for both the newly
+    appended and the evicted values. Hence the simple moving average,
+    the cumulative return and the volatility of returns of the window
+    are obtained in constant time, without any allocation.
+
+    Returns involving a missing (NaN) price are excluded from the
+    return statistics, as with pandas' pct_change().dropna(). To bound
+    the accumulation of floating point error from the repeated
+    additions and removals, the statistics are periodically recomputed
+    from the stored values.
+
+    The window remains a deque, such that code iterating over the
+    buffered prices is unaffected. It should however only be modified
+    via append, extend and clear.
+
+    Parameters
+    ----------
+    iterable : `iterable[float]`, optional
+        The initial prices of the window.
+    maxlen : `int`, optional
+        The number of prices to store.
+    """
+
+    RESYNC_APPENDS = 1000
+
+    def __init__(self, iterable=(), maxlen=None):
+        super().__init__(maxlen=maxlen)
+        self.returns = deque(
+            maxlen=None if maxlen is None else max(maxlen - 1, 0)
+        )
+        self._reset_statistics()
+        self.extend(iterable)
+
+    def _reset_statistics(self):
+        """
+        Reset all of the running statistics to those of an empty window.
+        """
+        self._appends = 0
+        self._price_sum = 0.0
+        self._price_nans = 0
+        self._return_count = 0
+        self._return_mean = 0.0
+        self._return_m2 = 0.0
+        self._log_return_sum = 0.0
+
+    def _resync_statistics(self):
+        """
+        Recompute all of the running statistics from the stored
+        prices and returns.
+        """
+        self._appends = 0
+        prices = [price for price in self if not math.isnan(price)]
+        self._price_sum = math.fsum(prices)
+        self._price_nans = len(self) - len(prices)
+
+        returns = [ret for ret in self.returns if not math.isnan(ret)]
+        self._return_count = len(returns)
+        if returns:
+            self._return_mean = math.fsum(returns) / len(returns)
+            self._return_m2 = math.fsum(
+                (ret - self._return_mean) ** 2 for ret in returns
+            )
+        else:
+            self._return_mean = 0.0
+            self._return_m2 = 0.0
+        self._log_return_sum = math.fsum(math.log1p(ret) for ret in returns)
+
+    def _add_return(self, ret):
+        """
+        Include a new return in the return statistics.
+
+        Parameters
+        ----------
+        ret : `float`
+            The simple return.
+        """
+        if math.isnan(ret):
+            return
+        self._return_count += 1
+        delta = ret - self._return_mean
+        self._return_mean += delta / self._return_count
+        self._return_m2 += delta * (ret - self._return_mean)
+        self._log_return_sum += math.log1p(ret)
+
+    def _remove_return(self, ret):
+        """
+        Exclude an evicted return from the return statistics.
+
+        Parameters
+        ----------
+        ret : `float`
+            The simple return.
+        """
+        if math.isnan(ret):
+            return
+        self._return_count -= 1
+        if self._return_count == 0:
+            self._return_mean = 0.0
+            self._return_m2 = 0.0
+            self._log_return_sum = 0.0
+            return
+        delta = ret - self._return_mean
+        self._return_mean -= delta / self._return_count
+        self._return_m2 -= delta * (ret - self._return_mean)
+        self._log_return_sum -= math.log1p(ret)
+
+    def _push_return(self, ret):
+        """
+        Append a new return onto the return buffer, evicting
+        the oldest return if the buffer is full.
+
+        Parameters
+        ----------
+        ret : `float`
+            The simple return.
+        """
+        if len(self.returns) == self.returns.maxlen:
+            if self.returns.maxlen == 0:
+                return
+            self._remove_return(self.returns[0])
+        self.returns.append(ret)
+        self._add_return(ret)
+
+    def append(self, price):
+        """
+        Append a new price onto the window, evicting the oldest
+        price if the window is full.
+
+        Parameters
+        ----------
+        price : `float`
+            The new price.
+        """
+        price = float(price)
+        if len(self) > 0:
+            self._push_return(price / self[-1] - 1.0)
+
+        if len(self) == self.maxlen:
+            if self.maxlen == 0:
+                return
+            evicted = self[0]
+            if math.isnan(evicted):
+                self._price_nans -= 1
+            else:
+                self._price_sum -= evicted
+
+        super().append(price)
+        if math.isnan(price):
+            self._price_nans += 1
+        else:
+            self._price_sum += price
+
+        self._appends += 1
+        if self._appends >= max(self.maxlen or 0, self.RESYNC_APPENDS):
+            self._resync_statistics()
+
+    def extend(self, iterable):
+        """
+        Append each of the provided prices onto the window.
+
+        Parameters
+        ----------
+        iterable : `iterable[float]`
+            The new prices.
+        """
+        for price in iterable:
+            self.append(price)
+
+    def clear(self):
+        """
+        Remove all prices from the window.
+        """
+        super().clear()
+        self.returns.clear()
+        self._reset_statistics()
+
+    def mean(self):
+        """
+        The simple moving average of the prices in the window.
+
+        Returns
+        -------
+        `float`
+            The mean price, or NaN if the window is empty or
+            contains a missing price.
+        """
+        if len(self) == 0 or self._price_nans > 0:
+            return float('nan')
+        return self._price_sum / len(self)
+
+    def cumulative_return(self):
+        """
+        The cumulative (compounded) return of the window.
+
+        Returns
+        -------
+        `float`
+            The cumulative return, or zero if there are no returns.
+        """
+        if self._return_count < 1:
+            return 0.0
+        return math.expm1(self._log_return_sum)
+
+    def return_std(self):
+        """
+        The population standard deviation of the returns of the window.
+
+        Returns
+        -------
+        `float`
+            The standard deviation, or zero if there are no returns.
+        """
+        if self._return_count < 1:
+            return 0.0
+        return math.sqrt(max(self._return_m2 / self._return_count, 0.0))
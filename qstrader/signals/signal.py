@@ -1,6 +1,9 @@
 from abc import ABCMeta, abstractmethod
 
+import numpy as np
+
 from qstrader.signals.buffer import AssetPriceBuffers
+from qstrader.signals.matrix_buffer import MatrixPriceBuffers
 
 
 class Signal(object):
@@ -16,29 +19,52 @@ class Signal(object):
         The universe of assets to calculate the signals for.
     lookbacks : `list[int]`
         The number of lookback periods to store prices for.
+    buffer_type : `str`, optional
+        The price buffer backend, either 'deque' for a deque per
+        asset and lookback, or 'matrix' for a single NumPy ring
+        buffer of all assets.
+
+    Alternatively, in a backtest, the signal values of every update
+    may be calculated upfront via precompute, after which the signal
+    is advanced (rather than appended to) at each update and the
+    signal values are looked up.
     """
 
     __metaclass__ = ABCMeta
 
-    def __init__(self, start_dt, universe, lookbacks):
+    def __init__(self, start_dt, universe, lookbacks, buffer_type='deque'):
         self.start_dt = start_dt
         self.universe = universe
         self.lookbacks = lookbacks
+        self.buffer_type = buffer_type
         self.assets = self.universe.get_assets(start_dt)
         self.buffers = self._create_asset_price_buffers()
+        self.precomputed = None
+        self.precomputed_columns = None
+        self.precomputed_row = 0
 
     def _create_asset_price_buffers(self):
         """
-        Create an AssetPriceBuffers instance.
+        Create an AssetPriceBuffers (or MatrixPriceBuffers) instance.
 
         Returns
         -------
-        `AssetPriceBuffers`
+        `AssetPriceBuffers` or `MatrixPriceBuffers`
             Stores the asset price buffers for the signal.
         """
-        return AssetPriceBuffers(
-            self.assets, lookbacks=self.lookbacks
-        )
+        if self.buffer_type == 'deque':
+            return AssetPriceBuffers(
+                self.assets, lookbacks=self.lookbacks
+            )
+        elif self.buffer_type == 'matrix':
+            return MatrixPriceBuffers(
+                self.assets, lookbacks=self.lookbacks
+            )
+        else:
+            raise ValueError(
+                'Unknown price buffer type "%s" provided. Must be '
+                'one of "deque" or "matrix".' % self.buffer_type
+            )
 
     def append(self, asset, price):
         """
@@ -54,6 +80,104 @@ class Signal(object):
         """
         self.buffers.append(asset, price)
 
+    def append_all(self, assets, prices):
+        """
+        Append a new price onto the price buffers of each
+        of the provided assets.
+
+        Parameters
+        ----------
+        assets : `list[str]`
+            The asset symbol names.
+        prices : `np.ndarray`
+            The new prices of the assets.
+        """
+        self.buffers.append_all(assets, prices)
+
+    def precompute(self, prices):
+        """
+        Calculate the signal values after every signal update of a
+        backtest, for each lookback, from the full price history.
+
+        Parameters
+        ----------
+        prices : `PrecomputedPrices`
+            The prices appended to the signal at every update.
+        """
+        self.precomputed = {
+            lookback: self._precompute_values(prices, lookback)
+            for lookback in self.lookbacks
+        }
+        self.precomputed_columns = prices.asset_columns
+        self.precomputed_row = 0
+
+    def advance(self):
+        """
+        Advance the precomputed signal values by a single update.
+        """
+        self.precomputed_row += 1
+
+    def _precomputed_value(self, asset, lookback):
+        """
+        Look up the current precomputed signal value of an asset.
+
+        Parameters
+        ----------
+        asset : `str`
+            The asset symbol name.
+        lookback : `int`
+            The number of lookback periods of the price buffer.
+
+        Returns
+        -------
+        `float`
+            The signal value.
+        """
+        return float(
+            self.precomputed[lookback][
+                self.precomputed_row, self.precomputed_columns[asset]
+            ]
+        )
+
+    def _precomputed_values(self, lookback):
+        """
+        Look up the current precomputed signal values of all
+        current assets.
+
+        Parameters
+        ----------
+        lookback : `int`
+            The number of lookback periods of the price buffer.
+
+        Returns
+        -------
+        `np.ndarray`
+            The signal values, ordered as the current assets.
+        """
+        columns = [self.precomputed_columns[asset] for asset in self.assets]
+        return self.precomputed[lookback][self.precomputed_row, columns]
+
+    def _precompute_values(self, prices, lookback):
+        """
+        Calculate the signal values after every update for a
+        single price buffer lookback.
+
+        Parameters
+        ----------
+        prices : `PrecomputedPrices`
+            The prices appended to the signal at every update.
+        lookback : `int`
+            The number of lookback periods of the price buffer.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (updates x assets) signal values.
+        """
+        raise NotImplementedError(
+            "Should implement _precompute_values()"
+        )
+
     def update_assets(self, dt):
         """
         Ensure that any new additions to the universe also receive
@@ -71,6 +195,28 @@ class Signal(object):
         for extra_asset in extra_assets:
             self.assets.append(extra_asset)
 
+    def compute_all(self, lookback):
+        """
+        Calculate the signal for all current assets of the signal.
+
+        Derived signals should override this to calculate the
+        signal of all assets in a single vectorised pass.
+
+        Parameters
+        ----------
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `np.ndarray`
+            The signal values, ordered as the current assets.
+        """
+        return np.fromiter(
+            (self(asset, lookback) for asset in self.assets),
+            dtype=np.float64, count=len(self.assets)
+        )
+
     @abstractmethod
     def __call__(self, asset, lookback):
         raise NotImplementedError(
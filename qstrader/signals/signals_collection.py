@@ -1,3 +1,8 @@
+import numpy as np
+
+from qstrader.signals.precomputed import PrecomputedPrices
+
+
 class SignalsCollection(object):
     """
     Provides a mechanism for aggregating all signals
@@ -7,7 +12,9 @@ class SignalsCollection(object):
     if a DynamicUniverse is utilised.
 
     Ensures each signal receives a new data point at the
-    appropriate simulation iteration rate.
+    appropriate simulation iteration rate. The latest prices
+    of the union of all signal assets are obtained in a single
+    call and then distributed to each of the signals.
 
     Parameters
     ----------
@@ -15,12 +22,20 @@ class SignalsCollection(object):
         Map of signal name to derived instance of Signal
     data_handler : `DataHandler`
         The data handler used to obtain pricing.
+    offline : `Boolean`, optional
+        Whether the signal values of every update are calculated
+        upfront (via precompute) from the full price history,
+        rather than incrementally at each update.
     """
 
-    def __init__(self, signals, data_handler):
+    def __init__(self, signals, data_handler, offline=False):
         self.signals = signals
         self.data_handler = data_handler
+        self.offline = offline
         self.warmup = 0  # Used for 'burn in'
+        self._snapshot_sizes = None
+        self._snapshot_assets = []
+        self._snapshot_indices = {}
 
     def __getitem__(self, signal):
         """
@@ -38,6 +53,189 @@ class SignalsCollection(object):
         """
         return self.signals[signal]
 
+    @staticmethod
+    def _ordered_indices(values, n, ascending=False):
+        """
+        Obtain the indices of the n highest (or lowest) values, in
+        order, via a linear time partition followed by a sort of
+        solely the selected values.
+
+        Ties are ordered by index, as with a stable sort, while
+        NaN values are ordered last.
+
+        Parameters
+        ----------
+        values : `np.ndarray`
+            The values to order.
+        n : `int`
+            The number of indices to obtain.
+        ascending : `Boolean`, optional
+            Whether to obtain the lowest, rather than highest, values.
+
+        Returns
+        -------
+        `np.ndarray`
+            The ordered indices.
+        """
+        keys = np.asarray(values, dtype=np.float64)
+        if not ascending:
+            keys = -keys
+        keys = np.where(np.isnan(keys), np.inf, keys)
+        n = max(min(n, len(keys)), 0)
+        if n == 0:
+            return np.empty(0, dtype=np.int64)
+
+        if n < len(keys):
+            # Retain every value tied with the n-th value such
+            # that ties are resolved by index below
+            kth = keys[np.argpartition(keys, n - 1)[n - 1]]
+            candidates = np.flatnonzero(keys <= kth)
+        else:
+            candidates = np.arange(len(keys))
+        order = np.lexsort((candidates, keys[candidates]))
+        return candidates[order][:n]
+
+    def compute_all(self, signal, lookback):
+        """
+        Calculate a signal for all of its current assets
+        in a single vectorised pass.
+
+        Parameters
+        ----------
+        signal : `str`
+            The signal string.
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `np.ndarray`
+            The signal values, ordered as the current assets
+            of the signal.
+        """
+        return self.signals[signal].compute_all(lookback)
+
+    def top_n(self, signal, lookback, n, ascending=False):
+        """
+        Obtain the assets with the n highest (or lowest) values of
+        a signal, ordered from highest (or lowest) downwards.
+
+        Parameters
+        ----------
+        signal : `str`
+            The signal string.
+        lookback : `int`
+            The lookback period.
+        n : `int`
+            The number of assets to obtain.
+        ascending : `Boolean`, optional
+            Whether to obtain the lowest, rather than highest, values.
+
+        Returns
+        -------
+        `list[str]`
+            The ordered asset symbols.
+        """
+        assets = self.signals[signal].assets
+        values = self.compute_all(signal, lookback)
+        return [
+            assets[idx] for idx in
+            self._ordered_indices(values, n, ascending=ascending)
+        ]
+
+    def rank(self, signal, lookback, ascending=False):
+        """
+        Rank all current assets of a signal, where rank one is the
+        highest (or lowest) value of the signal.
+
+        Parameters
+        ----------
+        signal : `str`
+            The signal string.
+        lookback : `int`
+            The lookback period.
+        ascending : `Boolean`, optional
+            Whether to rank the lowest, rather than highest, value first.
+
+        Returns
+        -------
+        `np.ndarray`
+            The ranks, ordered as the current assets of the signal.
+        """
+        values = self.compute_all(signal, lookback)
+        order = self._ordered_indices(values, len(values), ascending=ascending)
+        ranks = np.empty(len(values), dtype=np.int64)
+        ranks[order] = np.arange(1, len(values) + 1)
+        return ranks
+
+    def _update_snapshot_assets(self):
+        """
+        Determine the union of all signal assets, along with the
+        position of each signal's assets within this union.
+
+        As signal assets are solely ever added, these are only
+        recalculated when the number of assets of any signal changes.
+        """
+        sizes = tuple(len(signal.assets) for signal in self.signals.values())
+        if sizes == self._snapshot_sizes:
+            return
+
+        positions = {}
+        for signal in self.signals.values():
+            for asset in signal.assets:
+                positions.setdefault(asset, len(positions))
+        self._snapshot_assets = list(positions)
+        self._snapshot_indices = {
+            name: np.array(
+                [positions[asset] for asset in signal.assets], dtype=np.int64
+            ) for name, signal in self.signals.items()
+        }
+        self._snapshot_sizes = sizes
+
+    def precompute(self, dts):
+        """
+        Calculate the values of all signals after every one of the
+        provided signal updates upfront, as carried out by a backtest.
+
+        The prices of the union of all signal assets are obtained
+        for each update in turn, while the entry of each asset into
+        its signal is determined from the signal universe.
+
+        Parameters
+        ----------
+        dts : `list[pd.Timestamp]`
+            The times of every signal update.
+        """
+        entries = {}
+        positions = {}
+        for name, signal in self.signals.items():
+            signal_entries = {asset: 0 for asset in signal.assets}
+            for update, dt in enumerate(dts):
+                for asset in signal.universe.get_assets(dt):
+                    signal_entries.setdefault(asset, update)
+            for asset in signal_entries:
+                positions.setdefault(asset, len(positions))
+            entries[name] = signal_entries
+
+        assets = list(positions)
+        prices = np.array(
+            [
+                self.data_handler.get_assets_latest_prices(dt, assets, side='mid')
+                for dt in dts
+            ], dtype=np.float64
+        ).reshape(len(dts), len(assets))
+
+        for name, signal in self.signals.items():
+            signal_assets = list(entries[name])
+            columns = [positions[asset] for asset in signal_assets]
+            signal.precompute(
+                PrecomputedPrices(
+                    signal_assets,
+                    prices[:, columns],
+                    [entries[name][asset] for asset in signal_assets]
+                )
+            )
+
     def update(self, dt):
         """
         Updates the universe (if dynamic) for each signal as well
@@ -53,10 +251,26 @@ class SignalsCollection(object):
         for name, signal in self.signals.items():
             self.signals[name].update_assets(dt)
 
-        # Update all of the signals with new prices
+        # Precomputed signals solely need to be advanced
+        if self.offline:
+            for name, signal in self.signals.items():
+                if signal.precomputed is None:
+                    raise ValueError(
+                        'Unable to update signal "%s" offline since it '
+                        'has not been precomputed.' % name
+                    )
+                signal.advance()
+            self.warmup += 1
+            return
+
+        # Obtain a single price snapshot for all signal assets
+        # and update each of the signals with its new prices
+        self._update_snapshot_assets()
+        prices = self.data_handler.get_assets_latest_prices(
+            dt, self._snapshot_assets, side='mid'
+        )
         for name, signal in self.signals.items():
-            assets = signal.assets
-            for asset in assets:
-                price = self.data_handler.get_asset_latest_mid_price(dt, asset)
-                self.signals[name].append(asset, price)
+            signal.append_all(
+                signal.assets, prices[self._snapshot_indices[name]]
+            )
         self.warmup += 1
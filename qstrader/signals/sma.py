@@ -1,5 +1,3 @@
-import numpy as np
-
 from qstrader.signals.signal import Signal
 
 
@@ -16,10 +14,12 @@ class SMASignal(Signal):
         The universe of assets to calculate the signals for.
     lookbacks : `list[int]`
         The number of lookback periods to store prices for.
+    buffer_type : `str`, optional
+        The price buffer backend, either 'deque' or 'matrix'.
     """
 
-    def __init__(self, start_dt, universe, lookbacks):
-        super().__init__(start_dt, universe, lookbacks)
+    def __init__(self, start_dt, universe, lookbacks, buffer_type='deque'):
+        super().__init__(start_dt, universe, lookbacks, buffer_type=buffer_type)
 
     def _simple_moving_average(self, asset, lookback):
         """
@@ -27,6 +27,9 @@ class SMASignal(Signal):
         period based on the simple moving average of the
         price buffers for a particular asset.
 
+        With the default deque price buffers this is a constant
+        time lookup of incrementally maintained statistics.
+
         Parameters
         ----------
         asset : `str`
@@ -39,7 +42,45 @@ class SMASignal(Signal):
         `float`
             The SMA value ('trend') for the period.
         """
-        return np.mean(self.buffers.prices['%s_%s' % (asset, lookback)])
+        return self.buffers.mean(asset, lookback)
+
+    def _precompute_values(self, prices, lookback):
+        """
+        Calculate the trends after every update
+        for a single price buffer lookback.
+
+        Parameters
+        ----------
+        prices : `PrecomputedPrices`
+            The prices appended to the signal at every update.
+        lookback : `int`
+            The number of lookback periods of the price buffer.
+
+        Returns
+        -------
+        `np.ndarray`
+            The (updates x assets) trends (SMAs).
+        """
+        return prices.means(lookback)
+
+    def compute_all(self, lookback):
+        """
+        Calculate the lookback-period trend
+        for all current assets.
+
+        Parameters
+        ----------
+        lookback : `int`
+            The lookback period.
+
+        Returns
+        -------
+        `np.ndarray`
+            The trends (SMAs), ordered as the current assets.
+        """
+        if self.precomputed is not None:
+            return self._precomputed_values(lookback)
+        return self.buffers.means(lookback, self.assets)
 
     def __call__(self, asset, lookback):
         """
@@ -58,4 +99,6 @@ class SMASignal(Signal):
         `float`
             The trend (SMA) for the period.
         """
+        if self.precomputed is not None:
+            return self._precomputed_value(asset, lookback)
         return self._simple_moving_average(asset, lookback)
@@ -1,5 +1,4 @@
-import numpy as np
-import pandas as pd
+import math
 
 from qstrader.signals.signal import Signal
 
@@ -21,17 +20,24 @@ class VolatilitySignal(Signal):
         The universe of assets to calculate the signals for.
     lookbacks : `list[int]`
         The number of lookback periods to store prices for.
+    buffer_type : `str`, optional
+        The price buffer backend, either 'deque' or 'matrix'.
     """
 
-    def __init__(self, start_dt, universe, lookbacks):
+    def __init__(self, start_dt, universe, lookbacks, buffer_type='deque'):
         bumped_lookbacks = [lookback + 1 for lookback in lookbacks]
-        super().__init__(start_dt, universe, bumped_lookbacks)
+        super().__init__(
+            start_dt, universe, bumped_lookbacks, buffer_type=buffer_type
+        )
 
-    @staticmethod
-    def _asset_lookback_key(asset, lookback):
+    def _annualised_vol(self, asset, lookback):
         """
-        Create the buffer dictionary lookup key based
-        on asset name and lookback period.
+        Calculate the annualised volatility for the provided
+        lookback period based on the price buffers for a
+        particular asset.
+
+        With the default deque price buffers this is a constant
+        time lookup of incrementally maintained statistics.
 
         Parameters
         ----------
@@ -42,42 +48,48 @@ class VolatilitySignal(Signal):
 
         Returns
         -------
-        `str`
-            The lookup key.
+        `float`
+            The annualised volatility of returns.
         """
-        return '%s_%s' % (asset, lookback + 1)
+        return self.buffers.return_std(asset, lookback + 1) * math.sqrt(252)
 
-    def _annualised_vol(self, asset, lookback):
+    def _precompute_values(self, prices, lookback):
         """
-        Calculate the annualised volatility for the provided
-        lookback period based on the price buffers for a
-        particular asset.
+        Calculate the annualised volatilities after every update
+        for a single price buffer lookback.
 
         Parameters
         ----------
-        asset : `str`
-            The asset symbol name.
+        prices : `PrecomputedPrices`
+            The prices appended to the signal at every update.
         lookback : `int`
-            The lookback period.
+            The number of lookback periods of the price buffer.
 
         Returns
         -------
-        `float`
-            The annualised volatility of returns.
+        `np.ndarray`
+            The (updates x assets) annualised volatilities.
         """
-        series = pd.Series(
-            self.buffers.prices[
-                VolatilitySignal._asset_lookback_key(
-                    asset, lookback
-                )
-            ]
-        )
-        returns = series.pct_change().dropna().to_numpy()
+        return prices.return_stds(lookback) * math.sqrt(252)
+
+    def compute_all(self, lookback):
+        """
+        Calculate the lookback-period annualised volatility
+        of returns for all current assets.
+
+        Parameters
+        ----------
+        lookback : `int`
+            The lookback period.
 
-        if len(returns) < 1:
-            return 0.0
-        else:
-            return np.std(returns) * np.sqrt(252)
+        Returns
+        -------
+        `np.ndarray`
+            The annualised volatilities, ordered as the current assets.
+        """
+        if self.precomputed is not None:
+            return self._precomputed_values(lookback + 1)
+        return self.buffers.return_stds(lookback + 1, self.assets) * math.sqrt(252)
 
     def __call__(self, asset, lookback):
         """
@@ -96,4 +108,6 @@ class VolatilitySignal(Signal):
         `float`
             The annualised volatility of returns.
         """
+        if self.precomputed is not None:
+            return self._precomputed_value(asset, lookback + 1)
         return self._annualised_vol(asset, lookback)
@@ -1,5 +1,4 @@
-import datetime
-
+import numpy as np
 import pandas as pd
 from pandas.tseries.offsets import BDay
 import pytz
@@ -63,6 +62,41 @@ class DailyBusinessDaySimulationEngine(SimulationEngine):
         )
         return days
 
+    def event_times(self):
+        """
+        Generate the timestamps and event types of every pre-market,
+        market open, market close and post-market event at once.
+
+        Returns
+        -------
+        `tuple(np.ndarray, np.ndarray)`
+            The int64 UTC epoch nanosecond event timestamps and the
+            aligned event type strings.
+        """
+        offsets = []
+        event_types = []
+        if self.pre_market:
+            offsets.append(pd.Timedelta(hours=0))
+            event_types.append('pre_market')
+        offsets.append(pd.Timedelta(hours=14, minutes=30))
+        event_types.append('market_open')
+        offsets.append(pd.Timedelta(hours=21, minutes=0))
+        event_types.append('market_close')
+        if self.post_market:
+            offsets.append(pd.Timedelta(hours=23, minutes=59))
+            event_types.append('post_market')
+
+        # Events occur at fixed UTC offsets from the (local) calendar
+        # date of each business day
+        days = self.business_days
+        if days.tz is not None:
+            days = days.tz_localize(None)
+        days = days.normalize().as_unit('ns').asi8
+        offsets = np.array([offset.value for offset in offsets], dtype=np.int64)
+
+        timestamps = (days[:, np.newaxis] + offsets[np.newaxis, :]).ravel()
+        return timestamps, np.tile(np.array(event_types), len(days))
+
     def __iter__(self):
         """
         Generate the daily timestamps and event information
@@ -73,35 +107,9 @@ class DailyBusinessDaySimulationEngine(SimulationEngine):
         `SimulationEvent`
             Market time simulation event to yield
         """
-        for index, bday in enumerate(self.business_days):
-            year = bday.year
-            month = bday.month
-            day = bday.day
-
-            if self.pre_market:
-                yield SimulationEvent(
-                    pd.Timestamp(
-                        datetime.datetime(year, month, day), tz='UTC'
-                    ), event_type="pre_market"
-                )
-
-            yield SimulationEvent(
-                pd.Timestamp(
-                    datetime.datetime(year, month, day, 14, 30),
-                    tz=pytz.utc
-                ), event_type="market_open"
-            )
-
-            yield SimulationEvent(
-                pd.Timestamp(
-                    datetime.datetime(year, month, day, 21, 00),
-                    tz=pytz.utc
-                ), event_type="market_close"
-            )
-
-            if self.post_market:
-                yield SimulationEvent(
-                    pd.Timestamp(
-                        datetime.datetime(year, month, day, 23, 59), tz='UTC'
-                    ), event_type="post_market"
-                )
+        timestamps, event_types = self.event_times()
+        event_dts = pd.DatetimeIndex(
+            timestamps.view('datetime64[ns]')
+        ).tz_localize(pytz.utc).as_unit('us')
+        for dt, event_type in zip(event_dts, event_types.tolist()):
+            yield SimulationEvent(dt, event_type)
@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+
+
+class SimulationTimeline(object):
+    """
+    A precomputed timeline of simulation events, merged with the
+    rebalance schedule, the signal update schedule and the equity
+    snapshot schedule of a backtest.
+
+    The event timestamps are held as an int64 array of UTC epoch
+    nanoseconds along with aligned boolean flag arrays, such that
+    whether any action is required at an event is determined in
+    constant time, rather than by searching the rebalance schedule.
+
+    Parameters
+    ----------
+    events : `list[SimulationEvent]`
+        The simulation events in chronological order.
+    timestamps : `np.ndarray`
+        The int64 UTC epoch nanosecond timestamps of the events.
+    rebalance : `np.ndarray`
+        Whether to carry out a rebalance at each event.
+    signal_update : `np.ndarray`
+        Whether to update the signals at each event.
+    equity_snapshot : `np.ndarray`
+        Whether to record the account equity at each event.
+    """
+
+    def __init__(self, events, timestamps, rebalance, signal_update, equity_snapshot):
+        self.events = events
+        self.timestamps = timestamps
+        self.rebalance = rebalance
+        self.signal_update = signal_update
+        self.equity_snapshot = equity_snapshot
+
+    @classmethod
+    def from_events(cls, events, rebalance_times, burn_in_dt=None):
+        """
+        Merge the simulation events with the rebalance schedule.
+
+        Signals are updated at every market close, while rebalances
+        and equity snapshots (at market close) only occur from the
+        optional burn in date onwards.
+
+        Parameters
+        ----------
+        events : `iterable[SimulationEvent]`
+            The simulation events in chronological order, such as a
+            SimulationEngine.
+        rebalance_times : `list[pd.Timestamp]`
+            The rebalance schedule.
+        burn_in_dt : `pd.Timestamp`, optional
+            The date from which to carry out rebalances and record
+            the account equity.
+
+        Returns
+        -------
+        `SimulationTimeline`
+            The merged timeline.
+        """
+        if hasattr(events, 'event_times'):
+            # Simulation engines able to generate all event times
+            # at once avoid the per-event conversions below
+            timestamps, event_types = events.event_times()
+            market_close = event_types == 'market_close'
+            events = list(events)
+        else:
+            events = list(events)
+            timestamps = np.fromiter(
+                (event.ts.value for event in events), dtype=np.int64, count=len(events)
+            )
+            market_close = np.fromiter(
+                (event.event_type == 'market_close' for event in events),
+                dtype=bool, count=len(events)
+            )
+
+        rebalance_ns = pd.DatetimeIndex(rebalance_times).as_unit('ns').asi8
+        rebalance = np.isin(timestamps, rebalance_ns)
+        equity_snapshot = market_close.copy()
+        if burn_in_dt is not None:
+            burnt_in = timestamps >= burn_in_dt.value
+            rebalance &= burnt_in
+            equity_snapshot &= burnt_in
+
+        return cls(events, timestamps, rebalance, market_close, equity_snapshot)
+
+    def __len__(self):
+        return len(self.events)
+
+    def __iter__(self):
+        """
+        Iterate over the timeline.
+
+        Yields
+        ------
+        `tuple`
+            The SimulationEvent along with whether to rebalance, update
+            the signals and record the account equity at the event.
+        """
+        return zip(
+            self.events,
+            self.rebalance.tolist(),
+            self.signal_update.tolist(),
+            self.equity_snapshot.tolist()
+        )
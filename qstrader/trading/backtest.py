@@ -6,9 +6,10 @@ from qstrader.asset.equity import Equity
 from qstrader.broker.simulated_broker import SimulatedBroker
 from qstrader.broker.fee_model.zero_fee_model import ZeroFeeModel
 from qstrader.data.backtest_data_handler import BacktestDataHandler
-from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
+from qstrader.data.daily_bar_array import ArrayDailyBarDataSource
 from qstrader.exchange.simulated_exchange import SimulatedExchange
 from qstrader.simulation.daily_bday import DailyBusinessDaySimulationEngine
+from qstrader.simulation.timeline import SimulationTimeline
 from qstrader.system.qts import QuantTradingSystem
 from qstrader.system.rebalance.buy_and_hold import BuyAndHoldRebalance
 from qstrader.system.rebalance.daily import DailyRebalance
@@ -119,23 +120,6 @@ class BacktestTradingSession(TradingSession):
         self.equity_curve = []
         self.target_allocations = []
 
-    def _is_rebalance_event(self, dt):
-        """
-        Checks if the provided timestamp is part of the rebalance
-        schedule of the backtest.
-
-        Parameters
-        ----------
-        dt : `pd.Timestamp`
-            The timestamp to check the rebalance schedule for.
-
-        Returns
-        -------
-        `Boolean`
-            Whether the timestamp is part of the rebalance schedule.
-        """
-        return dt in self.rebalance_schedule
-
     def _create_exchange(self):
         """
         Generates a simulated exchange instance used for
@@ -184,8 +168,11 @@ class BacktestTradingSession(TradingSession):
         else:
             csv_dir = os.environ.get('QSTRADER_CSV_DATA_DIR')
 
+        # Optionally cache the parsed CSV data between backtests
+        cache_dir = os.environ.get('QSTRADER_CSV_CACHE_DIR')
+
         # TODO: Only equities are supported by QSTrader for now.
-        data_source = CSVDailyBarDataSource(csv_dir, Equity)
+        data_source = ArrayDailyBarDataSource(csv_dir, Equity, cache_dir=cache_dir)
 
         data_handler = BacktestDataHandler(
             self.universe, data_sources=[data_source]
@@ -258,6 +245,21 @@ class BacktestTradingSession(TradingSession):
             )
         return rebalancer.rebalances
 
+    def _create_timeline(self):
+        """
+        Merges the simulation engine events with the rebalance schedule
+        into a precomputed timeline, taking into account any 'burn in'
+        period.
+
+        Returns
+        -------
+        `SimulationTimeline`
+            The timeline of simulation events and required actions.
+        """
+        return SimulationTimeline.from_events(
+            self.sim_engine, self.rebalance_schedule, burn_in_dt=self.burn_in_dt
+        )
+
     def _create_quant_trading_system(self, **kwargs):
         """
         Creates the quantitative trading system with the provided
@@ -381,7 +383,18 @@ class BacktestTradingSession(TradingSession):
 
         stats = {'target_allocations': []}
 
-        for event in self.sim_engine:
+        timeline = self._create_timeline()
+
+        # Offline signals are calculated for every signal update upfront
+        if self.signals is not None and self.signals.offline:
+            self.signals.precompute(
+                [
+                    event.ts for event, signal_update in
+                    zip(timeline.events, timeline.signal_update) if signal_update
+                ]
+            )
+
+        for event, rebalance, signal_update, equity_snapshot in timeline:
             # Output the system event and timestamp
             dt = event.ts
             if settings.PRINT_EVENTS:
@@ -391,38 +404,24 @@ class BacktestTradingSession(TradingSession):
             self.broker.update(dt)
 
             # Update any signals on a daily basis
-            if self.signals is not None and event.event_type == "market_close":
+            if self.signals is not None and signal_update:
                 self.signals.update(dt)
 
-            # If we have hit a rebalance time then carry
-            # out a full run of the quant trading system
-            if self.burn_in_dt is not None:
-                if dt >= self.burn_in_dt:
-                    if self._is_rebalance_event(dt):
-                        if settings.PRINT_EVENTS:
-                            print(
-                                "(%s) - trading logic "
-                                "and rebalance" % event.ts
-                            )
-                        self.qts(dt, stats=stats)
-            else:
-                if self._is_rebalance_event(dt):
-                    if settings.PRINT_EVENTS:
-                        print(
-                            "(%s) - trading logic "
-                            "and rebalance" % event.ts
-                        )
-                    self.qts(dt, stats=stats)
+            # If we have hit a rebalance time (after any 'burn in'
+            # period) then carry out a full run of the quant trading system
+            if rebalance:
+                if settings.PRINT_EVENTS:
+                    print(
+                        "(%s) - trading logic "
+                        "and rebalance" % event.ts
+                    )
+                self.qts(dt, stats=stats)
 
             # Out of market hours we want a daily
             # performance update, but only if we
             # are past the 'burn in' period
-            if event.event_type == "market_close":
-                if self.burn_in_dt is not None:
-                    if dt >= self.burn_in_dt:
-                        self._update_equity_curve(dt)
-                else:
-                    self._update_equity_curve(dt)
+            if equity_snapshot:
+                self._update_equity_curve(dt)
 
         self.target_allocations = stats['target_allocations']
 
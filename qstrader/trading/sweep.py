@@ -0,0 +1,201 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import itertools
+import json
+import os
+
+from qstrader import settings
+from qstrader.data.daily_bar_array import ArrayDailyBarDataSource
+from qstrader.data.shared_price_store import SharedPriceStore
+from qstrader.statistics.json_statistics import JSONStatistics
+
+
+class ParameterSweep(object):
+    """
+    Runs a BacktestTradingSession for every combination of a grid
+    of strategy parameters across a pool of worker processes.
+
+    Each backtest is created by a user-supplied session factory, which
+    is called with the shared data source along with the keyword
+    parameters of the particular run, and must return a (not yet run)
+    BacktestTradingSession. The factory must be picklable, i.e. a
+    module-level function.
+
+    Any provided data source is loaded once within the calling process
+    and published into a SharedPriceStore, to which every worker
+    process attaches without copying the price data.
+
+    The equity curve (CSV) and JSON statistics of each run are written
+    to the output directory as soon as the run finishes, along with an
+    upfront 'sweep.json' manifest of the parameters of every run.
+
+    Parameters
+    ----------
+    session_factory : `callable`
+        The function creating a BacktestTradingSession from the data
+        source and the keyword parameters of a run.
+    param_grid : `dict{str: list}`
+        The lists of values of each parameter to sweep over.
+    output_dir : `str`
+        The directory to write the results of each run into.
+    data_source : `ArrayDailyBarDataSource`, optional
+        The loaded data source to share amongst all runs.
+    n_workers : `int`, optional
+        The number of worker processes. Defaults to the number of CPUs.
+        A value of one runs all backtests within the calling process.
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        param_grid,
+        output_dir,
+        data_source=None,
+        n_workers=None
+    ):
+        self.session_factory = session_factory
+        self.param_grid = param_grid
+        self.output_dir = output_dir
+        self.data_source = data_source
+        self.n_workers = n_workers if n_workers is not None else os.cpu_count()
+
+    def _create_runs(self):
+        """
+        Creates the run identifier and parameters of every combination
+        of the parameter grid.
+
+        Returns
+        -------
+        `list[tuple]`
+            The list of (run ID, parameter dictionary) tuples.
+        """
+        names = list(self.param_grid.keys())
+        combinations = itertools.product(
+            *[self.param_grid[name] for name in names]
+        )
+        return [
+            ('run_%04d' % i, dict(zip(names, values)))
+            for i, values in enumerate(combinations)
+        ]
+
+    def _write_manifest(self, runs):
+        """
+        Writes the parameters of every run to the output directory.
+
+        Parameters
+        ----------
+        runs : `list[tuple]`
+            The list of (run ID, parameter dictionary) tuples.
+        """
+        manifest = {run_id: params for run_id, params in runs}
+        with open(os.path.join(self.output_dir, 'sweep.json'), 'w') as outfile:
+            json.dump(manifest, outfile, default=str, indent=2)
+
+    def run(self):
+        """
+        Runs the backtests of every combination of the parameter grid.
+
+        Returns
+        -------
+        `list[dict]`
+            The run ID, parameters and output filenames of each run,
+            in parameter grid order.
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        runs = self._create_runs()
+        self._write_manifest(runs)
+
+        if self.n_workers <= 1:
+            return [
+                run_backtest(
+                    self.session_factory, self.data_source, None,
+                    run_id, params, self.output_dir, settings.PRINT_EVENTS
+                ) for run_id, params in runs
+            ]
+
+        shared_store = None
+        asset_type = None
+        if self.data_source is not None:
+            shared_store = SharedPriceStore.publish(self.data_source)
+            asset_type = self.data_source.asset_type
+
+        results = {}
+        try:
+            with ProcessPoolExecutor(max_workers=self.n_workers) as executor:
+                futures = [
+                    executor.submit(
+                        run_backtest, self.session_factory, shared_store,
+                        asset_type, run_id, params, self.output_dir,
+                        settings.PRINT_EVENTS
+                    ) for run_id, params in runs
+                ]
+                for future in as_completed(futures):
+                    result = future.result()
+                    if settings.PRINT_EVENTS:
+                        print("Completed sweep run '%s'..." % result['run_id'])
+                    results[result['run_id']] = result
+        finally:
+            if shared_store is not None:
+                shared_store.unlink()
+        return [results[run_id] for run_id, _ in runs]
+
+
+def run_backtest(
+    session_factory, data_source, asset_type,
+    run_id, params, output_dir, print_events
+):
+    """
+    Creates and runs a single backtest of a parameter sweep, writing
+    its equity curve and JSON statistics to the output directory.
+
+    Parameters
+    ----------
+    session_factory : `callable`
+        The function creating a BacktestTradingSession from the data
+        source and the keyword parameters of the run.
+    data_source : `SharedPriceStore` or data source
+        The published prices to attach to, or the data source itself.
+    asset_type : `str`
+        The asset type of any published prices.
+    run_id : `str`
+        The identifier of the run.
+    params : `dict`
+        The keyword parameters of the run.
+    output_dir : `str`
+        The directory to write the results of the run into.
+    print_events : `Boolean`
+        Whether to output events to the console.
+
+    Returns
+    -------
+    `dict`
+        The run ID, parameters and output filenames of the run.
+    """
+    settings.set_print_events(print_events)
+    if isinstance(data_source, SharedPriceStore):
+        data_source = ArrayDailyBarDataSource.from_shared_price_store(
+            data_source, asset_type
+        )
+    session = session_factory(data_source, **params)
+    session.run()
+
+    equity_curve = session.get_equity_curve()
+    equity_filename = os.path.join(output_dir, '%s_equity.csv' % run_id)
+    equity_curve.to_csv(equity_filename, index_label='Date')
+
+    statistics_filename = os.path.join(output_dir, '%s_statistics.json' % run_id)
+    stats = JSONStatistics(
+        equity_curve=equity_curve.copy(),
+        target_allocations=session.get_target_allocations(),
+        strategy_id=run_id,
+        strategy_name=', '.join(
+            '%s=%s' % (name, value) for name, value in params.items()
+        ),
+        output_filename=statistics_filename
+    )
+    stats.to_file()
+    return {
+        'run_id': run_id,
+        'params': params,
+        'equity_filename': equity_filename,
+        'statistics_filename': statistics_filename
+    }
@@ -0,0 +1,94 @@
+import importlib
+import json
+import os
+
+import click
+
+from qstrader.asset.equity import Equity
+from qstrader.data.daily_bar_array import ArrayDailyBarDataSource
+from qstrader.trading.sweep import ParameterSweep
+
+
+def obtain_session_factory(factory):
+    """
+    Imports the session factory function from the provided
+    'module.path:function' command-line string.
+
+    Parameters
+    ----------
+    factory : `str`
+        The session factory location string.
+
+    Returns
+    -------
+    `callable`
+        The session factory function.
+    """
+    module_name, _, function_name = factory.partition(':')
+    if not function_name:
+        raise click.BadParameter(
+            'The session factory must be provided as "module.path:function".'
+        )
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def obtain_param_grid(params):
+    """
+    Converts the provided command-line parameter strings, i.e.
+    'name=value1,value2', into a parameter grid dictionary. Values
+    are parsed as JSON where possible and otherwise left as strings.
+
+    Parameters
+    ----------
+    params : `tuple[str]`
+        The parameter strings.
+
+    Returns
+    -------
+    `dict{str: list}`
+        The parameter grid.
+    """
+    param_grid = {}
+    for param in params:
+        name, _, values = param.partition('=')
+        if not values:
+            raise click.BadParameter(
+                'Could not determine the values of parameter "%s".' % param
+            )
+        param_grid[name] = []
+        for value in values.split(','):
+            try:
+                param_grid[name].append(json.loads(value))
+            except ValueError:
+                param_grid[name].append(value)
+    return param_grid
+
+
+@click.command()
+@click.option('--factory', 'factory', required=True, help='Session factory, i.e. "module.path:function"')
+@click.option('--param', 'params', multiple=True, help='Parameter values to sweep, i.e. "lookback=63,126"')
+@click.option('--symbols', 'symbols', default=None, help='Optional CSV symbols to load, i.e. "SPY,AGG"')
+@click.option('--output-dir', 'output_dir', default='sweep', help='Directory to write the results to')
+@click.option('--workers', 'n_workers', type=int, default=None, help='Number of worker processes')
+def cli(factory, params, symbols, output_dir, n_workers):
+    csv_dir = os.environ.get('QSTRADER_CSV_DATA_DIR', '.')
+    cache_dir = os.environ.get('QSTRADER_CSV_CACHE_DIR')
+    csv_symbols = symbols.split(',') if symbols is not None else None
+
+    # Load the price data once, to be shared amongst all runs
+    data_source = ArrayDailyBarDataSource(
+        csv_dir, Equity, csv_symbols=csv_symbols, cache_dir=cache_dir
+    )
+
+    sweep = ParameterSweep(
+        obtain_session_factory(factory),
+        obtain_param_grid(params),
+        output_dir,
+        data_source=data_source,
+        n_workers=n_workers
+    )
+    sweep.run()
+
+
+if __name__ == "__main__":
+    cli()
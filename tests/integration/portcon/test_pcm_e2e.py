@@ -1,5 +1,6 @@
 from unittest.mock import Mock
 
+import numpy as np
 import pandas as pd
 import pytz
 
@@ -44,8 +45,10 @@ def test_pcm_fixed_weight_optimiser_fixed_alpha_weights_call_end_to_end(
         'EQ:GLD': 534.21
     }
     data_handler = Mock()
-    data_handler.get_asset_latest_ask_price.side_effect = \
-        lambda self, x: mock_asset_prices_first[x]
+    data_handler.get_assets_latest_prices.side_effect = \
+        lambda dt, assets, side: np.array(
+            [mock_asset_prices_first[asset] for asset in assets]
+        )
 
     broker = SimulatedBroker(
         first_dt, exchange, data_handler, account_id,
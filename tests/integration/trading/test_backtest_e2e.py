@@ -4,8 +4,15 @@ import pandas as pd
 import pytz
 import pytest
 
+from qstrader.alpha_model.alpha_model import AlphaModel
 from qstrader.alpha_model.fixed_signals import FixedSignalsAlphaModel
+from qstrader.asset.equity import Equity
 from qstrader.asset.universe.static import StaticUniverse
+from qstrader.data.backtest_data_handler import BacktestDataHandler
+from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
+from qstrader.signals.momentum import MomentumSignal
+from qstrader.signals.signals_collection import SignalsCollection
+from qstrader.signals.sma import SMASignal
 from qstrader.trading.backtest import BacktestTradingSession
 
 from qstrader import settings
@@ -195,3 +202,65 @@ def test_backtest_target_allocations(etf_filepath,):
     expected_ta = pd.DataFrame(data={'EQ:ABC': 0.6, 'EQ:DEF': 0.4}, index=pd.date_range("20190125", periods=5, freq='B'))
     actual_ta = target_allocations.tail()
     assert expected_ta.equals(actual_ta)
+
+
+class TopMomentumAlphaModel(AlphaModel):
+    """
+    Allocates fully to the asset with the highest momentum,
+    provided that its price exceeds its moving average.
+    """
+
+    def __init__(self, signals, universe):
+        self.signals = signals
+        self.universe = universe
+
+    def __call__(self, dt):
+        weights = {asset: 0.0 for asset in self.universe.get_assets(dt)}
+        if self.signals.warmup >= 3:
+            for asset in self.signals.top_n('momentum', 5, 1):
+                if self.signals['momentum'](asset, 3) > -0.5:
+                    weights[asset] = 1.0 + self.signals['sma'](asset, 4) / 1e6
+        return weights
+
+
+@pytest.mark.parametrize('buffer_type', ['deque', 'matrix'])
+def test_backtest_precomputed_signals(etf_filepath, buffer_type):
+    """
+    Ensures that a backtest using signals precomputed upfront
+    produces identical rebalances to incrementally updated signals.
+    """
+    assets = ['EQ:ABC', 'EQ:DEF']
+    universe = StaticUniverse(assets)
+    start_dt = pd.Timestamp('2019-01-01 00:00:00', tz=pytz.UTC)
+    end_dt = pd.Timestamp('2019-01-31 23:59:00', tz=pytz.UTC)
+
+    histories = []
+    for offline in [False, True]:
+        data_handler = BacktestDataHandler(
+            universe, data_sources=[CSVDailyBarDataSource(etf_filepath, Equity)]
+        )
+        signals = SignalsCollection(
+            {
+                'momentum': MomentumSignal(start_dt, universe, [3, 5], buffer_type=buffer_type),
+                'sma': SMASignal(start_dt, universe, [4], buffer_type=buffer_type)
+            },
+            data_handler,
+            offline=offline
+        )
+        backtest = BacktestTradingSession(
+            start_dt,
+            end_dt,
+            universe,
+            TopMomentumAlphaModel(signals, universe),
+            signals=signals,
+            portfolio_id='000001',
+            rebalance='daily',
+            long_only=True,
+            cash_buffer_percentage=0.05,
+            data_handler=data_handler
+        )
+        backtest.run(results=False)
+        histories.append(backtest.broker.portfolios['000001'].history_to_df())
+
+    assert len(histories[0]) > 0
+    pd.testing.assert_frame_equal(histories[1], histories[0])
@@ -0,0 +1,79 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader import settings
+from qstrader.alpha_model.fixed_signals import FixedSignalsAlphaModel
+from qstrader.asset.equity import Equity
+from qstrader.asset.universe.static import StaticUniverse
+from qstrader.data.backtest_data_handler import BacktestDataHandler
+from qstrader.data.daily_bar_array import ArrayDailyBarDataSource
+from qstrader.trading.backtest import BacktestTradingSession
+from qstrader.trading.sweep import ParameterSweep
+
+
+def sixty_forty_session(data_source, abc_weight, rebalance):
+    assets = ['EQ:ABC', 'EQ:DEF']
+    universe = StaticUniverse(assets)
+    data_handler = BacktestDataHandler(universe, data_sources=[data_source])
+    alpha_model = FixedSignalsAlphaModel(
+        {'EQ:ABC': abc_weight, 'EQ:DEF': 1.0 - abc_weight}
+    )
+    return BacktestTradingSession(
+        pd.Timestamp('2019-01-01 00:00:00', tz=pytz.UTC),
+        pd.Timestamp('2019-01-31 23:59:00', tz=pytz.UTC),
+        universe,
+        alpha_model,
+        rebalance=rebalance,
+        rebalance_weekday='WED',
+        long_only=True,
+        cash_buffer_percentage=0.05,
+        data_handler=data_handler
+    )
+
+
+@pytest.mark.parametrize('n_workers', [1, 2])
+def test_parameter_sweep(etf_filepath, tmp_path, monkeypatch, n_workers):
+    """
+    Ensures that a parameter sweep runs a backtest for every
+    parameter combination, writing the equity curve and statistics
+    of each, identical to running each backtest individually.
+    """
+    monkeypatch.setattr(settings, 'PRINT_EVENTS', False)
+    data_source = ArrayDailyBarDataSource(etf_filepath, Equity)
+    output_dir = str(tmp_path / 'sweep')
+
+    sweep = ParameterSweep(
+        sixty_forty_session,
+        {'abc_weight': [0.6, 0.3], 'rebalance': ['weekly', 'end_of_month']},
+        output_dir,
+        data_source=data_source,
+        n_workers=n_workers
+    )
+    results = sweep.run()
+
+    assert [result['run_id'] for result in results] == [
+        'run_0000', 'run_0001', 'run_0002', 'run_0003'
+    ]
+    with open(os.path.join(output_dir, 'sweep.json')) as manifest_file:
+        manifest = json.load(manifest_file)
+    assert manifest['run_0001'] == {'abc_weight': 0.6, 'rebalance': 'end_of_month'}
+    assert manifest['run_0002'] == {'abc_weight': 0.3, 'rebalance': 'weekly'}
+
+    for result in results:
+        backtest = sixty_forty_session(data_source, **result['params'])
+        backtest.run()
+        expected_equity = backtest.get_equity_curve()
+        equity = pd.read_csv(
+            result['equity_filename'], index_col='Date',
+            float_precision='round_trip'
+        )
+        assert list(equity['Equity']) == list(expected_equity['Equity'])
+
+        with open(result['statistics_filename']) as stats_file:
+            stats = json.load(stats_file)
+        assert stats['strategy_id'] == result['run_id']
+        assert len(stats['strategy']['equity_curve']) == len(expected_equity)
@@ -0,0 +1,132 @@
+import json
+import logging
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytz
+
+from qstrader.broker.event_log.event_logger import EventLogger
+from qstrader.broker.event_log.jsonl_event_sink import JSONLEventSink
+from qstrader.broker.event_log.memory_event_sink import MemoryEventSink
+from qstrader.broker.portfolio.portfolio import Portfolio
+from qstrader.broker.transaction.transaction import Transaction
+
+
+def _transact(port):
+    dt = pd.Timestamp('2017-10-05 14:30:00', tz=pytz.UTC)
+    port.subscribe_funds(dt, 100000.0)
+    port.transact_asset(
+        Transaction('EQ:AAA', 100, dt, price=50.25, order_id=1, commission=1.25)
+    )
+    port.withdraw_funds(dt, 1000.0)
+
+
+def test_disabled_event_logger_is_not_called():
+    """
+    Checks that events are neither formatted nor logged when
+    the event logger is disabled.
+    """
+    event_logger = Mock()
+    event_logger.is_enabled.return_value = False
+    port = Portfolio(
+        pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC), event_logger=event_logger
+    )
+    _transact(port)
+    assert event_logger.is_enabled.call_count == 5
+    event_logger.log.assert_not_called()
+
+
+def test_event_logger_is_enabled():
+    """
+    Checks that the event logger is solely enabled when a sink
+    is attached or the standard library logger is enabled.
+    """
+    event_logger = EventLogger('qstrader.test.disabled')
+    event_logger.logger.setLevel(logging.WARNING)
+    assert not event_logger.is_enabled()
+
+    sink = MemoryEventSink()
+    event_logger.add_sink(sink)
+    assert event_logger.is_enabled()
+    event_logger.remove_sink(sink)
+    assert not event_logger.is_enabled()
+
+    event_logger.logger.setLevel(logging.INFO)
+    assert event_logger.is_enabled()
+
+
+def test_memory_sink_receives_portfolio_events():
+    """
+    Checks the structured records of the portfolio events,
+    received via a child of the logger the sink is attached to.
+    """
+    event_logger = EventLogger('qstrader.test.broker')
+    event_logger.logger.setLevel(logging.WARNING)
+    port = Portfolio(
+        pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC),
+        portfolio_id='1234', event_logger=event_logger.child('qstrader.test.portfolio')
+    )
+    sink = MemoryEventSink(maxlen=3)
+    event_logger.add_sink(sink)
+    _transact(port)
+
+    assert [record['event'] for record in sink.records] == [
+        'funds_subscribed', 'asset_transacted', 'funds_withdrawn'
+    ]
+    txn_record = sink.records[1]
+    assert txn_record['source'] == 'qstrader.test.portfolio'
+    assert txn_record['portfolio_id'] == '1234'
+    assert txn_record['asset'] == 'EQ:AAA'
+    assert txn_record['quantity'] == 100
+    assert txn_record['total_cost'] == 5026.25
+    assert txn_record['balance'] == 94973.75
+    assert sink.records[2]['amount'] == 1000.0
+
+    sink.clear()
+    assert len(sink.records) == 0
+
+
+def test_standard_library_messages(caplog):
+    """
+    Checks the messages logged to the standard library logger.
+    """
+    port = Portfolio(
+        pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC), portfolio_id='1234',
+        event_logger=EventLogger('qstrader.test.messages')
+    )
+    with caplog.at_level(logging.INFO, logger='qstrader.test.messages'):
+        _transact(port)
+    assert caplog.messages == [
+        '(2017-10-05 14:30:00) Funds subscribed to portfolio "1234" - Credit: 100000.00, Balance: 100000.00',
+        '(2017-10-05 14:30:00) Asset "EQ:AAA" transacted LONG in portfolio "1234" - Debit: 5026.25, Balance: 94973.75',
+        '(2017-10-05 14:30:00) Funds withdrawn from portfolio "1234" - Debit: 1000.00, Balance: 93973.75'
+    ]
+
+
+def test_jsonl_sink(tmp_path):
+    """
+    Checks that the JSON Lines sink solely creates its file upon
+    the first record and writes one serialised record per line.
+    """
+    path = tmp_path / 'events.jsonl'
+    sink = JSONLEventSink(str(path))
+    event_logger = EventLogger('qstrader.test.jsonl', sinks=[sink])
+    assert not path.exists()
+
+    dt = pd.Timestamp('2017-10-05 14:30:00', tz=pytz.UTC)
+    event_logger.log('order_submitted', dt, 'Order "%s"', 1, quantity=np.int64(100), price=np.float64(50.25))
+    event_logger.log('order_executed', dt, 'Order "%s"', 1, quantity=100)
+    sink.close()
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert records == [
+        {
+            'dt': '2017-10-05T14:30:00+00:00', 'source': 'qstrader.test.jsonl',
+            'event': 'order_submitted', 'quantity': 100, 'price': 50.25
+        },
+        {
+            'dt': '2017-10-05T14:30:00+00:00', 'source': 'qstrader.test.jsonl',
+            'event': 'order_executed', 'quantity': 100
+        }
+    ]
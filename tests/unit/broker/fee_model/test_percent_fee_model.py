@@ -1,5 +1,7 @@
+import numpy as np
 import pytest
 
+from qstrader.broker.fee_model.fee_model import FeeModel
 from qstrader.broker.fee_model.percent_fee_model import PercentFeeModel
 
 
@@ -39,3 +41,29 @@ def test_percent_commission(
     assert pfm._calc_commission(asset, quantity, consideration, broker=broker) == expected_commission
     assert pfm._calc_tax(asset, quantity, consideration, broker=broker) == expected_tax
     assert pfm.calc_total_cost(asset, quantity, consideration, broker=broker) == expected_total
+
+
+@pytest.mark.parametrize('commission_pct,tax_pct', [(0.0, 0.0), (0.002, 0.0025), (0.001, 0.005)])
+def test_percent_total_costs_match_total_cost(commission_pct, tax_pct):
+    """
+    Tests that the batched total costs are identical to the
+    total cost of each trade, as is the default FeeModel
+    implementation of the batched total costs.
+    """
+    pfm = PercentFeeModel(commission_pct=commission_pct, tax_pct=tax_pct)
+    rng = np.random.default_rng(11)
+    quantities = rng.integers(-1000, 1000, size=50)
+    considerations = np.round(quantities * rng.uniform(10.0, 500.0, size=50))
+    assets = ['EQ:%03d' % i for i in range(50)]
+    broker = BrokerMock()
+
+    expected = [
+        pfm.calc_total_cost(asset, quantity, consideration, broker=broker)
+        for asset, quantity, consideration in zip(assets, quantities, considerations)
+    ]
+    np.testing.assert_array_equal(
+        pfm.calc_total_costs(assets, quantities, considerations, broker=broker), expected
+    )
+    np.testing.assert_array_equal(
+        FeeModel.calc_total_costs(pfm, assets, quantities, considerations, broker=broker), expected
+    )
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from qstrader.broker.fee_model.tiered_fee_model import TieredFeeModel
+
+
+TIERS = [(0.0, 0.002), (10000.0, 0.001), (100000.0, 0.0005)]
+
+
+@pytest.mark.parametrize(
+    "minimum_commission,tax_pct,quantity,consideration,"
+    "expected_commission,expected_tax", [
+        (0.0, 0.0, 100, 5000.0, 10.0, 0.0),
+        (0.0, 0.0, 100, 10000.0, 20.0, 0.0),
+        (0.0, 0.0, -100, -50000.0, 60.0, 0.0),
+        (0.0, 0.005, 100, 250000.0, 185.0, 1250.0),
+        (5.0, 0.0, 10, 1000.0, 5.0, 0.0),
+        (5.0, 0.0, 0, 0.0, 0.0, 0.0),
+    ]
+)
+def test_tiered_commission(
+    minimum_commission, tax_pct, quantity, consideration,
+    expected_commission, expected_tax
+):
+    """
+    Tests that the tiered commission is marginal across the
+    consideration tiers, subject to the minimum commission
+    for non-zero trades.
+    """
+    tfm = TieredFeeModel(TIERS, minimum_commission=minimum_commission, tax_pct=tax_pct)
+    assert np.isclose(tfm._calc_commission('EQ:ABC', quantity, consideration), expected_commission)
+    assert np.isclose(tfm._calc_tax('EQ:ABC', quantity, consideration), expected_tax)
+    assert np.isclose(
+        tfm.calc_total_cost('EQ:ABC', quantity, consideration),
+        expected_commission + expected_tax
+    )
+
+
+def test_tiered_per_unit_commission():
+    """
+    Tests a per-unit commission tiered on the traded quantity.
+    """
+    tfm = TieredFeeModel(
+        [(0.0, 0.0035), (300000.0, 0.002)], minimum_commission=0.35, basis='quantity'
+    )
+    np.testing.assert_allclose(
+        tfm.calc_total_costs(
+            ['EQ:ABC', 'EQ:DEF', 'EQ:GHI'], [10, -1000, 400000], [1000.0, -50000.0, 4000000.0]
+        ),
+        [0.35, 3.5, 1050.0 + 200.0]
+    )
+
+
+@pytest.mark.parametrize('minimum_commission,tax_pct', [(0.0, 0.0), (1.0, 0.0025)])
+def test_tiered_total_costs_match_total_cost(minimum_commission, tax_pct):
+    """
+    Tests that the batched total costs match the total cost
+    of each trade.
+    """
+    tfm = TieredFeeModel(TIERS, minimum_commission=minimum_commission, tax_pct=tax_pct)
+    rng = np.random.default_rng(13)
+    quantities = rng.integers(-5000, 5000, size=200)
+    considerations = np.round(quantities * rng.uniform(1.0, 100.0, size=200))
+    assets = ['EQ:%03d' % i for i in range(200)]
+    np.testing.assert_allclose(
+        tfm.calc_total_costs(assets, quantities, considerations),
+        [
+            tfm.calc_total_cost(asset, quantity, consideration)
+            for asset, quantity, consideration in zip(assets, quantities, considerations)
+        ],
+        rtol=1e-14
+    )
+
+
+@pytest.mark.parametrize(
+    'tiers,basis',
+    [
+        ([], 'consideration'),
+        ([(100.0, 0.001)], 'consideration'),
+        ([(0.0, 0.002), (0.0, 0.001)], 'consideration'),
+        ([(0.0, -0.001)], 'consideration'),
+        ([(0.0, 0.001)], 'notional')
+    ]
+)
+def test_invalid_tiers(tiers, basis):
+    """
+    Tests that invalid tier schedules and bases raise ValueError.
+    """
+    with pytest.raises(ValueError):
+        TieredFeeModel(tiers, basis=basis)
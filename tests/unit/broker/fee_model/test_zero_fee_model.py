@@ -1,3 +1,5 @@
+import numpy as np
+
 from qstrader.broker.fee_model.zero_fee_model import ZeroFeeModel
 
 
@@ -25,3 +27,15 @@ def test_commission_is_zero_uniformly():
     assert zbc._calc_commission(asset, quantity, consideration, broker=broker) == 0.0
     assert zbc._calc_tax(asset, quantity, consideration, broker=broker) == 0.0
     assert zbc.calc_total_cost(asset, quantity, consideration, broker=broker) == 0.0
+
+
+def test_total_costs_are_zero_uniformly():
+    """
+    Tests that the batched total costs are zero for each trade.
+    """
+    zbc = ZeroFeeModel()
+    costs = zbc.calc_total_costs(
+        ['EQ:ABC', 'EQ:DEF', 'EQ:GHI'], np.array([100, -50, 0]),
+        np.array([1000.0, -8542.0, 0.0]), broker=BrokerMock()
+    )
+    np.testing.assert_array_equal(costs, [0.0, 0.0, 0.0])
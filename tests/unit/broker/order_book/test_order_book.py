@@ -0,0 +1,84 @@
+import threading
+
+import numpy as np
+import pytest
+
+from qstrader.broker.order_book.deque_order_book import DequeOrderBook
+from qstrader.broker.order_book.locked_order_book import LockedOrderBook
+
+
+class OrderMock(object):
+    def __init__(self, order_id, quantity):
+        self.order_id = order_id
+        self.direction = np.copysign(1, quantity)
+
+
+@pytest.mark.parametrize('order_book_cls', [DequeOrderBook, LockedOrderBook])
+def test_put_get_in_submission_order(order_book_cls):
+    """
+    Checks that orders are obtained in submission order and
+    that getting from an empty order book raises IndexError.
+    """
+    book = order_book_cls()
+    assert book.empty()
+    book.put(OrderMock(1, 10))
+    book.put_all([OrderMock(2, -10), OrderMock(3, 5)])
+    assert book.qsize() == 3
+    assert len(book) == 3
+    assert [book.get().order_id for _ in range(3)] == [1, 2, 3]
+    assert book.empty()
+    with pytest.raises(IndexError):
+        book.get()
+
+
+@pytest.mark.parametrize('order_book_cls', [DequeOrderBook, LockedOrderBook])
+@pytest.mark.parametrize(
+    'sort_by_direction,expected',
+    [
+        (False, [1, 2, 3, 4, 5]),
+        (True, [2, 4, 1, 3, 5])
+    ]
+)
+def test_drain(order_book_cls, sort_by_direction, expected):
+    """
+    Checks that draining removes all orders, optionally sorted
+    by direction while retaining the submission order of orders
+    of the same direction.
+    """
+    book = order_book_cls()
+    book.put_all([
+        OrderMock(1, 10), OrderMock(2, -10), OrderMock(3, 5),
+        OrderMock(4, -5), OrderMock(5, 1)
+    ])
+    orders = book.drain(sort_by_direction=sort_by_direction)
+    assert [order.order_id for order in orders] == expected
+    assert book.empty()
+    assert book.drain() == []
+
+
+def test_locked_order_book_concurrent_producers():
+    """
+    Checks that no orders are lost when submitted from multiple
+    threads while the order book is concurrently drained.
+    """
+    book = LockedOrderBook()
+    n_threads = 4
+    n_orders = 2000
+
+    def produce(thread):
+        for i in range(n_orders):
+            book.put(OrderMock((thread, i), 1))
+
+    threads = [threading.Thread(target=produce, args=(thread,)) for thread in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    drained = []
+    while any(thread.is_alive() for thread in threads):
+        drained.extend(book.drain())
+    for thread in threads:
+        thread.join()
+    drained.extend(book.drain())
+
+    assert len(drained) == n_threads * n_orders
+    for thread in range(n_threads):
+        assert [order.order_id[1] for order in drained if order.order_id[0] == thread] == list(range(n_orders))
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.broker.portfolio.portfolio_event import PortfolioEvent
+from qstrader.broker.portfolio.portfolio_history import PortfolioHistory
+
+
+def _create_history():
+    """
+    Creates a history of a subscription, a long and short
+    transaction and a custom event, across column growth.
+    """
+    dt = pd.Timestamp('2019-01-02 14:30:00', tz=pytz.UTC)
+    history = PortfolioHistory()
+    history.append(PortfolioEvent.create_subscription(dt, 100000.0, 100000.0))
+    for i in range(PortfolioHistory.INITIAL_CAPACITY):
+        history.append_transaction(
+            dt + pd.Timedelta(days=i), 'EQ:abc', 10 if i % 2 == 0 else -5.0, 101.25,
+            debit=1012.55, credit=0.0, balance=98987.45
+        )
+    history.append(
+        PortfolioEvent(
+            dt=dt, type='dividend', description='Dividend EQ:ABC',
+            debit=0.0, credit=12.5, balance=99000.0
+        )
+    )
+    return history
+
+
+def test_history_events():
+    """
+    Checks that the history events are rendered as the
+    equivalent PortfolioEvents, including descriptions.
+    """
+    dt = pd.Timestamp('2019-01-02 14:30:00', tz=pytz.UTC)
+    history = _create_history()
+    assert len(history) == PortfolioHistory.INITIAL_CAPACITY + 2
+
+    assert history[0] == PortfolioEvent(
+        dt=dt, type='subscription', description='SUBSCRIPTION',
+        debit=0.0, credit=100000.0, balance=100000.0
+    )
+    assert history[1] == PortfolioEvent(
+        dt=dt, type='asset_transaction', description='LONG 10 EQ:ABC 101.25 02/01/2019',
+        debit=1012.55, credit=0.0, balance=98987.45
+    )
+    assert history[2].description == 'SHORT -5.0 EQ:ABC 101.25 03/01/2019'
+    assert history[2].dt == dt + pd.Timedelta(days=1)
+    assert history[-1].description == 'Dividend EQ:ABC'
+    assert history[-1].type == 'dividend'
+    assert history[1:3] == [history[1], history[2]]
+    with pytest.raises(IndexError):
+        history[len(history)]
+
+
+def test_history_equality():
+    """
+    Checks that the history compares equal to the
+    equivalent list of PortfolioEvents.
+    """
+    history = _create_history()
+    events = list(history)
+    assert history == events
+    assert history == _create_history()
+    assert history != events[:-1]
+    assert history != events[:-1] + [events[0]]
+    assert PortfolioHistory() == []
+
+
+def test_history_to_df():
+    """
+    Checks that the history DataFrame matches the
+    DataFrame created from the PortfolioEvents.
+    """
+    history = _create_history()
+    records = [pe.to_dict() for pe in history]
+    expected_df = pd.DataFrame.from_records(
+        records, columns=["date", "type", "description", "debit", "credit", "balance"]
+    ).set_index(keys=["date"])
+    history_df = history.to_df()
+    pd.testing.assert_frame_equal(history_df, expected_df)
+    assert np.shares_memory(history_df['balance'].values, history.columns['balance'])
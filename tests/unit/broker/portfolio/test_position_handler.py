@@ -4,6 +4,7 @@ import numpy as np
 import pandas as pd
 import pytz
 
+from qstrader.broker.portfolio.position import Position
 from qstrader.broker.portfolio.position_handler import PositionHandler
 from qstrader.broker.transaction.transaction import Transaction
 
@@ -171,3 +172,65 @@ def test_total_values_for_two_separate_transactions():
     assert np.isclose(ph.total_unrealised_pnl(), -24.31999999999971)
     assert ph.total_realised_pnl() == 0.0
     assert np.isclose(ph.total_pnl(), -24.31999999999971)
+
+
+def test_position_book_matches_positions():
+    """
+    Tests that the vectorised totals and the position views
+    match those of separately transacted Position instances,
+    including the numerical type of the net quantities, as
+    positions are opened, reversed and closed.
+    """
+    ph = PositionHandler()
+    positions = OrderedDict()
+    rng = np.random.default_rng(42)
+    assets = ['EQ:%s' % asset for asset in ['ABC', 'DEF', 'GHI', 'JKL', 'MNO', 'PQR', 'STU', 'VWX', 'YZA', 'BCD']]
+    dt = pd.Timestamp('2015-05-06 15:00:00', tz=pytz.UTC)
+
+    for i in range(300):
+        dt = dt + pd.Timedelta(hours=1)
+        asset = assets[rng.integers(len(assets))]
+        if asset in positions and rng.random() < 0.2:
+            quantity = -positions[asset].net_quantity
+        else:
+            quantity = int(rng.integers(-100, 100))
+        txn = Transaction(
+            asset, quantity=quantity, dt=dt, price=float(rng.uniform(50.0, 150.0)),
+            order_id=i, commission=float(rng.uniform(0.0, 5.0))
+        )
+        ph.transact_position(txn)
+        if asset in positions:
+            positions[asset].transact(txn)
+        else:
+            positions[asset] = Position.open_from_transaction(txn)
+        if positions[asset].net_quantity == 0:
+            del positions[asset]
+
+        assert list(ph.positions) == list(positions)
+        for asset, pos in positions.items():
+            view = ph.positions[asset]
+            assert view.net_quantity == pos.net_quantity
+            assert type(view.net_quantity) is type(pos.net_quantity)
+            assert view.avg_price == pos.avg_price
+            assert view.current_dt == pos.current_dt
+        assert np.isclose(ph.total_market_value(), sum(pos.market_value for pos in positions.values()))
+        assert np.isclose(ph.total_unrealised_pnl(), sum(pos.unrealised_pnl for pos in positions.values()))
+        assert np.isclose(ph.total_realised_pnl(), sum(pos.realised_pnl for pos in positions.values()))
+        assert np.isclose(ph.total_pnl(), sum(pos.total_pnl for pos in positions.values()))
+
+
+def test_position_view_update_current_price():
+    """
+    Tests that updating the current price of a position
+    view is reflected within the position book totals.
+    """
+    ph = PositionHandler()
+    dt = pd.Timestamp('2015-05-06 15:00:00', tz=pytz.UTC)
+    for asset, price in [('EQ:AMZN', 960.0), ('EQ:MSFT', 140.0)]:
+        ph.transact_position(
+            Transaction(asset, quantity=10, dt=dt, price=price, order_id=1, commission=0.0)
+        )
+    ph.positions['EQ:MSFT'].update_current_price(150.0, dt)
+    assert ph.positions['EQ:MSFT'].current_price == 150.0
+    assert ph.total_market_value() == 11100.0
+    assert ph.total_unrealised_pnl() == 100.0
@@ -1,12 +1,15 @@
-import queue
-
 import numpy as np
 import pandas as pd
 import pytest
 import pytz
 
+from qstrader.broker.broker import Broker
+from qstrader.broker.event_log.memory_event_sink import MemoryEventSink
+from qstrader.broker.order_book.deque_order_book import DequeOrderBook
+from qstrader.broker.order_book.locked_order_book import LockedOrderBook
 from qstrader.broker.portfolio.portfolio import Portfolio
 from qstrader.broker.simulated_broker import SimulatedBroker
+from qstrader.broker.fee_model.percent_fee_model import PercentFeeModel
 from qstrader.broker.fee_model.zero_fee_model import ZeroFeeModel
 from qstrader import settings
 
@@ -39,6 +42,9 @@ class DataHandlerMock(object):
     def get_asset_latest_mid_price(self, dt, asset):
         return np.nan
 
+    def get_assets_latest_prices(self, dt, assets, side='mid'):
+        return np.full(len(assets), np.nan)
+
 
 class DataHandlerMockPrice(object):
     def get_asset_latest_bid_ask_price(self, dt, asset):
@@ -47,6 +53,9 @@ class DataHandlerMockPrice(object):
     def get_asset_latest_mid_price(self, dt, asset):
         return (53.47 - 53.45) / 2.0
 
+    def get_assets_latest_prices(self, dt, assets, side='mid'):
+        return np.full(len(assets), (53.47 - 53.45) / 2.0)
+
 
 class OrderMock(object):
     def __init__(self, asset, quantity, order_id=None):
@@ -406,7 +415,7 @@ def test_create_portfolio():
     assert "1234" in sb.portfolios
     assert isinstance(sb.portfolios["1234"], Portfolio)
     assert "1234" in sb.open_orders
-    assert isinstance(sb.open_orders["1234"], queue.Queue)
+    assert isinstance(sb.open_orders["1234"], DequeOrderBook)
 
     # If portfolio is already in the dictionary
     # then raise ValueError
@@ -655,3 +664,235 @@ def test_update_sets_correct_time():
     sb = SimulatedBroker(start_dt, exchange, data_handler)
     sb.update(new_dt)
     assert sb.current_dt == new_dt
+
+
+class DataHandlerMockPriceDt(object):
+    def __init__(self):
+        self.price_dt = None
+        self.mid_price = 50.0
+        self.priced_assets = []
+
+    def get_latest_price_dt(self, dt):
+        return self.price_dt
+
+    def get_asset_latest_bid_ask_price(self, dt, asset):
+        return (self.mid_price, self.mid_price)
+
+    def get_assets_latest_prices(self, dt, assets, side='mid'):
+        self.priced_assets.append(list(assets))
+        return np.full(len(assets), self.mid_price)
+
+
+def test_update_skips_revaluation_without_new_prices():
+    """
+    Tests that the update method solely revalues portfolio positions
+    when the data handler reports a new price timestamp, or when the
+    portfolio has transacted since its last revaluation.
+    """
+    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
+    open_dt = pd.Timestamp('2017-10-05 14:30:00', tz=pytz.UTC)
+    close_dt = pd.Timestamp('2017-10-05 21:00:00', tz=pytz.UTC)
+    data_handler = DataHandlerMockPriceDt()
+
+    sb = SimulatedBroker(start_dt, ExchangeMockPrice(), data_handler)
+    sb.create_portfolio(portfolio_id=1234, name="My Portfolio #1")
+    sb.subscribe_funds_to_account(100000.0)
+    sb.subscribe_funds_to_portfolio("1234", 100000.00)
+    sb.submit_order("1234", OrderMock('EQ:ABC', 100))
+
+    # Undetermined price timestamps always revalue, the
+    # order is executed after revaluation
+    sb.update(open_dt)
+    assert data_handler.priced_assets == []
+    data_handler.price_dt = open_dt
+    data_handler.mid_price = 51.0
+
+    # Transacted portfolio is revalued despite unchanged prices
+    sb.update(open_dt + pd.Timedelta(minutes=1))
+    assert data_handler.priced_assets == [['EQ:ABC']]
+    assert sb.portfolios["1234"].total_market_value == 5100.0
+
+    # Unchanged prices are skipped
+    data_handler.mid_price = 52.0
+    sb.update(open_dt + pd.Timedelta(minutes=2))
+    assert data_handler.priced_assets == [['EQ:ABC']]
+    assert sb.portfolios["1234"].total_market_value == 5100.0
+
+    # New price timestamp revalues
+    data_handler.price_dt = close_dt
+    sb.update(close_dt)
+    assert data_handler.priced_assets == [['EQ:ABC'], ['EQ:ABC']]
+    assert sb.portfolios["1234"].total_market_value == 5200.0
+
+
+def test_event_sink_receives_broker_and_portfolio_events():
+    """
+    Tests that a sink attached to the broker event logger receives
+    the order events of the broker along with the events of its
+    portfolios.
+    """
+    start_dt = pd.Timestamp('2017-10-05 08:00:00', tz=pytz.UTC)
+    sb = SimulatedBroker(start_dt, ExchangeMockPrice(), DataHandlerMockPriceDt())
+    sb.create_portfolio(portfolio_id=1234, name="My Portfolio #1")
+    sink = MemoryEventSink()
+    sb.event_logger.add_sink(sink)
+
+    sb.subscribe_funds_to_account(100000.0)
+    sb.subscribe_funds_to_portfolio("1234", 100000.00)
+    sb.submit_order("1234", OrderMock('EQ:ABC', 100))
+    sb.update(pd.Timestamp('2017-10-05 14:30:00', tz=pytz.UTC))
+
+    assert [(record['source'], record['event']) for record in sink.records] == [
+        ('Portfolio', 'funds_subscribed'),
+        ('SimulatedBroker', 'order_submitted'),
+        ('Portfolio', 'asset_transacted'),
+        ('SimulatedBroker', 'order_executed')
+    ]
+    assert sink.records[3]['quantity'] == 100
+    assert sink.records[3]['price'] == 50.0
+
+
+class DataHandlerMockBatchPrice(object):
+    def __init__(self, prices):
+        self.prices = prices
+        self.bid_ask_calls = []
+
+    def get_assets_latest_bid_ask_prices(self, dt, assets):
+        self.bid_ask_calls.append(list(assets))
+        bids = np.array([self.prices[asset] for asset in assets])
+        return (bids, bids + 0.02)
+
+    def get_assets_latest_prices(self, dt, assets, side='mid'):
+        return np.array([self.prices[asset] for asset in assets]) + 0.01
+
+
+def test_submit_orders_executes_batch_in_single_pass():
+    """
+    Tests that a batch of submitted orders is executed by a single
+    update, sells prior to buys, with the prices of all ordered
+    assets obtained in a single call.
+    """
+    start_dt = pd.Timestamp('2017-10-05 14:30:00', tz=pytz.UTC)
+    data_handler = DataHandlerMockBatchPrice({'EQ:ABC': 10.0, 'EQ:DEF': 20.0, 'EQ:GHI': 30.0})
+    sb = SimulatedBroker(start_dt, ExchangeMockPrice(), data_handler)
+    sb.create_portfolio(portfolio_id=1234, name="My Portfolio #1")
+    sb.subscribe_funds_to_account(100000.0)
+    sb.subscribe_funds_to_portfolio("1234", 100000.00)
+
+    with pytest.raises(KeyError):
+        sb.submit_orders("5678", [OrderMock('EQ:ABC', 100)])
+
+    sb.submit_orders(
+        "1234", [
+            OrderMock('EQ:ABC', 100, order_id=1),
+            OrderMock('EQ:DEF', -50, order_id=2),
+            OrderMock('EQ:GHI', 10, order_id=3),
+            OrderMock('EQ:ABC', -20, order_id=4)
+        ]
+    )
+    assert sb.open_orders["1234"].qsize() == 4
+    sb.update(start_dt)
+
+    assert data_handler.bid_ask_calls == [['EQ:DEF', 'EQ:ABC', 'EQ:GHI']]
+    assert sb.open_orders["1234"].empty()
+    assert [event.description.split(' ')[:3] for event in sb.portfolios["1234"].history[1:]] == [
+        ['SHORT', '-50', 'EQ:DEF'],
+        ['SHORT', '-20', 'EQ:ABC'],
+        ['LONG', '100', 'EQ:ABC'],
+        ['LONG', '10', 'EQ:GHI']
+    ]
+    positions = sb.portfolios["1234"].pos_handler.positions
+    assert positions['EQ:ABC'].net_quantity == 80
+    assert positions['EQ:ABC'].avg_bought == 10.02
+    assert positions['EQ:ABC'].avg_sold == 10.0
+    assert sb.portfolios["1234"].cash == 100000.0 + 50 * 20.0 + 20 * 10.0 - 100 * 10.02 - 10 * 30.02
+
+
+def test_order_book_cls():
+    """
+    Tests that the open orders of each portfolio are held within
+    the provided order book class, that non-OrderBook classes raise
+    TypeError and that the sell orders of all portfolios are
+    executed prior to the buy orders.
+    """
+    start_dt = pd.Timestamp('2017-10-05 14:30:00', tz=pytz.UTC)
+    data_handler = DataHandlerMockBatchPrice({'EQ:ABC': 10.0, 'EQ:DEF': 20.0})
+    with pytest.raises(TypeError):
+        SimulatedBroker(start_dt, ExchangeMockPrice(), data_handler, order_book_cls=list)
+
+    sb = SimulatedBroker(start_dt, ExchangeMockPrice(), data_handler, order_book_cls=LockedOrderBook)
+    sb.subscribe_funds_to_account(200000.0)
+    for portfolio_id in ["1234", "5678"]:
+        sb.create_portfolio(portfolio_id=portfolio_id)
+        sb.subscribe_funds_to_portfolio(portfolio_id, 100000.00)
+        assert isinstance(sb.open_orders[portfolio_id], LockedOrderBook)
+
+    sb.submit_orders("1234", [OrderMock('EQ:ABC', 100, order_id=1), OrderMock('EQ:DEF', -10, order_id=2)])
+    sb.submit_orders("5678", [OrderMock('EQ:ABC', -30, order_id=3), OrderMock('EQ:DEF', 20, order_id=4)])
+    executed = []
+    sb._execute_orders = lambda dt, orders: executed.extend(orders)
+    sb.update(start_dt)
+
+    assert [(portfolio_id, order.order_id) for portfolio_id, order in executed] == [
+        ("1234", 2), ("5678", 3), ("1234", 1), ("5678", 4)
+    ]
+
+
+def test_execute_orders_calculates_fees_in_single_call():
+    """
+    Tests that the fees of a batch of orders are calculated with
+    a single call to the fee model and applied to each transaction.
+    """
+    start_dt = pd.Timestamp('2017-10-05 14:30:00', tz=pytz.UTC)
+    data_handler = DataHandlerMockBatchPrice({'EQ:ABC': 10.0, 'EQ:DEF': 20.0})
+    fee_model = PercentFeeModel(commission_pct=0.001, tax_pct=0.005)
+    calls = []
+    calc_total_costs = fee_model.calc_total_costs
+    fee_model.calc_total_costs = lambda *args, **kwargs: calls.append(args) or calc_total_costs(*args, **kwargs)
+
+    sb = SimulatedBroker(start_dt, ExchangeMockPrice(), data_handler, fee_model=fee_model)
+    sb.create_portfolio(portfolio_id=1234)
+    sb.subscribe_funds_to_account(100000.0)
+    sb.subscribe_funds_to_portfolio("1234", 100000.00)
+    sb.submit_orders("1234", [OrderMock('EQ:ABC', 100), OrderMock('EQ:DEF', -50)])
+    sb.update(start_dt)
+
+    assert len(calls) == 1
+    assert calls[0][0] == ['EQ:DEF', 'EQ:ABC']
+    positions = sb.portfolios["1234"].pos_handler.positions
+    assert positions['EQ:ABC'].buy_commission == fee_model.calc_total_cost('EQ:ABC', 100, 1002, sb)
+    assert positions['EQ:DEF'].sell_commission == fee_model.calc_total_cost('EQ:DEF', -50, -1000, sb)
+
+
+def test_get_portfolio_quantities():
+    """
+    Tests that the portfolio quantities are aligned to the
+    held assets and agree with the portfolio dictionary,
+    including the integer type of each quantity.
+    """
+    start_dt = pd.Timestamp('2017-10-05 14:30:00', tz=pytz.UTC)
+    data_handler = DataHandlerMockBatchPrice({'EQ:ABC': 10.0, 'EQ:DEF': 20.0})
+    sb = SimulatedBroker(start_dt, ExchangeMockPrice(), data_handler)
+    sb.create_portfolio(portfolio_id=1234)
+    sb.subscribe_funds_to_account(100000.0)
+    sb.subscribe_funds_to_portfolio("1234", 100000.00)
+
+    with pytest.raises(KeyError):
+        sb.get_portfolio_quantities("5678")
+
+    assets, quantities, integral = sb.get_portfolio_quantities("1234")
+    assert assets == []
+    assert len(quantities) == 0
+    assert len(integral) == 0
+
+    sb.submit_orders("1234", [OrderMock('EQ:ABC', 100), OrderMock('EQ:DEF', -50.0)])
+    sb.update(start_dt)
+
+    assets, quantities, integral = sb.get_portfolio_quantities("1234")
+    portfolio = sb.get_portfolio_as_dict("1234")
+    assert assets == list(portfolio.keys())
+    assert quantities.tolist() == [portfolio[asset]["quantity"] for asset in assets]
+    assert integral.tolist() == [isinstance(portfolio[asset]["quantity"], int) for asset in assets]
+    assert Broker.get_portfolio_quantities(sb, "1234")[0] == assets
+    assert Broker.get_portfolio_quantities(sb, "1234")[1].tolist() == quantities.tolist()
+    assert Broker.get_portfolio_quantities(sb, "1234")[2].tolist() == integral.tolist()
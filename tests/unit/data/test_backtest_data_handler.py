@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.data.backtest_data_handler import BacktestDataHandler
+
+
+class DataSourceMock(object):
+    def __init__(self, bids, asks):
+        self.bids = bids
+        self.asks = asks
+
+    def get_bid(self, dt, asset):
+        return self.bids[asset]
+
+    def get_ask(self, dt, asset):
+        return self.asks[asset]
+
+    def get_assets_latest_prices(self, dt, assets, side='mid'):
+        prices = self.bids if side == 'bid' else self.asks
+        return np.array([prices.get(asset, np.nan) for asset in assets])
+
+
+class DataSourceMockException(object):
+    def get_assets_latest_prices(self, dt, assets, side='mid'):
+        raise ValueError("No prices available!")
+
+
+@pytest.mark.parametrize('side', ['bid', 'ask', 'mid'])
+def test_get_assets_latest_prices_matches_single_asset_methods(side):
+    """
+    Checks that the cross-sectional price snapshot matches the
+    single asset price methods, falling back to subsequent data
+    sources for any assets that could not be priced.
+    """
+    dt = pd.Timestamp('2020-01-02 14:30:00', tz=pytz.UTC)
+    assets = ['EQ:ABC', 'EQ:DEF', 'EQ:GHI', 'EQ:JKL']
+    first_ds = DataSourceMock(
+        {'EQ:ABC': 10.0, 'EQ:DEF': np.nan},
+        {'EQ:ABC': 10.5, 'EQ:DEF': np.nan}
+    )
+    second_ds = DataSourceMock(
+        {'EQ:DEF': 20.0, 'EQ:GHI': 30.0},
+        {'EQ:DEF': 20.5, 'EQ:GHI': 30.5}
+    )
+    data_handler = BacktestDataHandler(
+        None, data_sources=[DataSourceMockException(), first_ds, second_ds]
+    )
+
+    single_method = {
+        'bid': data_handler.get_asset_latest_bid_price,
+        'ask': data_handler.get_asset_latest_ask_price,
+        'mid': data_handler.get_asset_latest_mid_price
+    }[side]
+    expected = [single_method(dt, asset) for asset in assets]
+
+    result = data_handler.get_assets_latest_prices(dt, assets, side=side)
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_get_assets_latest_bid_ask_prices_matches_single_asset_method():
+    """
+    Checks that the cross-sectional bid and ask prices match
+    the single asset bid/ask price method.
+    """
+    dt = pd.Timestamp('2020-01-02 14:30:00', tz=pytz.UTC)
+    assets = ['EQ:ABC', 'EQ:DEF', 'EQ:GHI']
+    data_handler = BacktestDataHandler(
+        None, data_sources=[
+            DataSourceMock({'EQ:ABC': 10.0, 'EQ:DEF': 20.0}, {'EQ:ABC': 10.5, 'EQ:DEF': 20.5})
+        ]
+    )
+    bids, asks = data_handler.get_assets_latest_bid_ask_prices(dt, assets)
+    expected = [data_handler.get_asset_latest_bid_ask_price(dt, asset) for asset in assets]
+    np.testing.assert_array_equal(bids, [bid_ask[0] for bid_ask in expected])
+    np.testing.assert_array_equal(asks, [bid_ask[1] for bid_ask in expected])
+
+
+def test_get_assets_latest_prices_unknown_side():
+    """
+    Checks that an unknown price side raises a ValueError.
+    """
+    dt = pd.Timestamp('2020-01-02 14:30:00', tz=pytz.UTC)
+    data_handler = BacktestDataHandler(None, data_sources=[])
+    with pytest.raises(ValueError):
+        data_handler.get_assets_latest_prices(dt, ['EQ:ABC'], side='last')
+
+
+class PriceDtDataSourceMock(object):
+    def __init__(self, latest_dt):
+        self.latest_dt = latest_dt
+
+    def get_latest_price_dt(self, dt):
+        return self.latest_dt
+
+
+def test_get_latest_price_dt():
+    """
+    Checks that the latest price timestamp is the latest across
+    all data sources, or None if any data source cannot provide it.
+    """
+    universe = object()
+    dt = pd.Timestamp('2020-01-03 23:59:00', tz=pytz.UTC)
+    open_dt = pd.Timestamp('2020-01-03 14:30:00', tz=pytz.UTC)
+    close_dt = pd.Timestamp('2020-01-03 21:00:00', tz=pytz.UTC)
+
+    dh = BacktestDataHandler(
+        universe, data_sources=[PriceDtDataSourceMock(open_dt), PriceDtDataSourceMock(close_dt)]
+    )
+    assert dh.get_latest_price_dt(dt) == close_dt
+
+    dh = BacktestDataHandler(
+        universe, data_sources=[PriceDtDataSourceMock(close_dt), PriceDtDataSourceMock(None)]
+    )
+    assert dh.get_latest_price_dt(dt) is None
+
+    dh = BacktestDataHandler(
+        universe, data_sources=[PriceDtDataSourceMock(close_dt), DataSourceMockException()]
+    )
+    assert dh.get_latest_price_dt(dt) is None
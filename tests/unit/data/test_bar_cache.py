@@ -0,0 +1,122 @@
+import mmap
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from qstrader.asset.equity import Equity
+from qstrader.data.bar_cache import DailyBarCache
+from qstrader.data.daily_bar_array import ArrayDailyBarDataSource
+from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
+
+
+@pytest.fixture
+def csv_dir(tmp_path):
+    csv_path = tmp_path / 'csv'
+    csv_path.mkdir()
+    dates = pd.bdate_range('2020-01-01', '2020-01-31')
+    rng = np.random.default_rng(7)
+    for symbol in ('ABC', 'DEF'):
+        close = 50.0 + np.cumsum(rng.normal(size=len(dates)))
+        pd.DataFrame(
+            {
+                'Date': dates.strftime('%Y-%m-%d'),
+                'Open': close + rng.normal(size=len(dates)),
+                'Close': close,
+                'Adj Close': close * 0.95,
+                'Volume': rng.integers(1000, 2000, size=len(dates))
+            }
+        ).to_csv(csv_path / ('%s.csv' % symbol), index=False)
+    return str(csv_path)
+
+
+@pytest.mark.parametrize('adjust_prices', [True, False])
+def test_cached_data_source_matches_uncached(csv_dir, tmp_path, adjust_prices):
+    """
+    Checks that both the initial (populating) and subsequent
+    (memory-mapped) loads of a cached data source produce
+    DataFrames identical to those of an uncached data source.
+    """
+    cache_dir = str(tmp_path / 'cache')
+    uncached_ds = CSVDailyBarDataSource(
+        csv_dir, Equity, adjust_prices=adjust_prices
+    )
+    for _ in range(2):
+        cached_ds = CSVDailyBarDataSource(
+            csv_dir, Equity, adjust_prices=adjust_prices, cache_dir=cache_dir
+        )
+        for asset in ('EQ:ABC', 'EQ:DEF'):
+            pd.testing.assert_frame_equal(
+                cached_ds.asset_bar_frames[asset],
+                uncached_ds.asset_bar_frames[asset]
+            )
+            pd.testing.assert_frame_equal(
+                cached_ds.asset_bid_ask_frames[asset],
+                uncached_ds.asset_bid_ask_frames[asset]
+            )
+
+
+def test_cached_data_source_avoids_parsing_csv(csv_dir, tmp_path, monkeypatch):
+    """
+    Checks that a second data source created over unmodified CSV
+    files neither parses nor converts them, and that the price
+    arrays are memory-mapped from the cache.
+    """
+    cache_dir = str(tmp_path / 'cache')
+    ArrayDailyBarDataSource(csv_dir, Equity, cache_dir=cache_dir)
+
+    def fail(*args, **kwargs):
+        raise AssertionError('CSV data should have been loaded from the cache')
+
+    monkeypatch.setattr(CSVDailyBarDataSource, '_load_csv_into_df', fail)
+    monkeypatch.setattr(
+        CSVDailyBarDataSource, '_convert_bar_frame_into_bid_ask_df', fail
+    )
+    ds = ArrayDailyBarDataSource(csv_dir, Equity, cache_dir=cache_dir)
+    base = ds.asset_bid_ask_frames['EQ:ABC']['Bid'].to_numpy()
+    while getattr(base, 'base', None) is not None:
+        base = base.base
+    assert isinstance(base, mmap.mmap)
+    dt = pd.Timestamp('2020-01-15 21:00:00', tz='UTC')
+    assert not np.isnan(ds.get_bid(dt, 'EQ:ABC'))
+
+
+def test_cache_invalidated_by_modified_csv(csv_dir, tmp_path):
+    """
+    Checks that modifying a CSV file invalidates its cache entry
+    and that the stale entry is removed.
+    """
+    cache_dir = str(tmp_path / 'cache')
+    CSVDailyBarDataSource(csv_dir, Equity, cache_dir=cache_dir)
+
+    csv_path = os.path.join(csv_dir, 'ABC.csv')
+    csv_df = pd.read_csv(csv_path)
+    csv_df['Close'] *= 2.0
+    csv_df.to_csv(csv_path, index=False)
+    stat = os.stat(csv_path)
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    cached_ds = CSVDailyBarDataSource(csv_dir, Equity, cache_dir=cache_dir)
+    uncached_ds = CSVDailyBarDataSource(csv_dir, Equity)
+    pd.testing.assert_frame_equal(
+        cached_ds.asset_bid_ask_frames['EQ:ABC'],
+        uncached_ds.asset_bid_ask_frames['EQ:ABC']
+    )
+    cache = DailyBarCache(cache_dir)
+    assert len(os.listdir(cache._file_dir(csv_path))) == 1
+
+
+def test_cache_does_not_store_object_columns(tmp_path):
+    """
+    Checks that DataFrames with non-numeric columns are not cached.
+    """
+    csv_path = tmp_path / 'XYZ.csv'
+    csv_path.write_text('Date,Close\n2020-01-01,1.0\n')
+    df = pd.DataFrame(
+        {'Close': [1.0], 'Name': ['XYZ']},
+        index=pd.DatetimeIndex(['2020-01-01'], name='Date')
+    )
+    cache = DailyBarCache(str(tmp_path / 'cache'))
+    assert not cache.save(str(csv_path), 'bar', {}, df)
+    assert cache.load(str(csv_path), 'bar', {}) is None
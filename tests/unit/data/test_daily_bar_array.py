@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.asset.equity import Equity
+from qstrader.data.daily_bar_array import ArrayDailyBarDataSource
+from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
+
+
+@pytest.fixture
+def csv_dir(tmp_path):
+    dates = pd.bdate_range('2020-01-01', '2020-02-28')
+    rng = np.random.default_rng(42)
+    for symbol in ('ABC', 'DEF'):
+        close = 100.0 + np.cumsum(rng.normal(size=len(dates)))
+        pd.DataFrame(
+            {
+                'Date': dates.strftime('%Y-%m-%d'),
+                'Open': close + rng.normal(size=len(dates)),
+                'Close': close,
+                'Adj Close': close * 0.98
+            }
+        ).to_csv(tmp_path / ('%s.csv' % symbol), index=False)
+    return str(tmp_path)
+
+
+def test_array_data_source_matches_csv_data_source(csv_dir):
+    """
+    Checks that the array-backed data source provides identical
+    bid/ask prices to the DataFrame-backed CSV data source for
+    all timestamps within the price history.
+    """
+    csv_ds = CSVDailyBarDataSource(csv_dir, Equity)
+    array_ds = ArrayDailyBarDataSource(csv_dir, Equity)
+
+    query_dts = pd.date_range(
+        '2020-01-01 14:30:00', '2020-02-28 21:00:00', freq='90min', tz=pytz.UTC
+    )
+    for asset in ('EQ:ABC', 'EQ:DEF'):
+        for dt in query_dts:
+            assert array_ds.get_bid(dt, asset) == csv_ds.get_bid(dt, asset)
+            assert array_ds.get_ask(dt, asset) == csv_ds.get_ask(dt, asset)
+
+    # Prior to the first available price no price is returned
+    early_dt = pd.Timestamp('2019-12-31 21:00:00', tz=pytz.UTC)
+    assert np.isnan(array_ds.get_bid(early_dt, 'EQ:ABC'))
+    assert np.isnan(array_ds.get_ask(early_dt, 'EQ:ABC'))
+
+
+@pytest.mark.parametrize('side', ['bid', 'ask', 'mid'])
+def test_get_assets_latest_prices(csv_dir, side):
+    """
+    Checks that the cross-sectional price snapshot of both the
+    array-backed and DataFrame-backed data sources agree, with
+    NaN for unknown assets.
+    """
+    csv_ds = CSVDailyBarDataSource(csv_dir, Equity)
+    array_ds = ArrayDailyBarDataSource(csv_dir, Equity)
+    assets = ['EQ:DEF', 'EQ:XYZ', 'EQ:ABC']
+
+    for dt in pd.date_range(
+        '2020-01-01 14:30:00', '2020-02-28 21:00:00', freq='13h', tz=pytz.UTC
+    ):
+        np.testing.assert_array_equal(
+            array_ds.get_assets_latest_prices(dt, assets, side=side),
+            csv_ds.get_assets_latest_prices(dt, assets, side=side)
+        )
+
+
+def test_lazy_loading_maintains_price_store(csv_dir):
+    """
+    Checks that lazily loaded and subsequently discarded assets are
+    added to and removed from the price store, with prices matching
+    those of eager loading.
+    """
+    eager_ds = ArrayDailyBarDataSource(csv_dir, Equity)
+    lazy_ds = ArrayDailyBarDataSource(
+        csv_dir, Equity, lazy=True, max_resident_assets=1
+    )
+    assert lazy_ds.price_store.assets == []
+
+    dt = pd.Timestamp('2020-02-03 21:00:00', tz=pytz.UTC)
+    assert lazy_ds.get_bid(dt, 'EQ:ABC') == eager_ds.get_bid(dt, 'EQ:ABC')
+    assert lazy_ds.price_store.assets == ['EQ:ABC']
+    assert lazy_ds.get_ask(dt, 'EQ:DEF') == eager_ds.get_ask(dt, 'EQ:DEF')
+    assert lazy_ds.price_store.assets == ['EQ:DEF']
+
+    assets = ['EQ:ABC', 'EQ:DEF']
+    np.testing.assert_array_equal(
+        lazy_ds.get_assets_latest_prices(dt, assets, side='bid'),
+        eager_ds.get_assets_latest_prices(dt, assets, side='bid')
+    )
+
+
+@pytest.mark.parametrize('data_source_cls', [CSVDailyBarDataSource, ArrayDailyBarDataSource])
+def test_get_latest_price_dt(csv_dir, data_source_cls):
+    """
+    Checks that the latest price timestamp is the preceding market
+    open or close, is None prior to any prices and is None (i.e.
+    undetermined) when loading lazily.
+    """
+    ds = data_source_cls(csv_dir, Equity)
+    assert ds.get_latest_price_dt(pd.Timestamp('2019-12-31 23:59:00', tz=pytz.UTC)) is None
+    for dt, expected in [
+        ('2020-01-02 14:30:00', '2020-01-02 14:30:00'),
+        ('2020-01-02 20:59:00', '2020-01-02 14:30:00'),
+        ('2020-01-02 23:59:00', '2020-01-02 21:00:00'),
+        ('2020-01-04 12:00:00', '2020-01-03 21:00:00'),
+        ('2020-03-02 14:30:00', '2020-02-28 21:00:00')
+    ]:
+        assert ds.get_latest_price_dt(
+            pd.Timestamp(dt, tz=pytz.UTC)
+        ) == pd.Timestamp(expected, tz=pytz.UTC)
+
+    lazy_ds = data_source_cls(csv_dir, Equity, lazy=True)
+    assert lazy_ds.get_latest_price_dt(pd.Timestamp('2020-01-02 14:30:00', tz=pytz.UTC)) is None
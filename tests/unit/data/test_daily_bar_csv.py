@@ -0,0 +1,230 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from qstrader import settings
+from qstrader.asset.equity import Equity
+from qstrader.data.daily_bar_csv import CSVDailyBarDataSource
+
+
+def _write_csv_files(csv_dir, symbols, adj_close=True):
+    dates = pd.bdate_range('2020-01-01', '2020-01-31')
+    rng = np.random.default_rng(11)
+    for symbol in symbols:
+        close = 20.0 + np.cumsum(rng.normal(size=len(dates)))
+        data = {
+            'Date': dates.strftime('%Y-%m-%d'),
+            'Open': close + rng.normal(size=len(dates)),
+            'Close': close
+        }
+        if adj_close:
+            data['Adj Close'] = close * 0.9
+        pd.DataFrame(data).to_csv(
+            csv_dir / ('%s.csv' % symbol), index=False
+        )
+
+
+@pytest.mark.parametrize('adjust_prices', [True, False])
+def test_parallel_loading_matches_serial(tmp_path, capsys, monkeypatch, adjust_prices):
+    """
+    Checks that loading the CSV files across a process pool
+    produces identical DataFrames and output to serial loading.
+    """
+    monkeypatch.setattr(settings, 'PRINT_EVENTS', True)
+    _write_csv_files(tmp_path, ['ABC', 'DEF', 'GHI', 'JKL'])
+    csv_symbols = ['JKL', 'ABC', 'GHI', 'DEF']
+
+    serial_ds = CSVDailyBarDataSource(
+        str(tmp_path), Equity, adjust_prices=adjust_prices,
+        csv_symbols=csv_symbols
+    )
+    serial_out = capsys.readouterr().out
+    parallel_ds = CSVDailyBarDataSource(
+        str(tmp_path), Equity, adjust_prices=adjust_prices,
+        csv_symbols=csv_symbols, n_workers=2
+    )
+    parallel_out = capsys.readouterr().out
+
+    assert parallel_out == serial_out
+    assert list(parallel_ds.asset_bar_frames) == list(serial_ds.asset_bar_frames)
+    assert list(parallel_ds.asset_bid_ask_frames) == list(serial_ds.asset_bid_ask_frames)
+    for asset in serial_ds.asset_bar_frames:
+        pd.testing.assert_frame_equal(
+            parallel_ds.asset_bar_frames[asset],
+            serial_ds.asset_bar_frames[asset]
+        )
+        pd.testing.assert_frame_equal(
+            parallel_ds.asset_bid_ask_frames[asset],
+            serial_ds.asset_bid_ask_frames[asset]
+        )
+
+
+@pytest.mark.parametrize('n_workers', [None, 2])
+def test_missing_adjusted_close_raises(tmp_path, capsys, monkeypatch, n_workers):
+    """
+    Checks that a CSV file without adjusted closing prices raises
+    the same error, after the same output, for both serial and
+    parallel loading.
+    """
+    monkeypatch.setattr(settings, 'PRINT_EVENTS', True)
+    _write_csv_files(tmp_path, ['ABC', 'GHI'])
+    _write_csv_files(tmp_path, ['DEF'], adj_close=False)
+
+    with pytest.raises(ValueError) as excinfo:
+        CSVDailyBarDataSource(
+            str(tmp_path), Equity, csv_symbols=['ABC', 'DEF', 'GHI'],
+            n_workers=n_workers
+        )
+    assert str(excinfo.value) == (
+        "Unable to locate Adjusted Close pricing column in CSV data file. "
+        "Prices cannot be adjusted. Exiting."
+    )
+    assert capsys.readouterr().out.splitlines() == [
+        "Loading CSV files into DataFrames...",
+        "Loading CSV file for symbol 'EQ:ABC'...",
+        "Loading CSV file for symbol 'EQ:DEF'...",
+        "Loading CSV file for symbol 'EQ:GHI'...",
+        "Adjusting pricing in CSV files...",
+        "Adjusting CSV file for symbol 'EQ:ABC'...",
+        "Adjusting CSV file for symbol 'EQ:DEF'..."
+    ]
+
+
+def test_parallel_loading_missing_file_raises(tmp_path):
+    """
+    Checks that a missing CSV file raises FileNotFoundError
+    when loading in parallel, as it does when loading serially.
+    """
+    _write_csv_files(tmp_path, ['ABC'])
+    with pytest.raises(FileNotFoundError):
+        CSVDailyBarDataSource(
+            str(tmp_path), Equity, csv_symbols=['ABC', 'XYZ'], n_workers=2
+        )
+
+
+def test_lazy_loading_loads_assets_on_demand(tmp_path):
+    """
+    Checks that lazy loading defers loading each CSV file until its
+    asset is first queried, and that the queried prices match those
+    of eager loading.
+    """
+    _write_csv_files(tmp_path, ['ABC', 'DEF', 'GHI'])
+    eager_ds = CSVDailyBarDataSource(str(tmp_path), Equity)
+    lazy_ds = CSVDailyBarDataSource(str(tmp_path), Equity, lazy=True)
+    assert len(lazy_ds.asset_bid_ask_frames) == 0
+
+    dt = pd.Timestamp('2020-01-15 14:30:00', tz='UTC')
+    assert lazy_ds.get_bid(dt, 'EQ:DEF') == eager_ds.get_bid(dt, 'EQ:DEF')
+    assert list(lazy_ds.asset_bid_ask_frames) == ['EQ:DEF']
+
+    start_dt = pd.Timestamp('2020-01-06', tz='UTC')
+    end_dt = pd.Timestamp('2020-01-24', tz='UTC')
+    pd.testing.assert_frame_equal(
+        lazy_ds.get_assets_historical_closes(start_dt, end_dt, ['EQ:ABC', 'EQ:GHI']),
+        eager_ds.get_assets_historical_closes(start_dt, end_dt, ['EQ:ABC', 'EQ:GHI'])
+    )
+    assert sorted(lazy_ds.asset_bid_ask_frames) == ['EQ:ABC', 'EQ:DEF', 'EQ:GHI']
+
+    with pytest.raises(KeyError):
+        lazy_ds.get_ask(dt, 'EQ:XYZ')
+
+
+def test_lazy_loading_evicts_least_recently_queried(tmp_path):
+    """
+    Checks that the number of resident assets is bounded, with the
+    least recently queried assets discarded first, except where
+    required by the current query.
+    """
+    _write_csv_files(tmp_path, ['ABC', 'DEF', 'GHI'])
+    eager_ds = CSVDailyBarDataSource(str(tmp_path), Equity)
+    lazy_ds = CSVDailyBarDataSource(
+        str(tmp_path), Equity, lazy=True, max_resident_assets=2
+    )
+    dt = pd.Timestamp('2020-01-20 21:00:00', tz='UTC')
+
+    lazy_ds.get_assets_historical_closes(dt, dt, ['EQ:ABC'])
+    lazy_ds.get_assets_historical_closes(dt, dt, ['EQ:DEF'])
+    lazy_ds.get_assets_historical_closes(dt, dt, ['EQ:ABC'])
+    lazy_ds.get_assets_historical_closes(dt, dt, ['EQ:GHI'])
+    assert list(lazy_ds.asset_bid_ask_frames) == ['EQ:ABC', 'EQ:GHI']
+    assert list(lazy_ds.asset_bar_frames) == ['EQ:ABC', 'EQ:GHI']
+
+    assets = ['EQ:ABC', 'EQ:DEF', 'EQ:GHI']
+    np.testing.assert_array_equal(
+        lazy_ds.get_assets_latest_prices(dt, assets, side='mid'),
+        eager_ds.get_assets_latest_prices(dt, assets, side='mid')
+    )
+
+
+def test_lazy_loading_repeated_query_marks_asset_recent(tmp_path):
+    """
+    Checks that repeating an identical price query on a resident
+    asset marks it as the most recently queried, so that it is
+    not the asset discarded when the bound is next exceeded.
+    """
+    _write_csv_files(tmp_path, ['ABC', 'DEF', 'GHI'])
+    lazy_ds = CSVDailyBarDataSource(
+        str(tmp_path), Equity, lazy=True, max_resident_assets=2
+    )
+    dt = pd.Timestamp('2020-01-20 21:00:00', tz='UTC')
+
+    lazy_ds.get_bid(dt, 'EQ:ABC')
+    lazy_ds.get_bid(dt, 'EQ:DEF')
+    lazy_ds.get_bid(dt, 'EQ:ABC')
+    lazy_ds.get_ask(dt, 'EQ:GHI')
+    assert list(lazy_ds.asset_bid_ask_frames) == ['EQ:ABC', 'EQ:GHI']
+
+
+@pytest.mark.parametrize(
+    'adjust_prices,open_offset,close_offset,expected_times,expected_prices',
+    [
+        (
+            True, pd.Timedelta(hours=14, minutes=30), pd.Timedelta(hours=21),
+            ['14:30', '21:00'], [4.5, 9.0, 9.0, 11.0, 11.5, 12.0]
+        ),
+        (
+            False, pd.Timedelta(hours=14, minutes=30), pd.Timedelta(hours=21),
+            ['14:30', '21:00'], [10.0, 20.0, 20.0, 22.0, 23.0, 24.0]
+        ),
+        (
+            True, pd.Timedelta(hours=8), pd.Timedelta(hours=16, minutes=30),
+            ['08:00', '16:30'], [4.5, 9.0, 9.0, 11.0, 11.5, 12.0]
+        )
+    ]
+)
+def test_convert_bar_frame_into_bid_ask_df(
+    tmp_path, adjust_prices, open_offset, close_offset,
+    expected_times, expected_prices
+):
+    """
+    Checks that unsorted daily bars are converted into interleaved,
+    forward-filled and optionally adjusted open/close prices,
+    timestamped with the configured market open/close offsets.
+    """
+    ds = CSVDailyBarDataSource(
+        str(tmp_path), Equity, adjust_prices=adjust_prices,
+        market_open_offset=open_offset, market_close_offset=close_offset
+    )
+    bar_df = pd.DataFrame(
+        {
+            'Open': [23.0, 10.0, np.nan],
+            'Close': [24.0, 20.0, 22.0],
+            'Adj Close': [12.0, 9.0, 11.0]
+        },
+        index=pd.DatetimeIndex(
+            ['2020-01-03', '2020-01-01', '2020-01-02'], name='Date'
+        ).tz_localize('UTC')
+    )
+
+    bid_ask_df = ds._convert_bar_frame_into_bid_ask_df(bar_df)
+    expected_index = pd.DatetimeIndex(
+        [
+            '2020-01-%02d %s' % (day, time)
+            for day in (1, 2, 3) for time in expected_times
+        ],
+        name='Date'
+    ).tz_localize('UTC').as_unit(bid_ask_df.index.unit)
+    expected_df = pd.DataFrame(
+        {'Bid': expected_prices, 'Ask': expected_prices}, index=expected_index
+    )
+    pd.testing.assert_frame_equal(bid_ask_df, expected_df)
@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.data.price_store import BidAskPriceStore
+
+
+def _bid_ask_frame():
+    index = pd.DatetimeIndex(
+        [
+            '2020-01-02 14:30:00', '2020-01-02 21:00:00',
+            '2020-01-03 14:30:00', '2020-01-03 21:00:00'
+        ], name='Date'
+    ).tz_localize(pytz.UTC)
+    return pd.DataFrame(
+        {
+            'Bid': [100.0, 101.5, 102.25, 99.75],
+            'Ask': [100.5, 102.0, 102.75, 100.25]
+        },
+        index=index
+    )
+
+
+@pytest.mark.parametrize(
+    'dt,expected_bid,expected_ask',
+    [
+        ('2020-01-01 21:00:00', np.nan, np.nan),
+        ('2020-01-02 14:29:59', np.nan, np.nan),
+        ('2020-01-02 14:30:00', 100.0, 100.5),
+        ('2020-01-02 18:00:00', 100.0, 100.5),
+        ('2020-01-02 21:00:00', 101.5, 102.0),
+        ('2020-01-03 14:30:00', 102.25, 102.75),
+        ('2020-01-06 14:30:00', 99.75, 100.25)
+    ]
+)
+def test_get_bid_ask(dt, expected_bid, expected_ask):
+    """
+    Checks that the price store returns the latest bid/ask
+    prices at or before the provided timestamp and NaN prior
+    to the first available price.
+    """
+    store = BidAskPriceStore.from_bid_ask_frames({'EQ:ABC': _bid_ask_frame()})
+    ts = pd.Timestamp(dt, tz=pytz.UTC)
+
+    np.testing.assert_equal(store.get_bid(ts, 'EQ:ABC'), expected_bid)
+    np.testing.assert_equal(store.get_ask(ts, 'EQ:ABC'), expected_ask)
+
+
+def test_add_and_remove_asset():
+    """
+    Checks that assets can be added and removed from the store
+    and that mismatched array lengths raise.
+    """
+    store = BidAskPriceStore()
+    ts = pd.Timestamp('2020-01-02 14:30:00', tz=pytz.UTC)
+
+    store.add_asset('EQ:ABC', [ts.value], [10.0], [10.5])
+    assert 'EQ:ABC' in store
+    assert store.assets == ['EQ:ABC']
+    assert store.get_ask(ts, 'EQ:ABC') == 10.5
+
+    with pytest.raises(ValueError):
+        store.add_asset('EQ:DEF', [ts.value], [10.0, 11.0], [10.5])
+
+    store.remove_asset('EQ:ABC')
+    assert len(store) == 0
+    with pytest.raises(KeyError):
+        store.get_bid(ts, 'EQ:ABC')
+
+
+def test_get_bids_asks_matches_scalar_lookups():
+    """
+    Checks that the vectorised cross-sectional lookups match the
+    scalar lookups for assets with differing price histories,
+    including unknown assets and timestamps prior to any price.
+    """
+    rng = np.random.default_rng(1234)
+    store = BidAskPriceStore()
+    base_ts = pd.Timestamp('2020-01-01 14:30:00', tz=pytz.UTC).value
+    for i, length in enumerate([1, 2, 7, 50, 333]):
+        timestamps = base_ts + np.sort(
+            rng.choice(10000, size=length, replace=False)
+        ) * 60 * 10**9
+        bids = rng.uniform(10.0, 20.0, size=length)
+        store.add_asset('EQ:%s' % i, timestamps, bids, bids + 0.01)
+
+    assets = ['EQ:4', 'EQ:0', 'EQ:XYZ', 'EQ:2', 'EQ:1', 'EQ:3']
+    for minutes in [-1, 0, 1, 59, 600, 5000, 9999, 20000]:
+        dt = pd.Timestamp(base_ts + minutes * 60 * 10**9, tz=pytz.UTC)
+        expected_bids = [
+            store.get_bid(dt, asset) if asset in store else np.nan
+            for asset in assets
+        ]
+        expected_asks = [
+            store.get_ask(dt, asset) if asset in store else np.nan
+            for asset in assets
+        ]
+        np.testing.assert_array_equal(store.get_bids(dt, assets), expected_bids)
+        np.testing.assert_array_equal(store.get_asks(dt, assets), expected_asks)
+
+    assert len(BidAskPriceStore().get_bids(pd.Timestamp(base_ts, tz=pytz.UTC), assets)) == 6
@@ -0,0 +1,134 @@
+from concurrent.futures import ProcessPoolExecutor
+import mmap
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.asset.equity import Equity
+from qstrader.data.daily_bar_array import ArrayDailyBarDataSource
+from qstrader.data.shared_price_store import SharedPriceStore
+
+
+@pytest.fixture
+def csv_dir(tmp_path):
+    csv_path = tmp_path / 'csv'
+    csv_path.mkdir()
+    rng = np.random.default_rng(3)
+    for symbol, start in (('ABC', '2020-01-01'), ('DEF', '2020-01-15')):
+        dates = pd.bdate_range(start, '2020-02-28')
+        close = 30.0 + np.cumsum(rng.normal(size=len(dates)))
+        pd.DataFrame(
+            {
+                'Date': dates.strftime('%Y-%m-%d'),
+                'Open': close + rng.normal(size=len(dates)),
+                'Close': close,
+                'Adj Close': close * 0.97
+            }
+        ).to_csv(csv_path / ('%s.csv' % symbol), index=False)
+    return str(csv_path)
+
+
+@pytest.fixture
+def shared_store(csv_dir, tmp_path):
+    data_source = ArrayDailyBarDataSource(csv_dir, Equity)
+    store = SharedPriceStore.publish(data_source, str(tmp_path / 'shared'))
+    yield store
+    store.unlink()
+
+
+def _latest_mid_prices(shared_store, dt, assets):
+    data_source = ArrayDailyBarDataSource.from_shared_price_store(
+        shared_store, Equity
+    )
+    return data_source.get_assets_latest_prices(dt, assets, side='mid')
+
+
+def test_attached_data_source_matches_loaded(csv_dir, shared_store):
+    """
+    Checks that a data source attached to published prices provides
+    identical prices and closes to one that loads the CSV files.
+    """
+    loaded_ds = ArrayDailyBarDataSource(csv_dir, Equity)
+    attached_ds = ArrayDailyBarDataSource.from_shared_price_store(
+        pickle.loads(pickle.dumps(shared_store)), Equity
+    )
+    assets = ['EQ:ABC', 'EQ:XYZ', 'EQ:DEF']
+    query_dts = pd.date_range(
+        '2019-12-31 21:00:00', '2020-02-28 21:00:00', freq='5h', tz=pytz.UTC
+    )
+    for dt in query_dts:
+        for side in ('bid', 'ask', 'mid'):
+            np.testing.assert_array_equal(
+                attached_ds.get_assets_latest_prices(dt, assets, side=side),
+                loaded_ds.get_assets_latest_prices(dt, assets, side=side)
+            )
+        np.testing.assert_array_equal(
+            attached_ds.get_bid(dt, 'EQ:ABC'), loaded_ds.get_bid(dt, 'EQ:ABC')
+        )
+        np.testing.assert_array_equal(
+            attached_ds.get_ask(dt, 'EQ:DEF'), loaded_ds.get_ask(dt, 'EQ:DEF')
+        )
+
+    for start_dt, end_dt in (
+        (pd.Timestamp('2020-01-10', tz=pytz.UTC), pd.Timestamp('2020-02-03', tz=pytz.UTC)),
+        (None, pd.Timestamp('2020-01-20', tz=pytz.UTC)),
+        (pd.Timestamp('2020-02-20 14:30:00', tz=pytz.UTC), None)
+    ):
+        pd.testing.assert_frame_equal(
+            attached_ds.get_assets_historical_closes(start_dt, end_dt, assets),
+            loaded_ds.get_assets_historical_closes(start_dt, end_dt, assets),
+            check_freq=False
+        )
+
+
+def test_attached_prices_are_read_only_views(shared_store):
+    """
+    Checks that the attached price arrays are read-only and memory
+    mapped rather than copied into the attaching process.
+    """
+    attached_ds = ArrayDailyBarDataSource.from_shared_price_store(
+        shared_store, Equity
+    )
+    bids = attached_ds.price_store.bids['EQ:DEF']
+    assert not bids.flags.writeable
+    with pytest.raises(ValueError):
+        bids[0] = 0.0
+
+    base = bids
+    while getattr(base, 'base', None) is not None:
+        base = base.base
+    assert isinstance(base, mmap.mmap)
+
+
+def test_shared_prices_in_worker_processes(shared_store):
+    """
+    Checks that worker processes attach to the published prices.
+    """
+    dt = pd.Timestamp('2020-02-03 21:00:00', tz=pytz.UTC)
+    assets = ['EQ:ABC', 'EQ:DEF']
+    expected = _latest_mid_prices(shared_store, dt, assets)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = list(
+            executor.map(
+                _latest_mid_prices, [shared_store] * 2, [dt] * 2, [assets] * 2
+            )
+        )
+    for result in results:
+        np.testing.assert_array_equal(result, expected)
+
+
+def test_unlink_removes_published_prices(csv_dir):
+    """
+    Checks that publishing defaults to a new directory, which is
+    removed upon unlinking.
+    """
+    data_source = ArrayDailyBarDataSource(csv_dir, Equity)
+    store = SharedPriceStore.publish(data_source)
+    assert os.path.isdir(store.path)
+    assert store.assets == data_source.price_store.assets
+    store.unlink()
+    assert not os.path.exists(store.path)
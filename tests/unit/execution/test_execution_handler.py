@@ -0,0 +1,40 @@
+from unittest.mock import Mock
+
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.execution.execution_handler import ExecutionHandler
+
+
+@pytest.mark.parametrize(
+    'submit_orders,orders,expected_calls',
+    [
+        (True, ['order_1', 'order_2', 'order_3'], 1),
+        (True, [], 0),
+        (False, ['order_1', 'order_2'], 0)
+    ]
+)
+def test_orders_submitted_as_single_batch(submit_orders, orders, expected_calls):
+    """
+    Checks that the final orders are submitted to the broker as
+    a single batch, followed by a single broker update, and that
+    nothing is sent to the broker if there are no orders or
+    submission is disabled.
+    """
+    dt = pd.Timestamp('2019-01-02 14:30:00', tz=pytz.UTC)
+    broker = Mock()
+    execution_algo = Mock(side_effect=lambda dt, orders: orders)
+    handler = ExecutionHandler(
+        broker, '000001', Mock(), submit_orders=submit_orders,
+        execution_algo=execution_algo
+    )
+    handler(dt, orders)
+
+    execution_algo.assert_called_once_with(dt, orders)
+    assert broker.submit_orders.call_count == expected_calls
+    assert broker.update.call_count == expected_calls
+    broker.submit_order.assert_not_called()
+    if expected_calls:
+        broker.submit_orders.assert_called_once_with('000001', orders)
+        broker.update.assert_called_once_with(dt)
@@ -0,0 +1,71 @@
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader import settings
+from qstrader.broker.portfolio.portfolio_event import PortfolioEvent
+from qstrader.broker.portfolio.position import Position
+from qstrader.broker.transaction.transaction import Transaction
+from qstrader.execution.order import Order
+
+
+@pytest.fixture
+def integer_order_ids():
+    settings.set_integer_order_ids(True)
+    yield
+    settings.set_integer_order_ids(False)
+
+
+def test_order_ids_default_to_uuids():
+    """
+    Checks that order IDs are unique UUID hex strings by
+    default and that a provided order ID is retained.
+    """
+    dt = pd.Timestamp('2019-01-02 14:30:00', tz=pytz.UTC)
+    order_ids = [Order(dt, 'EQ:ABC', 100).order_id for _ in range(10)]
+    assert all(isinstance(order_id, str) and len(order_id) == 32 for order_id in order_ids)
+    assert len(set(order_ids)) == 10
+    assert Order(dt, 'EQ:ABC', 100, order_id='abc').order_id == 'abc'
+
+
+def test_integer_order_ids(integer_order_ids):
+    """
+    Checks that integer order IDs are monotonically increasing
+    when enabled and that a provided order ID is retained.
+    """
+    dt = pd.Timestamp('2019-01-02 14:30:00', tz=pytz.UTC)
+    order_ids = [Order(dt, 'EQ:ABC', 100).order_id for _ in range(10)]
+    assert all(isinstance(order_id, int) for order_id in order_ids)
+    assert order_ids == list(range(order_ids[0], order_ids[0] + 10))
+    assert Order(dt, 'EQ:ABC', 100, order_id=7).order_id == 7
+
+
+def test_order_representation():
+    """
+    Checks the Order representation.
+    """
+    dt = pd.Timestamp('2019-01-02 14:30:00', tz=pytz.UTC)
+    order = Order(dt, 'EQ:ABC', -100, commission=1.5, order_id=42)
+    assert repr(order) == (
+        "Order(dt='2019-01-02 14:30:00+00:00', asset='EQ:ABC', quantity=-100, "
+        "commission=1.5, direction=-1.0, order_id=42)"
+    )
+
+
+@pytest.mark.parametrize(
+    'obj',
+    [
+        Order(pd.Timestamp('2019-01-02 14:30:00', tz=pytz.UTC), 'EQ:ABC', 100),
+        Transaction('EQ:ABC', 100, pd.Timestamp('2019-01-02 14:30:00', tz=pytz.UTC), 10.0, 1),
+        PortfolioEvent.create_subscription(pd.Timestamp('2019-01-02 14:30:00', tz=pytz.UTC), 100.0, 100.0),
+        Position('EQ:ABC', 10.0, pd.Timestamp('2019-01-02 14:30:00', tz=pytz.UTC), 100, 0, 10.0, 0.0, 0.0, 0.0)
+    ]
+)
+def test_value_objects_are_slotted(obj):
+    """
+    Checks that the value objects have no per-instance
+    attribute dictionary.
+    """
+    assert not hasattr(obj, '__dict__')
+    with pytest.raises(AttributeError):
+        obj.unknown_attribute = 1
@@ -1,10 +1,11 @@
 from unittest.mock import Mock
 
+import numpy as np
 import pandas as pd
 import pytest
 import pytz
 
-
+from qstrader.broker.fee_model.percent_fee_model import PercentFeeModel
 from qstrader.portcon.order_sizer.dollar_weighted import (
     DollarWeightedCashBufferedOrderSizer
 )
@@ -133,10 +134,12 @@ def test_call(total_equity, cash_buffer_perc, weights, asset_prices, expected):
 
     broker = Mock()
     broker.get_portfolio_total_equity.return_value = total_equity
-    broker.fee_model.calc_total_cost.return_value = 0.0
+    broker.fee_model.calc_total_costs.side_effect = \
+        lambda assets, quantities, considerations, broker: np.zeros(len(assets))
 
     data_handler = Mock()
-    data_handler.get_asset_latest_ask_price.side_effect = lambda self, x: asset_prices[x]
+    data_handler.get_assets_latest_prices.side_effect = \
+        lambda dt, assets, side: np.array([asset_prices[asset] for asset in assets])
 
     order_sizer = DollarWeightedCashBufferedOrderSizer(
         broker, broker_portfolio_id, data_handler, cash_buffer_perc
@@ -144,3 +147,63 @@ def test_call(total_equity, cash_buffer_perc, weights, asset_prices, expected):
 
     result = order_sizer(dt, weights)
     assert result == expected
+
+
+def test_size_weights_matches_scalar_sizing():
+    """
+    Checks that the size_weights method produces quantities identical
+    to sizing each asset in turn with scalar arithmetic, including
+    percentage fees, for a large universe.
+    """
+    dt = pd.Timestamp('2019-01-01 15:00:00', tz=pytz.utc)
+    rng = np.random.default_rng(42)
+    assets = ['EQ:%04d' % i for i in range(1000)]
+    weights = rng.uniform(0.0, 1.0, len(assets))
+    prices = rng.uniform(1.0, 1000.0, len(assets))
+    total_equity = 1234567.89
+    fee_model = PercentFeeModel(commission_pct=0.001, tax_pct=0.005)
+
+    broker = Mock()
+    broker.get_portfolio_total_equity.return_value = total_equity
+    broker.fee_model = fee_model
+    data_handler = Mock()
+    data_handler.get_assets_latest_prices.return_value = prices
+
+    order_sizer = DollarWeightedCashBufferedOrderSizer(
+        broker, "1234", data_handler, 0.05
+    )
+    result = order_sizer.size_weights(dt, assets, weights)
+
+    weight_dict = dict(zip(assets, weights.tolist()))
+    normalised_weights = order_sizer._normalise_weights(weight_dict)
+    expected = []
+    for asset, price in zip(assets, prices.tolist()):
+        pre_cost_dollar_weight = total_equity * (1.0 - 0.05) * normalised_weights[asset]
+        est_costs = fee_model.calc_total_cost(asset, 0.0, pre_cost_dollar_weight, broker=broker)
+        after_cost_dollar_weight = pre_cost_dollar_weight - est_costs
+        expected.append(int(np.floor(after_cost_dollar_weight / price)))
+    assert result.tolist() == expected
+    assert order_sizer(dt, weight_dict) == {
+        asset: {'quantity': quantity} for asset, quantity in zip(assets, expected)
+    }
+
+
+@pytest.mark.parametrize('price', [0.0, -10.0, np.inf])
+def test_size_weights_invalid_price_raises(price):
+    """
+    Checks that the size_weights method raises rather than sizing
+    a target quantity from a non-positive or non-finite price.
+    """
+    dt = pd.Timestamp('2019-01-01 15:00:00', tz=pytz.utc)
+    broker = Mock()
+    broker.get_portfolio_total_equity.return_value = 100000.0
+    broker.fee_model.calc_total_costs.side_effect = \
+        lambda assets, quantities, considerations, broker: np.zeros(len(assets))
+    data_handler = Mock()
+    data_handler.get_assets_latest_prices.return_value = np.array([100.0, price])
+
+    order_sizer = DollarWeightedCashBufferedOrderSizer(
+        broker, "1234", data_handler, 0.05
+    )
+    with pytest.raises(ValueError):
+        order_sizer.size_weights(dt, ['EQ:ABC', 'EQ:DEF'], np.array([0.5, 0.5]))
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytz
+
+from qstrader.portcon.order_sizer.order_sizer import OrderSizer
+
+
+SENTINEL_DT = pd.Timestamp('2019-01-01 15:00:00', tz=pytz.utc)
+
+
+class ScaledOrderSizer(OrderSizer):
+    """
+    Sizes each non-zero weight as a fractional quantity,
+    omitting zero-weight assets from the target portfolio.
+    """
+
+    def __call__(self, dt, weights):
+        return {
+            asset: {"quantity": weight * 10.5}
+            for asset, weight in weights.items() if weight != 0.0
+        }
+
+
+def test_size_weights_retains_fractional_quantities():
+    """
+    Checks that the default size_weights method retains the
+    fractional quantities sized by the '__call__' method.
+    """
+    order_sizer = ScaledOrderSizer()
+    result = order_sizer.size_weights(
+        SENTINEL_DT, ['EQ:A', 'EQ:C'], np.array([0.5, 0.3])
+    )
+    assert np.allclose(result, [5.25, 3.15])
+    assert np.issubdtype(result.dtype, np.floating)
+
+
+def test_size_weights_treats_omitted_assets_as_zero():
+    """
+    Checks that the default size_weights method sizes any asset
+    omitted by the '__call__' method as a zero quantity.
+    """
+    order_sizer = ScaledOrderSizer()
+    result = order_sizer.size_weights(
+        SENTINEL_DT, ['EQ:A', 'EQ:B', 'EQ:C'], np.array([0.5, 0.0, 0.3])
+    )
+    assert np.allclose(result, [5.25, 0.0, 3.15])
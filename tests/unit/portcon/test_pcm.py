@@ -1,10 +1,12 @@
 from unittest.mock import Mock
 
+import numpy as np
 import pandas as pd
 import pytest
 import pytz
 
 from qstrader.execution.order import Order
+from qstrader.portcon.order_sizer.order_sizer import OrderSizer
 from qstrader.portcon.pcm import PortfolioConstructionModel
 
 
@@ -12,43 +14,47 @@ SENTINEL_DT = pd.Timestamp('2019-01-01 15:00:00', tz=pytz.utc)
 
 
 @pytest.mark.parametrize(
-    'description,port_dict,uni_assets,expected',
+    'description,broker_assets,uni_assets,optimised_weights,expected',
     [
         (
-            'empty on both sides',
-            {}, [], []
+            'empty on all sides',
+            [], [], {}, []
         ),
         (
             'partially intersecting set of assets',
-            {
-                'EQ:ABC': 100,
-                'EQ:DEF': 250,
-                'EQ:GHI': 38
-            },
+            ['EQ:ABC', 'EQ:DEF', 'EQ:GHI'],
             ['EQ:123', 'EQ:GHI', 'EQ:ABC', 'EQ:567'],
+            {'EQ:ABC': 0.5, 'EQ:123': 0.5},
             ['EQ:123', 'EQ:567', 'EQ:ABC', 'EQ:DEF', 'EQ:GHI']
         ),
         (
             'non-intersecting set of assets',
-            {'EQ:ABC': 450, 'EQ:DEF': 210},
+            ['EQ:ABC', 'EQ:DEF'],
             ['EQ:567', 'EQ:123'],
+            {},
             ['EQ:123', 'EQ:567', 'EQ:ABC', 'EQ:DEF']
+        ),
+        (
+            'optimised weights referencing further assets',
+            ['EQ:DEF'],
+            ['EQ:ABC'],
+            {'EQ:XYZ': 0.25, 'EQ:ABC': 0.5, 'EQ:MNO': 0.25},
+            ['EQ:ABC', 'EQ:DEF', 'EQ:XYZ', 'EQ:MNO']
         )
     ]
 )
-def test_obtain_full_asset_list(description, port_dict, uni_assets, expected):
+def test_create_asset_index(
+    description, broker_assets, uni_assets, optimised_weights, expected
+):
     """
-    Tests the _obtain_full_asset_list method of the
+    Tests the _create_asset_index method of the
     PortfolioConstructionModel base class.
     """
     port_id = '1234'
 
     broker = Mock()
-    broker.get_portfolio_as_dict.return_value = port_dict
-
     universe = Mock()
     universe.get_assets.return_value = uni_assets
-
     order_sizer = Mock()
     optimiser = Mock()
 
@@ -56,28 +62,44 @@ def test_obtain_full_asset_list(description, port_dict, uni_assets, expected):
         broker, port_id, universe, order_sizer, optimiser
     )
 
-    result = pcm._obtain_full_asset_list(SENTINEL_DT)
+    result = pcm._create_asset_index(SENTINEL_DT, broker_assets, optimised_weights)
     assert result == expected
 
 
 @pytest.mark.parametrize(
-    'description,full_assets,expected',
+    'description,assets,optimised_weights,expected',
     [
         (
             'empty assets',
             [],
-            {}
+            {},
+            []
         ),
         (
-            'non-empty assets',
+            'no optimised weights',
             ['EQ:ABC', 'EQ:123', 'EQ:A1B2'],
-            {'EQ:ABC': 0.0, 'EQ:123': 0.0, 'EQ:A1B2': 0.0}
+            {},
+            [0.0, 0.0, 0.0]
+        ),
+        (
+            'partially-intersecting weights',
+            ['EQ:123', 'EQ:ABC', 'EQ:DEF', 'EQ:567', 'EQ:890'],
+            {'EQ:123': 0.25, 'EQ:567': 0.25, 'EQ:890': 0.5},
+            [0.25, 0.0, 0.0, 0.25, 0.5]
+        ),
+        (
+            'fully-intersecting weights',
+            ['EQ:123', 'EQ:ABC', 'EQ:DEF'],
+            {'EQ:ABC': 0.25, 'EQ:DEF': 0.25, 'EQ:123': 0.5},
+            [0.5, 0.25, 0.25]
         )
     ]
 )
-def test_create_zero_target_weight_vector(description, full_assets, expected):
+def test_create_target_weight_array(
+    description, assets, optimised_weights, expected
+):
     """
-    Tests the _create_zero_target_weight_vector method of the
+    Tests the _create_target_weight_array method of the
     PortfolioConstructionModel base class.
     """
     port_id = '1234'
@@ -91,45 +113,16 @@ def test_create_zero_target_weight_vector(description, full_assets, expected):
         broker, port_id, universe, order_sizer, optimiser
     )
 
-    result = pcm._create_zero_target_weight_vector(full_assets)
-    assert result == expected
+    result = pcm._create_target_weight_array(assets, optimised_weights)
+    assert result.dtype == np.float64
+    assert result.tolist() == expected
 
 
-@pytest.mark.parametrize(
-    'description,zero_weights,optimised_weights,expected',
-    [
-        (
-            'empty weights on both sides',
-            {},
-            {},
-            {}
-        ),
-        (
-            'non-intersecting weights',
-            {'EQ:ABC': 0.0, 'EQ:DEF': 0.0},
-            {'EQ:123': 0.5, 'EQ:567': 0.5},
-            {'EQ:ABC': 0.0, 'EQ:DEF': 0.0, 'EQ:123': 0.5, 'EQ:567': 0.5},
-        ),
-        (
-            'partially-intersecting weights',
-            {'EQ:ABC': 0.0, 'EQ:DEF': 0.0, 'EQ:123': 0.0},
-            {'EQ:123': 0.25, 'EQ:567': 0.25, 'EQ:890': 0.5},
-            {'EQ:ABC': 0.0, 'EQ:DEF': 0.0, 'EQ:123': 0.25, 'EQ:567': 0.25, 'EQ:890': 0.5},
-        ),
-        (
-            'fully-intersecting weights',
-            {'EQ:ABC': 0.0, 'EQ:DEF': 0.0, 'EQ:123': 0.0},
-            {'EQ:ABC': 0.25, 'EQ:DEF': 0.25, 'EQ:123': 0.5},
-            {'EQ:ABC': 0.25, 'EQ:DEF': 0.25, 'EQ:123': 0.5},
-        )
-    ]
-)
-def test_create_full_asset_weight_vector(
-    description, zero_weights, optimised_weights, expected
-):
+def test_align_current_quantities():
     """
-    Tests the _create_full_asset_weight_vector method of the
-    PortfolioConstructionModel base class.
+    Tests the _align_current_quantities method of the
+    PortfolioConstructionModel base class, with assets absent
+    from the Broker Portfolio aligned to integral zero quantities.
     """
     port_id = '1234'
 
@@ -142,8 +135,14 @@ def test_create_full_asset_weight_vector(
         broker, port_id, universe, order_sizer, optimiser
     )
 
-    result = pcm._create_full_asset_weight_vector(zero_weights, optimised_weights)
-    assert result == expected
+    quantities, integral = pcm._align_current_quantities(
+        ['EQ:ABC', 'EQ:DEF', 'EQ:GHI', 'EQ:XYZ'],
+        ['EQ:GHI', 'EQ:ABC'],
+        np.array([48.5, 100.0]),
+        np.array([False, True])
+    )
+    assert quantities.tolist() == [100.0, 0.0, 48.5, 0.0]
+    assert integral.tolist() == [True, True, False, True]
 
 
 @pytest.mark.parametrize(
@@ -157,13 +156,13 @@ def test_create_full_asset_weight_vector(
         ),
         (
             'non-empty equal portfolios on both sides - no orders',
-            {'EQ:ABC': {'quantity': 100}, 'EQ:DEF': {'quantity': 250}},
-            {'EQ:ABC': {'quantity': 100}, 'EQ:DEF': {'quantity': 250}},
+            {'EQ:ABC': 100, 'EQ:DEF': 250},
+            {'EQ:ABC': 100, 'EQ:DEF': 250},
             []
         ),
         (
             'non-empty target portfolio with empty current portfolio',
-            {'EQ:ABC': {'quantity': 100}, 'EQ:DEF': {'quantity': 250}},
+            {'EQ:ABC': 100, 'EQ:DEF': 250},
             {},
             [
                 Order(SENTINEL_DT, 'EQ:ABC', 100),
@@ -173,16 +172,16 @@ def test_create_full_asset_weight_vector(
         (
             'empty target portfolio with non-empty current portfolio',
             {},
-            {'EQ:ABC': {'quantity': 345}, 'EQ:DEF': {'quantity': 223}},
+            {'EQ:ABC': 345, 'EQ:DEF': 223},
             [
                 Order(SENTINEL_DT, 'EQ:ABC', -345),
-                Order(SENTINEL_DT, 'EQ:DEF', -250)
+                Order(SENTINEL_DT, 'EQ:DEF', -223)
             ]
         ),
         (
             'non-empty portfolios, non-intersecting symbols',
-            {'EQ:ABC': {'quantity': 123}, 'EQ:DEF': {'quantity': 456}},
-            {'EQ:GHI': {'quantity': 217}, 'EQ:JKL': {'quantity': 48}},
+            {'EQ:ABC': 123, 'EQ:DEF': 456},
+            {'EQ:GHI': 217, 'EQ:JKL': 48},
             [
                 Order(SENTINEL_DT, 'EQ:ABC', 123),
                 Order(SENTINEL_DT, 'EQ:DEF', 456),
@@ -192,8 +191,8 @@ def test_create_full_asset_weight_vector(
         ),
         (
             'non-empty portfolios, partially-intersecting symbols',
-            {'EQ:ABC': {'quantity': 123}, 'EQ:DEF': {'quantity': 456}},
-            {'EQ:DEF': {'quantity': 217}, 'EQ:GHI': {'quantity': 48}},
+            {'EQ:ABC': 123, 'EQ:DEF': 456},
+            {'EQ:DEF': 217, 'EQ:GHI': 48},
             [
                 Order(SENTINEL_DT, 'EQ:ABC', 123),
                 Order(SENTINEL_DT, 'EQ:DEF', 239),
@@ -202,8 +201,8 @@ def test_create_full_asset_weight_vector(
         ),
         (
             'non-empty portfolios, fully-intersecting symbols',
-            {'EQ:ABC': {'quantity': 123}, 'EQ:DEF': {'quantity': 456}},
-            {'EQ:ABC': {'quantity': 217}, 'EQ:DEF': {'quantity': 48}},
+            {'EQ:ABC': 123, 'EQ:DEF': 456},
+            {'EQ:ABC': 217, 'EQ:DEF': 48},
             [
                 Order(SENTINEL_DT, 'EQ:ABC', -94),
                 Order(SENTINEL_DT, 'EQ:DEF', 408)
@@ -211,11 +210,11 @@ def test_create_full_asset_weight_vector(
         )
     ]
 )
-def test_generate_rebalance_orders(
+def test_generate_rebalance_orders_from_arrays(
     helpers, description, target_portfolio, current_portfolio, expected
 ):
     """
-    Tests the _generate_rebalance_orders method of the
+    Tests the _generate_rebalance_orders_from_arrays method of the
     PortfolioConstructionModel base class.
     """
     port_id = '1234'
@@ -229,5 +228,108 @@ def test_generate_rebalance_orders(
         broker, port_id, universe, order_sizer, optimiser
     )
 
-    result = pcm._generate_rebalance_orders(SENTINEL_DT, target_portfolio, current_portfolio)
+    assets = sorted(set(target_portfolio).union(set(current_portfolio)))
+    target_quantities = np.array(
+        [target_portfolio.get(asset, 0) for asset in assets], dtype=np.int64
+    )
+    current_quantities = np.array(
+        [current_portfolio.get(asset, 0) for asset in assets], dtype=np.float64
+    )
+    current_integral = np.ones(len(assets), dtype=bool)
+
+    result = pcm._generate_rebalance_orders_from_arrays(
+        SENTINEL_DT, assets, target_quantities, current_quantities, current_integral
+    )
+    assert len(result) == len(expected)
     helpers.assert_order_lists_equal(result, expected)
+
+
+def test_call_rebalances_from_aligned_arrays():
+    """
+    Tests that the __call__ method of the PortfolioConstructionModel
+    sizes a weight vector aligned to the asset index, queries the
+    broker quantities once and creates Orders, sorted by asset, solely
+    for non-zero quantity changes, retaining the integer type of
+    quantities rebalanced from integer positions.
+    """
+    port_id = '1234'
+
+    broker = Mock()
+    broker.get_portfolio_quantities.return_value = (
+        ['EQ:GHI', 'EQ:ABC', 'EQ:JKL'],
+        np.array([48.0, 100.0, 20.0]),
+        np.array([True, True, False])
+    )
+    universe = Mock()
+    universe.get_assets.return_value = ['EQ:DEF', 'EQ:ABC']
+    optimiser = Mock()
+    optimiser.return_value = {'EQ:ABC': 0.5, 'EQ:DEF': 0.3, 'EQ:XYZ': 0.2}
+    order_sizer = Mock()
+    order_sizer.size_weights.side_effect = lambda dt, assets, weights: np.array(
+        [{'EQ:ABC': 100, 'EQ:DEF': 60, 'EQ:XYZ': 40}.get(asset, 0) for asset in assets]
+    )
+
+    pcm = PortfolioConstructionModel(
+        broker, port_id, universe, order_sizer, optimiser
+    )
+    result = pcm(SENTINEL_DT)
+
+    broker.get_portfolio_quantities.assert_called_once_with(port_id)
+    broker.get_portfolio_as_dict.assert_not_called()
+    (dt, assets, weights), _ = order_sizer.size_weights.call_args
+    assert assets == ['EQ:ABC', 'EQ:DEF', 'EQ:GHI', 'EQ:JKL', 'EQ:XYZ']
+    assert weights.tolist() == [0.5, 0.3, 0.0, 0.0, 0.2]
+
+    expected = [
+        Order(SENTINEL_DT, 'EQ:DEF', 60),
+        Order(SENTINEL_DT, 'EQ:GHI', -48),
+        Order(SENTINEL_DT, 'EQ:JKL', -20.0),
+        Order(SENTINEL_DT, 'EQ:XYZ', 40)
+    ]
+    assert len(result) == len(expected)
+    assert [type(order.quantity) for order in result] == [int, int, float, int]
+    for order_1, order_2 in zip(result, expected):
+        assert order_1._order_attribs_equal(order_2)
+
+
+def test_call_rebalances_with_call_only_order_sizer():
+    """
+    Tests that the __call__ method of the PortfolioConstructionModel
+    sizes the weights of an OrderSizer solely implementing '__call__',
+    retaining its fractional quantities and selling out any held
+    asset omitted from its target portfolio.
+    """
+    class FractionalOrderSizer(OrderSizer):
+        def __call__(self, dt, weights):
+            return {
+                asset: {'quantity': weight * 10.5}
+                for asset, weight in weights.items() if weight != 0.0
+            }
+
+    port_id = '1234'
+
+    broker = Mock()
+    broker.get_portfolio_quantities.return_value = (
+        ['EQ:ABC', 'EQ:GHI'],
+        np.array([2.0, 48.0]),
+        np.array([True, True])
+    )
+    universe = Mock()
+    universe.get_assets.return_value = ['EQ:ABC', 'EQ:DEF']
+    optimiser = Mock()
+    optimiser.return_value = {'EQ:ABC': 0.5, 'EQ:DEF': 0.3}
+
+    pcm = PortfolioConstructionModel(
+        broker, port_id, universe, FractionalOrderSizer(), optimiser
+    )
+    result = pcm(SENTINEL_DT)
+
+    expected = [
+        Order(SENTINEL_DT, 'EQ:ABC', 3.25),
+        Order(SENTINEL_DT, 'EQ:DEF', 3.15),
+        Order(SENTINEL_DT, 'EQ:GHI', -48.0)
+    ]
+    assert len(result) == len(expected)
+    for order_1, order_2 in zip(result, expected):
+        assert order_1.asset == order_2.asset
+        assert order_1.quantity == pytest.approx(order_2.quantity)
@@ -0,0 +1,111 @@
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.signals.buffer import AssetPriceBuffers
+from qstrader.signals.matrix_buffer import MatrixPriceBuffers
+from qstrader.signals.sma import SMASignal
+
+
+def test_matrix_buffers_match_deque_buffers():
+    """
+    Checks that the matrix ring buffer produces the same windows and
+    statistics as the deque buffers, including for an asset added
+    part-way through and for missing prices.
+    """
+    rng = np.random.default_rng(7)
+    lookbacks = [3, 10]
+    assets = ['EQ:ABC', 'EQ:DEF']
+    deque_buffers = AssetPriceBuffers(list(assets), lookbacks=lookbacks)
+    matrix_buffers = MatrixPriceBuffers(list(assets), lookbacks=lookbacks)
+
+    for i in range(40):
+        if i == 15:
+            assets = assets + ['EQ:GHI']
+        prices = 50.0 * np.exp(rng.normal(scale=0.05, size=len(assets)))
+        if i == 20:
+            prices[0] = np.nan
+        for asset, price in zip(assets, prices):
+            deque_buffers.append(asset, price)
+        matrix_buffers.append_all(assets, prices)
+
+        for lookback in lookbacks:
+            np.testing.assert_allclose(
+                matrix_buffers.means(lookback, assets),
+                [deque_buffers.mean(asset, lookback) for asset in assets]
+            )
+            np.testing.assert_allclose(
+                matrix_buffers.cumulative_returns(lookback, assets),
+                [deque_buffers.cumulative_return(asset, lookback) for asset in assets],
+                atol=1e-12
+            )
+            np.testing.assert_allclose(
+                matrix_buffers.return_stds(lookback, assets),
+                [deque_buffers.return_std(asset, lookback) for asset in assets],
+                atol=1e-12
+            )
+            for asset in assets:
+                np.testing.assert_array_equal(
+                    matrix_buffers.window(asset, lookback),
+                    list(deque_buffers.prices['%s_%s' % (asset, lookback)])
+                )
+
+
+def test_matrix_buffers_windows_are_views():
+    """
+    Checks that windows and aligned cross-sectional windows
+    are views into the ring buffer.
+    """
+    buffers = MatrixPriceBuffers(['EQ:ABC', 'EQ:DEF'], lookbacks=[2, 4])
+    for price in [1.0, 2.0, 3.0, 4.0, 5.0]:
+        buffers.append_all(['EQ:ABC', 'EQ:DEF'], [price, 10.0 * price])
+
+    window = buffers.window('EQ:DEF', 4)
+    np.testing.assert_array_equal(window, [20.0, 30.0, 40.0, 50.0])
+    assert np.shares_memory(window, buffers.values)
+
+    prices, sizes = buffers._windows(2, None)
+    np.testing.assert_array_equal(prices, [[4.0, 5.0], [40.0, 50.0]])
+    np.testing.assert_array_equal(sizes, [2, 2])
+    assert np.shares_memory(prices, buffers.values)
+
+
+def test_matrix_buffers_empty_asset():
+    """
+    Checks the statistics of an asset without any prices.
+    """
+    buffers = MatrixPriceBuffers(['EQ:ABC'], lookbacks=[5])
+    assert len(buffers.window('EQ:ABC', 5)) == 0
+    assert np.isnan(buffers.mean('EQ:ABC', 5))
+    assert buffers.cumulative_return('EQ:ABC', 5) == 0.0
+    assert buffers.return_std('EQ:ABC', 5) == 0.0
+
+
+def test_matrix_buffers_errors():
+    """
+    Checks that adding an existing asset, appending a non-positive
+    price and requesting too long a lookback raise ValueError.
+    """
+    buffers = MatrixPriceBuffers(['EQ:ABC'], lookbacks=[5])
+    with pytest.raises(ValueError):
+        buffers.add_asset('EQ:ABC')
+    with pytest.raises(ValueError):
+        buffers.append_all(['EQ:ABC', 'EQ:DEF'], [10.0, -1.0])
+    with pytest.raises(ValueError):
+        buffers.means(6)
+
+
+def test_unknown_buffer_type():
+    """
+    Checks that an unknown price buffer type raises ValueError.
+    """
+    universe = Mock()
+    universe.get_assets.return_value = ['EQ:SPY']
+    with pytest.raises(ValueError):
+        SMASignal(
+            pd.Timestamp('2019-01-01 14:30:00', tz=pytz.utc), universe, [5],
+            buffer_type='array'
+        )
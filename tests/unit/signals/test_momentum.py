@@ -8,6 +8,7 @@ import pytz
 from qstrader.signals.momentum import MomentumSignal
 
 
+@pytest.mark.parametrize('buffer_type', ['deque', 'matrix'])
 @pytest.mark.parametrize(
     'start_dt,lookbacks,prices,expected',
     [
@@ -23,7 +24,7 @@ from qstrader.signals.momentum import MomentumSignal
         )
     ]
 )
-def test_momentum_signal(start_dt, lookbacks, prices, expected):
+def test_momentum_signal(start_dt, lookbacks, prices, expected, buffer_type):
     """
     Checks that the momentum signal correctly calculates the
     holding period return based momentum for various lookbacks.
@@ -31,7 +32,7 @@ def test_momentum_signal(start_dt, lookbacks, prices, expected):
     universe = Mock()
     universe.get_assets.return_value = ['EQ:SPY']
 
-    mom = MomentumSignal(start_dt, universe, lookbacks)
+    mom = MomentumSignal(start_dt, universe, lookbacks, buffer_type=buffer_type)
     for price_idx in range(len(prices)):
         mom.append('EQ:SPY', prices[price_idx])
 
@@ -0,0 +1,125 @@
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.signals.momentum import MomentumSignal
+from qstrader.signals.precomputed import PrecomputedPrices
+from qstrader.signals.signals_collection import SignalsCollection
+from qstrader.signals.sma import SMASignal
+from qstrader.signals.vol import VolatilitySignal
+
+
+def _create_signals(dts, prices, offline):
+    """
+    Creates momentum, volatility and SMA signals across a universe
+    to which an asset is added part-way through the updates.
+    """
+    late_dt = dts[10]
+    universe = Mock()
+    universe.get_assets.side_effect = lambda dt: (
+        ['EQ:ABC', 'EQ:DEF', 'EQ:GHI'] if dt >= late_dt else ['EQ:ABC', 'EQ:DEF']
+    )
+    sma_universe = Mock()
+    sma_universe.get_assets.return_value = ['EQ:DEF', 'EQ:JKL']
+
+    data_handler = Mock()
+    data_handler.get_assets_latest_prices.side_effect = (
+        lambda dt, assets, side: np.array([prices[dt][asset] for asset in assets])
+    )
+    return SignalsCollection(
+        {
+            'momentum': MomentumSignal(dts[0], universe, [3, 12]),
+            'vol': VolatilitySignal(dts[0], universe, [3, 12]),
+            'sma': SMASignal(dts[0], sma_universe, [4, 10])
+        },
+        data_handler,
+        offline=offline
+    )
+
+
+def test_precomputed_signals_match_incremental_signals():
+    """
+    Checks that the precomputed signal values match those of the
+    incrementally updated signals after every update, including
+    during warm up, for a late entering asset and for missing prices.
+    """
+    dts = list(pd.bdate_range('2020-01-01', periods=60, tz=pytz.UTC))
+    rng = np.random.default_rng(5)
+    assets = ['EQ:ABC', 'EQ:DEF', 'EQ:GHI', 'EQ:JKL']
+    price_matrix = 100.0 * np.exp(np.cumsum(rng.normal(scale=0.02, size=(len(dts), 4)), axis=0))
+    price_matrix[20, 0] = np.nan
+    price_matrix[:15, 2] = np.nan
+    prices = {dt: dict(zip(assets, row)) for dt, row in zip(dts, price_matrix)}
+
+    incremental = _create_signals(dts, prices, offline=False)
+    offline = _create_signals(dts, prices, offline=True)
+    offline.precompute(dts)
+
+    for dt in [None] + dts:
+        if dt is not None:
+            incremental.update(dt)
+            offline.update(dt)
+        assert offline.warmup == incremental.warmup
+        for name, lookbacks in [('momentum', [3, 12]), ('vol', [3, 12]), ('sma', [4, 10])]:
+            assert offline[name].assets == incremental[name].assets
+            for lookback in lookbacks:
+                np.testing.assert_allclose(
+                    offline.compute_all(name, lookback),
+                    incremental.compute_all(name, lookback),
+                    rtol=1e-10, atol=1e-12
+                )
+                for asset in incremental[name].assets:
+                    np.testing.assert_allclose(
+                        offline[name](asset, lookback),
+                        incremental[name](asset, lookback),
+                        rtol=1e-10, atol=1e-12
+                    )
+
+    # Prices are solely obtained upfront for offline signals
+    assert offline.data_handler.get_assets_latest_prices.call_count == len(dts)
+
+
+def test_precomputed_prices_warm_up():
+    """
+    Checks the precomputed statistics of an asset entering
+    at the second update.
+    """
+    prices = PrecomputedPrices(
+        ['EQ:ABC', 'EQ:DEF'],
+        np.array([[10.0, 5.0], [11.0, 6.0], [12.1, 7.0], [13.31, 8.0]]),
+        [0, 1]
+    )
+    np.testing.assert_allclose(
+        prices.means(2),
+        [[np.nan, np.nan], [10.0, np.nan], [10.5, 6.0], [11.55, 6.5], [12.705, 7.5]]
+    )
+    np.testing.assert_allclose(
+        prices.cumulative_returns(3),
+        [[0.0, 0.0], [0.0, 0.0], [0.1, 0.0], [0.21, 1.0 / 6.0], [0.21, 1.0 / 3.0]]
+    )
+    np.testing.assert_allclose(
+        prices.return_stds(3),
+        [[0.0, 0.0], [0.0, 0.0], [0.0, 0.0], [0.0, 0.0], [0.0, (1.0 / 6.0 - 1.0 / 7.0) / 2.0]],
+        atol=1e-12
+    )
+
+
+def test_precomputed_errors():
+    """
+    Checks that non-positive prices and updating offline signals
+    that have not been precomputed raise ValueError.
+    """
+    with pytest.raises(ValueError):
+        PrecomputedPrices(['EQ:ABC'], np.array([[10.0], [-1.0]]), [0])
+
+    start_dt = pd.Timestamp('2020-01-01 21:00:00', tz=pytz.UTC)
+    universe = Mock()
+    universe.get_assets.return_value = ['EQ:ABC']
+    signals = SignalsCollection(
+        {'sma': SMASignal(start_dt, universe, [5])}, Mock(), offline=True
+    )
+    with pytest.raises(ValueError):
+        signals.update(start_dt)
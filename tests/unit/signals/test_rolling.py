@@ -0,0 +1,81 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from qstrader.signals.rolling import RollingWindow
+
+
+def _expected_statistics(prices):
+    returns = pd.Series(prices).pct_change().dropna().to_numpy()
+    if len(returns) < 1:
+        cum_return = 0.0
+        std = 0.0
+    else:
+        cum_return = (np.cumprod(1.0 + returns) - 1.0)[-1]
+        std = np.std(returns)
+    mean = np.mean(prices) if len(prices) > 0 else np.nan
+    return mean, cum_return, std
+
+
+@pytest.mark.parametrize('maxlen', [1, 2, 7, 13])
+@pytest.mark.parametrize('nan_prob', [0.0, 0.1])
+def test_rolling_window_matches_recomputation(maxlen, nan_prob):
+    """
+    Checks that the incrementally maintained mean, cumulative return
+    and volatility of returns match those recomputed from the buffered
+    prices after every append, including periodic resyncs and
+    missing prices.
+    """
+    rng = np.random.default_rng(42)
+    prices = 100.0 * np.exp(np.cumsum(rng.normal(scale=0.02, size=1200)))
+    prices[rng.random(size=len(prices)) < nan_prob] = np.nan
+
+    window = RollingWindow(maxlen=maxlen)
+    for i, price in enumerate(prices):
+        window.append(price)
+        buffered = prices[max(i + 1 - maxlen, 0):i + 1]
+        assert list(window) == pytest.approx(list(buffered), nan_ok=True)
+
+        mean, cum_return, std = _expected_statistics(buffered)
+        assert np.isclose(window.mean(), mean, equal_nan=True)
+        assert np.isclose(window.cumulative_return(), cum_return)
+        assert np.isclose(window.return_std(), std)
+
+
+def test_rolling_window_empty_and_clear():
+    """
+    Checks the statistics of an empty window and that clearing
+    the window resets its statistics.
+    """
+    window = RollingWindow([10.0, 11.0, 12.1], maxlen=3)
+    assert np.isclose(window.cumulative_return(), 0.21)
+
+    window.clear()
+    assert len(window) == 0
+    assert np.isnan(window.mean())
+    assert window.cumulative_return() == 0.0
+    assert window.return_std() == 0.0
+
+    window.append(5.0)
+    assert window.mean() == 5.0
+    assert window.cumulative_return() == 0.0
+
+
+def test_rolling_window_pickle():
+    """
+    Checks that a pickled window retains its prices, length and
+    statistics, and continues to update correctly.
+    """
+    window = RollingWindow([10.0, 11.0, 9.5, 10.5], maxlen=3)
+    unpickled = pickle.loads(pickle.dumps(window))
+
+    assert list(unpickled) == list(window)
+    assert unpickled.maxlen == 3
+    assert unpickled.mean() == window.mean()
+    assert unpickled.return_std() == window.return_std()
+
+    window.append(12.0)
+    unpickled.append(12.0)
+    assert unpickled.cumulative_return() == window.cumulative_return()
@@ -0,0 +1,147 @@
+import operator
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.signals.momentum import MomentumSignal
+from qstrader.signals.signals_collection import SignalsCollection
+from qstrader.signals.sma import SMASignal
+from qstrader.signals.vol import VolatilitySignal
+
+
+def _create_signals(buffer_type, n_assets=50, n_prices=30):
+    start_dt = pd.Timestamp('2019-01-01 14:30:00', tz=pytz.utc)
+    assets = ['EQ:%03d' % i for i in range(n_assets)]
+    universe = Mock()
+    universe.get_assets.return_value = assets
+    signals = {
+        'momentum': MomentumSignal(start_dt, universe, [5, 20], buffer_type=buffer_type),
+        'vol': VolatilitySignal(start_dt, universe, [5, 20], buffer_type=buffer_type),
+        'sma': SMASignal(start_dt, universe, [5, 20], buffer_type=buffer_type)
+    }
+    rng = np.random.default_rng(3)
+    for _ in range(n_prices):
+        prices = 100.0 * np.exp(rng.normal(scale=0.02, size=n_assets))
+        for signal in signals.values():
+            for asset, price in zip(assets, prices):
+                signal.append(asset, price)
+    return SignalsCollection(signals, Mock())
+
+
+@pytest.mark.parametrize('buffer_type', ['deque', 'matrix'])
+@pytest.mark.parametrize('name', ['momentum', 'vol', 'sma'])
+@pytest.mark.parametrize('lookback', [5, 20])
+def test_compute_all_matches_per_asset_signal(buffer_type, name, lookback):
+    """
+    Checks that the vectorised signal calculation for all assets
+    matches the signal calculated separately for each asset.
+    """
+    signals = _create_signals(buffer_type)
+    signal = signals[name]
+    np.testing.assert_allclose(
+        signals.compute_all(name, lookback),
+        [signal(asset, lookback) for asset in signal.assets],
+        rtol=1e-12
+    )
+
+
+@pytest.mark.parametrize('buffer_type', ['deque', 'matrix'])
+@pytest.mark.parametrize('n', [0, 1, 3, 50, 60])
+def test_top_n_matches_sorted(buffer_type, n):
+    """
+    Checks that the top N assets match those obtained by
+    sorting the per-asset signal values in Python.
+    """
+    signals = _create_signals(buffer_type)
+    signal = signals['momentum']
+    all_momenta = {asset: signal(asset, 20) for asset in signal.assets}
+    expected = [
+        asset[0] for asset in sorted(
+            all_momenta.items(), key=operator.itemgetter(1), reverse=True
+        )
+    ][:n]
+    assert signals.top_n('momentum', 20, n) == expected
+
+
+@pytest.mark.parametrize(
+    'values,n,ascending,expected',
+    [
+        ([1.0, 3.0, 2.0, 3.0, 0.5], 2, False, [1, 3]),
+        ([1.0, 3.0, 2.0, 3.0, 0.5], 3, True, [4, 0, 2]),
+        ([2.0, 2.0, 2.0, 1.0], 2, False, [0, 1]),
+        ([np.nan, 1.0, 2.0], 3, False, [2, 1, 0]),
+        ([np.nan, 1.0, 2.0], 3, True, [1, 2, 0]),
+        ([], 2, False, [])
+    ]
+)
+def test_ordered_indices(values, n, ascending, expected):
+    """
+    Checks that ties are ordered by index and NaN values last.
+    """
+    np.testing.assert_array_equal(
+        SignalsCollection._ordered_indices(np.array(values), n, ascending=ascending),
+        expected
+    )
+
+
+def test_rank():
+    """
+    Checks that the signal ranks are ordered as the assets.
+    """
+    signals = SignalsCollection({'mom': Mock()}, Mock())
+    signals['mom'].assets = ['EQ:ABC', 'EQ:DEF', 'EQ:GHI', 'EQ:JKL']
+    signals['mom'].compute_all.return_value = np.array([0.1, -0.2, 0.3, 0.1])
+
+    np.testing.assert_array_equal(signals.rank('mom', 12), [2, 4, 1, 3])
+    np.testing.assert_array_equal(signals.rank('mom', 12, ascending=True), [2, 1, 4, 3])
+    assert signals.top_n('mom', 12, 2) == ['EQ:GHI', 'EQ:ABC']
+    signals['mom'].compute_all.assert_called_with(12)
+
+
+@pytest.mark.parametrize('buffer_type', ['deque', 'matrix'])
+def test_update_fetches_single_price_snapshot(buffer_type):
+    """
+    Checks that each update obtains the prices of the union of all
+    signal assets in a single call, including assets subsequently
+    added to a signal's universe, and appends each signal's prices.
+    """
+    start_dt = pd.Timestamp('2019-01-01 14:30:00', tz=pytz.utc)
+    mom_universe = Mock()
+    mom_universe.get_assets.return_value = ['EQ:ABC', 'EQ:DEF']
+    sma_universe = Mock()
+    sma_universe.get_assets.return_value = ['EQ:DEF', 'EQ:GHI']
+
+    all_prices = {'EQ:ABC': 10.0, 'EQ:DEF': 20.0, 'EQ:GHI': 30.0, 'EQ:JKL': 40.0}
+    data_handler = Mock()
+    data_handler.get_assets_latest_prices.side_effect = (
+        lambda dt, assets, side: np.array([all_prices[asset] for asset in assets])
+    )
+
+    signals = SignalsCollection(
+        {
+            'momentum': MomentumSignal(start_dt, mom_universe, [3], buffer_type=buffer_type),
+            'sma': SMASignal(start_dt, sma_universe, [3], buffer_type=buffer_type)
+        },
+        data_handler
+    )
+    signals.update(start_dt)
+    data_handler.get_assets_latest_prices.assert_called_once_with(
+        start_dt, ['EQ:ABC', 'EQ:DEF', 'EQ:GHI'], side='mid'
+    )
+
+    all_prices = {asset: 1.1 * price for asset, price in all_prices.items()}
+    sma_universe.get_assets.return_value = ['EQ:DEF', 'EQ:GHI', 'EQ:JKL']
+    signals.update(start_dt)
+    assert data_handler.get_assets_latest_prices.call_count == 2
+    data_handler.get_assets_latest_prices.assert_called_with(
+        start_dt, ['EQ:ABC', 'EQ:DEF', 'EQ:GHI', 'EQ:JKL'], side='mid'
+    )
+
+    assert signals.warmup == 2
+    assert np.isclose(signals['momentum']('EQ:ABC', 3), 0.1)
+    assert np.isclose(signals['momentum']('EQ:DEF', 3), 0.1)
+    assert np.isclose(signals['sma']('EQ:GHI', 3), 31.5)
+    assert np.isclose(signals['sma']('EQ:JKL', 3), 44.0)
@@ -8,6 +8,7 @@ import pytz
 from qstrader.signals.sma import SMASignal
 
 
+@pytest.mark.parametrize('buffer_type', ['deque', 'matrix'])
 @pytest.mark.parametrize(
     'start_dt,lookbacks,prices,expected',
     [
@@ -23,7 +24,7 @@ from qstrader.signals.sma import SMASignal
         )
     ]
 )
-def test_sma_signal(start_dt, lookbacks, prices, expected):
+def test_sma_signal(start_dt, lookbacks, prices, expected, buffer_type):
     """
     Checks that the SMA signal correctly calculates the
     simple moving average for various lookbacks.
@@ -31,7 +32,7 @@ def test_sma_signal(start_dt, lookbacks, prices, expected):
     universe = Mock()
     universe.get_assets.return_value = ['EQ:SPY']
 
-    sma = SMASignal(start_dt, universe, lookbacks)
+    sma = SMASignal(start_dt, universe, lookbacks, buffer_type=buffer_type)
     for price_idx in range(len(prices)):
         sma.append('EQ:SPY', prices[price_idx])
 
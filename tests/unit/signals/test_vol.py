@@ -0,0 +1,40 @@
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.signals.vol import VolatilitySignal
+
+
+@pytest.mark.parametrize('buffer_type', ['deque', 'matrix'])
+@pytest.mark.parametrize(
+    'start_dt,lookbacks,prices,expected',
+    [
+        (
+            pd.Timestamp('2019-01-01 14:30:00', tz=pytz.utc),
+            [6, 12],
+            [
+                99.34, 101.87, 98.32, 92.98, 103.87,
+                104.51, 97.62, 95.22, 96.09, 100.34,
+                105.14, 107.49, 90.23, 89.43, 87.68
+            ],
+            [1.1236601626188572, 1.0459763553295853]
+        )
+    ]
+)
+def test_vol_signal(start_dt, lookbacks, prices, expected, buffer_type):
+    """
+    Checks that the volatility signal correctly calculates the
+    annualised volatility of returns for various lookbacks.
+    """
+    universe = Mock()
+    universe.get_assets.return_value = ['EQ:SPY']
+
+    vol = VolatilitySignal(start_dt, universe, lookbacks, buffer_type=buffer_type)
+    for price_idx in range(len(prices)):
+        vol.append('EQ:SPY', prices[price_idx])
+
+    for i, lookback in enumerate(lookbacks):
+        assert np.isclose(vol('EQ:SPY', lookback), expected[i])
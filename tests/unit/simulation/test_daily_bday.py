@@ -67,3 +67,27 @@ def test_daily_rebalance(
         calculated_event = sim_events[0]
         expected_event = SimulationEvent(pd.Timestamp(sim_events[1][0], tz=pytz.UTC), sim_events[1][1])
         assert calculated_event == expected_event
+
+
+@pytest.mark.parametrize(
+    "starting_day,ending_day,pre_market,post_market",
+    [
+        ('2020-01-01', '2020-03-31', True, True),
+        ('2020-01-01 14:30:00', '2020-03-31 14:30:00', False, False),
+        ('2020-01-04', '2020-01-05', False, True)
+    ]
+)
+def test_event_times(starting_day, ending_day, pre_market, post_market):
+    """
+    Checks that the vectorised event times match the timestamps and
+    event types of the generated SimulationEvents.
+    """
+    sd = pd.Timestamp(starting_day, tz=pytz.UTC)
+    ed = pd.Timestamp(ending_day, tz=pytz.UTC)
+
+    sim_engine = DailyBusinessDaySimulationEngine(sd, ed, pre_market, post_market)
+    timestamps, event_types = sim_engine.event_times()
+    events = list(sim_engine)
+
+    assert list(timestamps) == [event.ts.value for event in events]
+    assert list(event_types) == [event.event_type for event in events]
@@ -41,3 +41,13 @@ def test_sim_event_eq(
     compare_event = SimulationEvent(pd.Timestamp(compare_event_params[0], tz=pytz.UTC), compare_event_params[1])
 
     assert expected_result == (sim_event == compare_event)
+
+
+def test_sim_event_has_no_instance_dict():
+    """
+    Checks that SimulationEvents are lightweight slotted objects.
+    """
+    event = SimulationEvent(pd.Timestamp('2020-01-01 14:30:00', tz=pytz.UTC), 'market_open')
+    assert not hasattr(event, '__dict__')
+    with pytest.raises(AttributeError):
+        event.other = 1
@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+import pytest
+import pytz
+
+from qstrader.simulation.daily_bday import DailyBusinessDaySimulationEngine
+from qstrader.simulation.timeline import SimulationTimeline
+
+
+@pytest.mark.parametrize(
+    "burn_in_dt,expected_rebalances,expected_snapshots",
+    [
+        (
+            None,
+            ['2020-01-01 14:30:00', '2020-01-03 21:00:00'],
+            ['2020-01-01 21:00:00', '2020-01-02 21:00:00', '2020-01-03 21:00:00']
+        ),
+        (
+            pd.Timestamp('2020-01-02 00:00:00', tz=pytz.UTC),
+            ['2020-01-03 21:00:00'],
+            ['2020-01-02 21:00:00', '2020-01-03 21:00:00']
+        )
+    ]
+)
+def test_timeline_from_events(burn_in_dt, expected_rebalances, expected_snapshots):
+    """
+    Checks that the simulation events are correctly merged with the
+    rebalance schedule, signal updates and equity snapshots, taking
+    into account the burn in date.
+    """
+    sim_engine = DailyBusinessDaySimulationEngine(
+        pd.Timestamp('2020-01-01', tz=pytz.UTC),
+        pd.Timestamp('2020-01-03', tz=pytz.UTC)
+    )
+    rebalance_times = [
+        pd.Timestamp('2020-01-01 14:30:00', tz=pytz.UTC),
+        pd.Timestamp('2020-01-02 12:00:00', tz=pytz.UTC),
+        pd.Timestamp('2020-01-03 21:00:00', tz=pytz.UTC)
+    ]
+    timeline = SimulationTimeline.from_events(
+        sim_engine, rebalance_times, burn_in_dt=burn_in_dt
+    )
+    events = list(sim_engine)
+
+    assert len(timeline) == len(events) == 12
+    np.testing.assert_array_equal(
+        timeline.timestamps, [event.ts.value for event in events]
+    )
+
+    rebalances = []
+    signal_updates = []
+    snapshots = []
+    for event, rebalance, signal_update, equity_snapshot in timeline:
+        if rebalance:
+            rebalances.append(event.ts)
+        if signal_update:
+            signal_updates.append(event.ts)
+        if equity_snapshot:
+            snapshots.append(event.ts)
+
+    assert rebalances == [pd.Timestamp(ts, tz=pytz.UTC) for ts in expected_rebalances]
+    assert snapshots == [pd.Timestamp(ts, tz=pytz.UTC) for ts in expected_snapshots]
+    assert signal_updates == [
+        event.ts for event in events if event.event_type == 'market_close'
+    ]
+
+
+def test_timeline_without_rebalances():
+    """
+    Checks that an empty rebalance schedule produces no rebalances.
+    """
+    sim_engine = DailyBusinessDaySimulationEngine(
+        pd.Timestamp('2020-01-01', tz=pytz.UTC),
+        pd.Timestamp('2020-01-03', tz=pytz.UTC)
+    )
+    timeline = SimulationTimeline.from_events(sim_engine, [])
+    assert not timeline.rebalance.any()
+
+
+def test_timeline_from_engine_matches_from_event_list():
+    """
+    Checks that a timeline merged using the vectorised event times of
+    a simulation engine matches one merged from its list of events.
+    """
+    sim_engine = DailyBusinessDaySimulationEngine(
+        pd.Timestamp('2020-01-01', tz=pytz.UTC),
+        pd.Timestamp('2020-03-31', tz=pytz.UTC),
+        pre_market=False
+    )
+    rebalance_times = [
+        pd.Timestamp('2020-01-31 21:00:00', tz=pytz.UTC),
+        pd.Timestamp('2020-02-28 21:00:00', tz=pytz.UTC)
+    ]
+    burn_in_dt = pd.Timestamp('2020-02-03 14:30:00', tz=pytz.UTC)
+    engine_timeline = SimulationTimeline.from_events(
+        sim_engine, rebalance_times, burn_in_dt=burn_in_dt
+    )
+    list_timeline = SimulationTimeline.from_events(
+        list(sim_engine), rebalance_times, burn_in_dt=burn_in_dt
+    )
+    assert engine_timeline.events == list_timeline.events
+    for name in ('timestamps', 'rebalance', 'signal_update', 'equity_snapshot'):
+        np.testing.assert_array_equal(
+            getattr(engine_timeline, name), getattr(list_timeline, name)
+        )